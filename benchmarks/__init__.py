@@ -0,0 +1,2 @@
+# benchmarks for tg_gui and tg_gui_core
+# run from the repository root, ex: `python -m benchmarks.widget_init`
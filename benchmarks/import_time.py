@@ -0,0 +1,73 @@
+"""
+Measures how long `import tg_gui.all` and `from tg_gui.all import *` take in a fresh
+interpreter, using `-X importtime`, and fails (exit status 1) when either is over budget
+or loads a native toolkit, ex:
+```
+python -m benchmarks.import_time --budget-ms 40
+```
+The platform widgets are imported lazily (see `tg_gui.all`), so only scripts that use
+them pay for PySide6.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+# modules importing tg_gui.all must not load
+_FORBIDDEN = ("PySide6", "shiboken6", "displayio", "terminalio")
+
+
+def import_times(statement: str, repeat: int = 5) -> dict[str, int]:
+    """
+    :return: the cumulative import time of each module `statement` imports, in
+        microseconds, the fastest of `repeat` fresh interpreters
+    """
+    best: dict[str, int] = {}
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        for line in output.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            _, cumulative, name = line[len("import time:") :].split("|")
+            name = name.strip()
+            best[name] = min(int(cumulative), best.get(name, int(cumulative)))
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks.import_time", description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=40.0)
+    parser.add_argument("--module", default="tg_gui.all")
+    parser.add_argument("--top", type=int, default=10, help="list the slowest modules")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for statement in (f"import {args.module}", f"from {args.module} import *"):
+        times = import_times(statement)
+        # anything the statement loads after the module itself (ex a lazy attribute)
+        # is not part of the module's cumulative time, but is caught below
+        total = times[args.module] / 1000
+        print(f"--- {statement}")
+        for name, micros in sorted(times.items(), key=lambda item: -item[1])[: args.top]:
+            print(f"{micros / 1000:8.2f} ms  {name}")
+        print(f"{statement}: {total:.2f} ms (budget {args.budget_ms:.2f} ms)")
+
+        loaded = [name for name in times if name.split(".")[0] in _FORBIDDEN]
+        if loaded:
+            print(f"FAIL: {statement} loaded {', '.join(sorted(loaded))}")
+            failed = True
+        if total > args.budget_ms:
+            print(f"FAIL: over budget by {total - args.budget_ms:.2f} ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
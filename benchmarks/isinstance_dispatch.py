@@ -0,0 +1,88 @@
+"""
+Compares the CircuitPython `isinstance` replacement before and after caching how each
+classinfo is checked, against the builtin. Runs on CPython and on the MicroPython /
+CircuitPython unix port, from the repository root, ex:
+```
+micropython benchmarks/isinstance_dispatch.py
+python -m benchmarks.isinstance_dispatch
+```
+"""
+import sys
+
+# imported on its own, the tg_gui_core package does not import on micropython
+sys.path.insert(0, "tg_gui_core")
+import _isinstance_dispatch as dispatch
+
+try:
+    from time import ticks_us, ticks_diff  # type: ignore[attr-defined]
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(end, start):
+        return end - start
+
+
+_orig_isinstance = dispatch._orig_isinstance
+
+
+def uncached_isinstance(obj, classinfo):
+    # the replacement as it was, re-planning the classinfo on every call
+    classinfo = classinfo if _orig_isinstance(classinfo, tuple) else (classinfo,)
+    return any(
+        _orig_isinstance(obj, cls)
+        if cls.__class__ is type
+        else (
+            hasattr(cls, "_inst_isinstance_check_")
+            and cls._inst_isinstance_check_(obj)
+        )
+        for cls in classinfo
+    )
+
+
+class State:
+    pass
+
+
+class Other:
+    pass
+
+
+class Color(int, dispatch.IsinstanceBase):
+    @classmethod
+    def _inst_isinstance_check_(cls, instance):
+        return _orig_isinstance(instance, int) and 0 <= instance <= 0xFFFFFF
+
+
+CASES = (
+    ("plain type, hit", State(), State),
+    ("plain type, miss", "text", State),
+    ("tuple of types", 1.5, (State, Other, float)),
+    ("duck-typed class", 0x808080, Color),
+)
+
+
+def per_call_ns(fn, obj, classinfo, number):
+    start = ticks_us()
+    for _ in range(number):
+        fn(obj, classinfo)
+    return ticks_diff(ticks_us(), start) * 1000 // number
+
+
+def main(number=20000):
+    print("{:<20} {:>10} {:>10} {:>10}".format("", "builtin", "uncached", "cached"))
+    for name, obj, classinfo in CASES:
+        builtin = (
+            "-"
+            if classinfo is Color
+            else per_call_ns(_orig_isinstance, obj, classinfo, number)
+        )
+        before = per_call_ns(uncached_isinstance, obj, classinfo, number)
+        after = per_call_ns(dispatch.isinstance_cp_compat, obj, classinfo, number)
+        print("{:<20} {:>10} {:>10} {:>10}  ns/call".format(name, builtin, before, after))
+
+
+if __name__ == "__main__":
+    main()
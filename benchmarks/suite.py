@@ -0,0 +1,394 @@
+"""
+The benchmark suite: times widget class creation, widget init, `State.update` fan-out
+and the build / place / move / demolish lifecycle over trees of different sizes and
+depths, and writes the results as JSON, ex:
+```
+python -m benchmarks.suite --json results.json --baseline benchmarks/baseline.json
+```
+Core scenarios run on the headless platform, which also counts the native ops (and
+their weighted cost, see `Recorder`) each lifecycle scenario performs. Qt scenarios
+run when PySide6 is installed, under the offscreen QPA plugin.
+
+With `--baseline` the run fails (exit status 1) when a scenario is more than
+`--threshold` slower than the baseline (1.0, twice as slow, by default), or performs
+more native ops than it did. `--update-baseline` rewrites the baseline from this run
+instead. Timings only compare on the machine the baseline was recorded on.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+    _Scenario = Callable[[bool], "Result"]
+
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+
+from tg_gui_core import (
+    Widget,
+    WidgetAttr,
+    ContainerWidget,
+    ReadOnlyAttr,
+    ColumnLayout,
+    widget,
+)
+from tg_gui_core.attrs import _widget_init_attrs
+from tg_gui.stateful import State
+
+from tg_gui._platform_headless_.backend import HeadlessBackend, Screen
+from tg_gui._platform_headless_.shared import Recorder
+from tg_gui._platform_headless_.text import Text
+
+
+class Result:
+    """
+    A scenario's time per operation and, for lifecycle scenarios, the native ops counted.
+    """
+
+    __slots__ = ("seconds", "ops")
+
+    seconds: float
+    ops: dict[str, int] | None
+
+    def __init__(self, seconds: float, ops: dict[str, int] | None = None) -> None:
+        self.seconds = seconds
+        self.ops = ops
+
+    def as_json(self) -> dict[str, Any]:
+        result: dict[str, Any] = {"seconds": self.seconds}
+        if self.ops is not None:
+            result["ops"] = self.ops
+            result["cost"] = Recorder().cost(self.ops)
+        return result
+
+
+# name -> (group, scenario), in the order they run
+_scenarios: dict[str, tuple[str, _Scenario]] = {}
+
+
+def scenario(name: str, group: str = "core") -> Callable[[_Scenario], _Scenario]:
+    def register(fn: _Scenario) -> _Scenario:
+        assert name not in _scenarios, f"duplicate scenario {name!r}"
+        _scenarios[name] = (group, fn)
+        return fn
+
+    return register
+
+
+def best_of(
+    action: Callable[[Any], object],
+    prepare: Callable[[], Any] = lambda: None,
+    *,
+    repeat: int = 5,
+    number: int = 1,
+) -> float:
+    """
+    :return: the fastest of `repeat` runs of `action(prepare())`, in seconds per call.
+        `prepare` is not timed, `action` is called `number` times per run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        arg = prepare()
+        start = perf_counter()
+        for _ in range(number):
+            action(arg)
+        best = min(best, (perf_counter() - start) / number)
+    return best
+
+
+# --- construction ---
+
+
+def _attrs() -> dict[str, Any]:
+    return {
+        "__annotations__": {"title": "str", "action": "object", "size": "int"},
+        "title": WidgetAttr(init=True, kw_only=False),
+        "action": WidgetAttr(None, init=True),
+        "size": WidgetAttr(10, init=True),
+        "_build_": lambda self, suggestion: (object(), suggestion),
+        "_demolish_": lambda self, native: None,
+        "_place_": lambda self, container, native, pos, abs_pos: None,
+        "_pickup_": lambda self, container, native: None,
+    }
+
+
+_InitWidget = widget(type("_InitWidget", (Widget,), _attrs()))
+
+
+@scenario("widget_class_creation")
+def _class_creation(quick: bool) -> Result:
+    return Result(
+        best_of(lambda _: widget(type("Bench", (Widget,), _attrs())), number=20)
+    )
+
+
+@scenario("widget_init")
+def _widget_init(quick: bool) -> Result:
+    return Result(best_of(lambda _: _InitWidget("title"), number=2_000))
+
+
+@scenario("widget_init_attrs")
+def _widget_init_generic(quick: bool) -> Result:
+    new = object.__new__
+    return Result(
+        best_of(
+            lambda _: _widget_init_attrs(new(_InitWidget), "title", action=None),
+            number=2_000,
+        )
+    )
+
+
+# --- state fan-out ---
+
+
+class _Subscriber:
+    # states hold weak references to bound onupdate methods
+    __slots__ = ("id", "value", "__weakref__")
+
+    _next_id = 0
+
+    def __init__(self) -> None:
+        self.id = _Subscriber._next_id
+        _Subscriber._next_id += 1
+
+    def onupdate(self, value: object) -> None:
+        self.value = value
+
+
+def _fanout(subscribers: int) -> _Scenario:
+    def run(quick: bool) -> Result:
+        state = State(0)
+        # kept alive here, states only hold weak references to them
+        subs = [_Subscriber() for _ in range(subscribers)]
+        for sub in subs:
+            state.subscribe(subscriber=sub, onupdate=sub.onupdate)
+        writer = _Subscriber()
+        # starts at 1, updating to the current value is a no-op
+        values = iter(range(1, 1 << 30))
+        number = max(1, 10_000 // subscribers)
+        seconds = best_of(
+            lambda _: state.update(next(values), writer=writer), number=number
+        )
+        assert subs[-1].value == state._value, "a subscriber was not notified"
+        return Result(seconds)
+
+    return run
+
+
+for _count in (1, 100, 10_000):
+    scenario(f"state_fanout_{_count}")(_fanout(_count))
+
+
+# --- lifecycle ---
+
+
+@widget
+class Column(ContainerWidget):
+    items: list[Widget] = ReadOnlyAttr(init=True, kw_only=False)
+
+    @property
+    def children(self) -> list[Widget]:
+        return self.items
+
+    def _layout_(self) -> ColumnLayout:
+        return ColumnLayout()
+
+
+def tree(text: Callable[[str], Widget], depth: int, breadth: int) -> Widget:
+    """
+    :return: columns nested `depth` deep, each with `breadth` children, texts at the bottom
+    """
+    if depth == 0:
+        return text("leaf")
+    return Column([tree(text, depth - 1, breadth) for _ in range(breadth)])
+
+
+# name -> (depth, breadth), full size / quick size
+_shapes = {
+    "flat": ((1, 1_000), (1, 100)),
+    "wide": ((2, 32), (2, 10)),
+    "deep": ((10, 2), (6, 2)),
+}
+
+# big enough for any tree above
+_screen = (1 << 30, 1 << 30)
+
+
+def _lifecycle(shape: str, op: str) -> _Scenario:
+    def run(quick: bool) -> Result:
+        depth, breadth = _shapes[shape][quick]
+        recorder = Recorder()
+        backend = HeadlessBackend(recorder)
+        new = lambda: tree(Text, depth, breadth)
+        shown = lambda: Screen.show(new(), _screen, backend)
+
+        if op == "show":
+            action, prepare = (lambda root: Screen.show(root, _screen, backend)), new
+        elif op == "move":
+            action, prepare = _shift, shown
+        elif op == "demolish":
+            action, prepare = (lambda screen: screen.demolish()), shown
+        else:
+            raise ValueError(op)
+
+        # count the ops of one un-timed run
+        arg = prepare()
+        with recorder.action() as ops:
+            action(arg)
+        return Result(best_of(action, prepare), ops)
+
+    return run
+
+
+def _shift(screen: Screen) -> None:
+    # move every top-level child one pixel right, as one update
+    root = screen.root
+    assert isinstance(root, Column)
+    root.place_children(
+        [(child, (child.pos[0] + 1, child.pos[1])) for child in root.items]
+    )
+
+
+for _shape in _shapes:
+    for _op in ("show", "move", "demolish"):
+        scenario(f"{_op}_{_shape}")(_lifecycle(_shape, _op))
+
+
+# --- qt ---
+
+
+def _qt_show(quick: bool) -> Result:
+    from tg_gui._platform_qt_.backend import QtBackend
+    from tg_gui._platform_qt_.text import Text as QtText
+
+    depth, breadth = _shapes["wide"][quick]
+    backend = QtBackend()
+    return Result(
+        best_of(
+            lambda root: Screen.show(root, _screen, backend).demolish(),
+            lambda: tree(QtText, depth, breadth),
+            repeat=3,
+        )
+    )
+
+
+scenario("qt_show_demolish_wide", group="qt")(_qt_show)
+
+
+def _qt_available() -> bool:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PySide6.QtWidgets import QApplication
+    except ImportError:
+        return False
+    QApplication.instance() or QApplication([])
+    return True
+
+
+# --- running ---
+
+
+def run(
+    only: str | None = None, quick: bool = False, log: Callable[[str], None] = print
+) -> dict[str, Any]:
+    """
+    Runs the scenarios whose name contains `only` (all by default).
+    :return: the results as a JSON-able dict, skipped scenarios are listed by name
+    """
+    results: dict[str, Any] = {}
+    skipped: list[str] = []
+    qt = None
+    for name, (group, fn) in _scenarios.items():
+        if only is not None and only not in name:
+            continue
+        if group == "qt":
+            qt = _qt_available() if qt is None else qt
+            if not qt:
+                skipped.append(name)
+                continue
+        result = fn(quick).as_json()
+        results[name] = result
+        cost = f"  cost {result['cost']}" if "cost" in result else ""
+        log(f"{name:<28} {result['seconds'] * 1e6:12.2f} us{cost}")
+    return {
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "quick": quick,
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    :return: a message per scenario that regressed against the baseline: more than
+        `threshold` (ex 0.25 for 25%) slower, or more native ops (by cost)
+    """
+    regressions = []
+    before = baseline["results"]
+    for name, result in current["results"].items():
+        if name not in before:
+            continue
+        old = before[name]
+        if result["seconds"] > old["seconds"] * (1 + threshold):
+            regressions.append(
+                f"{name}: {result['seconds'] * 1e6:.2f} us, "
+                f"{result['seconds'] / old['seconds']:.2f}x the baseline"
+            )
+        if "cost" in old and result.get("cost", 0) > old["cost"]:
+            regressions.append(
+                f"{name}: native op cost {result['cost']} (baseline {old['cost']}), "
+                f"ops {result['ops']}"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks.suite", description=__doc__)
+    parser.add_argument("--json", help="write the results to this file, - for stdout")
+    parser.add_argument("--baseline", help="compare against this results file")
+    # timings are noisy, the native op counts are exact
+    parser.add_argument("--threshold", type=float, default=1.0)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--only", help="only run scenarios whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="smaller trees")
+    args = parser.parse_args(argv)
+
+    log = (lambda line: print(line, file=sys.stderr)) if args.json == "-" else print
+    current = run(args.only, args.quick, log)
+
+    if args.json == "-":
+        json.dump(current, sys.stdout, indent=2)
+    elif args.json:
+        with open(args.json, "w") as file:
+            json.dump(current, file, indent=2)
+
+    if args.baseline is None:
+        return 0
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(current, file, indent=2)
+            file.write("\n")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    if baseline.get("quick") != current["quick"]:
+        log("the baseline was run with a different --quick, not comparing")
+        return 2
+    regressions = compare(current, baseline, args.threshold)
+    for message in regressions:
+        log(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Compares reads through the generic `WidgetAttr.__get__` (which goes through the
+`get_attr` hook) against the fast-path `ReadOnlyAttr`, `ReadWriteAttr` and
+`StatefulAttr` descriptors.
+"""
+from __future__ import annotations
+
+from timeit import timeit
+
+from tg_gui_core import Widget, WidgetAttr, ReadOnlyAttr, ReadWriteAttr, widget
+from tg_gui.stateful import State, StatefulAttr
+
+
+class HookedStatefulAttr(StatefulAttr):
+    # the StatefulAttr read path without the inlined __get__
+    __get__ = WidgetAttr.__get__
+
+
+@widget
+class BenchWidget(Widget):
+    generic: int = WidgetAttr(1, init=True)
+    readonly: int = ReadOnlyAttr(1, init=True)
+    readwrite: int = ReadWriteAttr(1, init=True)
+    hooked_stateful: int = HookedStatefulAttr(factory=lambda: State(1))
+    stateful: int = StatefulAttr(factory=lambda: State(1))
+
+    def _build_(self, suggestion):
+        return object(), suggestion
+
+    def _demolish_(self, native):
+        pass
+
+    def _place_(self, container, native, pos, abs_pos):
+        pass
+
+    def _pickup_(self, container, native):
+        pass
+
+
+def main(number: int = 1_000_000) -> None:
+    w = BenchWidget()
+    read = lambda name: timeit(f"w.{name}", globals={"w": w}, number=number)
+    generic, hooked_stateful = read("generic"), read("hooked_stateful")
+    results = [
+        ("WidgetAttr (get_attr hook)", generic, generic),
+        ("ReadOnlyAttr", read("readonly"), generic),
+        ("ReadWriteAttr", read("readwrite"), generic),
+        ("StatefulAttr (get_attr hook)", hooked_stateful, hooked_stateful),
+        ("StatefulAttr", read("stateful"), hooked_stateful),
+    ]
+    for name, seconds, baseline in results:
+        print(
+            f"{name:<30} {seconds / number * 1e9:7.1f} ns/read  "
+            f"({baseline / seconds:4.2f}x)"
+        )
+
+if __name__ == "__main__":
+    main()
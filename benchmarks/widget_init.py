@@ -0,0 +1,57 @@
+"""
+Compares the specialized per-class `__init__` installed by `@widget` against the
+generic `_widget_init_attrs` path that re-derives the init plan on every call.
+"""
+from __future__ import annotations
+
+from timeit import timeit
+
+from tg_gui_core import Widget, WidgetAttr, widget
+from tg_gui_core.attrs import _widget_init_attrs, _plan_init
+
+
+@widget
+class BenchWidget(Widget):
+    title: str = WidgetAttr(init=True, kw_only=False)
+    action: object = WidgetAttr(init=True)
+    size: int = WidgetAttr(10, init=True)
+    tags: list = WidgetAttr(init=True, default_factory=list)
+
+    def _build_(self, suggestion):
+        return object(), suggestion
+
+    def _demolish_(self, native):
+        pass
+
+    def _place_(self, container, native, pos, abs_pos):
+        pass
+
+    def _pickup_(self, container, native):
+        pass
+
+
+def main(number: int = 20_000) -> None:
+    generic = lambda: _widget_init_attrs(
+        object.__new__(BenchWidget), "title", action=None
+    )
+    planned_init = _plan_init(BenchWidget, BenchWidget.__widget_init_plan__)
+    planned = lambda: planned_init(object.__new__(BenchWidget), "title", action=None)
+    specialized = lambda: BenchWidget.__init__(
+        object.__new__(BenchWidget), "title", action=None
+    )
+
+    results = {
+        "generic (_widget_init_attrs)": timeit(generic, number=number),
+        "plan walker (circuitpython)": timeit(planned, number=number),
+        "specialized (exec)": timeit(specialized, number=number),
+    }
+    baseline = results["generic (_widget_init_attrs)"]
+    for name, seconds in results.items():
+        print(
+            f"{name:<30} {seconds / number * 1e6:8.2f} us/widget  "
+            f"({baseline / seconds:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
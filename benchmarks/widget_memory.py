@@ -0,0 +1,61 @@
+"""
+Measures the bytes allocated per widget instance with and without `@widget(slots=True)`.
+"""
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from tg_gui_core import Widget, WidgetAttr, widget
+
+
+@widget
+class _BenchWidget(Widget):
+    __slots__ = ()
+
+    title: str = WidgetAttr(init=True, kw_only=False)
+    action: object = WidgetAttr(None, init=True)
+
+    def _build_(self, suggestion):
+        return object(), suggestion
+
+    def _demolish_(self, native):
+        pass
+
+    def _place_(self, container, native, pos, abs_pos):
+        pass
+
+    def _pickup_(self, container, native):
+        pass
+
+
+@widget
+class DictWidget(_BenchWidget):
+    pass
+
+
+@widget(slots=True)
+class SlotsWidget(_BenchWidget):
+    pass
+
+
+def bytes_per_widget(cls: type, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    widgets = [cls("title") for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    # don't count the list holding the widgets
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    allocated -= widgets.__sizeof__()
+    return allocated / count
+
+
+def main(count: int = 10_000) -> None:
+    for cls in (DictWidget, SlotsWidget):
+        print(f"{cls.__name__:<12} {bytes_per_widget(cls, count):8.1f} bytes/widget")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from tg_gui.all import *
+from tg_gui.all import Text
 
 
 @widget
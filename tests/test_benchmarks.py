@@ -0,0 +1,39 @@
+from benchmarks.suite import run, compare
+
+
+def test_suite_runs_and_counts_native_ops():
+    current = run(only="deep", quick=True, log=lambda line: None)
+    assert set(current["results"]) == {"show_deep", "move_deep", "demolish_deep"}
+    moved = current["results"]["move_deep"]
+    # the two top-level columns move, as one batch
+    assert moved["ops"] == {"batch": 1, "move": 2} and moved["cost"] == 3
+
+
+def test_compare_flags_slowdowns_and_extra_native_ops():
+    baseline = {
+        "results": {
+            "fast": {"seconds": 1.0},
+            "ops": {"seconds": 1.0, "ops": {"move": 2}, "cost": 2},
+            "removed": {"seconds": 1.0},
+        }
+    }
+    current = {
+        "results": {
+            "fast": {"seconds": 1.2},
+            "ops": {"seconds": 0.5, "ops": {"move": 3}, "cost": 3},
+            "new": {"seconds": 9.0},
+        }
+    }
+    assert compare(current, baseline, threshold=0.5) == [
+        "ops: native op cost 3 (baseline 2), ops {'move': 3}"
+    ]
+    assert len(compare(current, baseline, threshold=0.1)) == 2
+
+
+def test_qt_scenario_runs_when_pyside6_is_installed():
+    import pytest
+
+    pytest.importorskip("PySide6")
+    current = run(only="qt", quick=True, log=lambda line: None)
+    assert list(current["results"]) == ["qt_show_demolish_wide"]
+    assert current["skipped"] == []
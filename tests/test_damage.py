@@ -0,0 +1,148 @@
+from tg_gui.damage import DamageTracker
+from tg_gui.scheduler import FrameScheduler
+from tg_gui_core import RowLayout
+
+from test_layout import Box, Group, Backend
+
+
+def test_tracker_merges_overlapping_and_touching_rects():
+    damage = DamageTracker()
+    damage.add((0, 0), (10, 10))
+    damage.add((5, 5), (10, 10))
+    # touches the merged rect's right edge
+    damage.add((15, 0), (5, 5))
+    damage.add((50, 50), (4, 4))
+    damage.add((60, 60), (0, 8))
+    assert sorted(damage.take()) == [(0, 0, 20, 15), (50, 50, 4, 4)]
+    assert not damage and damage.take() == []
+
+
+def test_tracker_merges_rects_bridged_by_a_new_one():
+    damage = DamageTracker()
+    damage.add((0, 0), (5, 5))
+    damage.add((20, 0), (5, 5))
+    damage.add((4, 0), (17, 2))
+    assert damage.take() == [(0, 0, 25, 5)]
+
+
+def test_tracker_collapses_past_max_rects():
+    damage = DamageTracker(max_rects=2)
+    for x in (0, 10, 20):
+        damage.add((x, x), (2, 2))
+    assert damage.take() == [(0, 0, 22, 22)]
+
+
+class DamageBackend(Backend):
+    def __init__(self):
+        super().__init__()
+        self.damage_tracker = DamageTracker()
+
+    def damage(self, abs_pos, dims):
+        self.damage_tracker.add(abs_pos, dims)
+
+
+def _show(root, suggestion=(100, 100)):
+    root.superior = Group([])
+    root.superior.native = {"children": []}
+    root.superior.abs_pos = (0, 0)
+    root.platform = backend = DamageBackend()
+    root.build(suggestion)
+    root.place((10, 10))
+    return backend.damage_tracker
+
+
+def test_widgets_damage_their_area_when_placed_moved_and_resized():
+    a, b = Box((10, 10)), Box((10, 10))
+    damage = _show(Group([a, b], layout=RowLayout(spacing=30)))
+    assert damage.take() == [(10, 10, 50, 10)]
+
+    b.move((40, 20))
+    assert sorted(damage.take()) == [(50, 10, 10, 10), (50, 30, 10, 10)]
+
+    # a grows and pushes b right, only their areas are damaged
+    b.move((40, 0))
+    damage.take()
+    a.size = (20, 10)
+    a.request_resize()
+    assert sorted(damage.take()) == [(10, 10, 20, 10), (50, 10, 20, 10)]
+
+
+def test_fake_display_only_refreshes_damaged_frames():
+    import asyncio
+    from tg_gui._platform_displayio_.scheduler import run_frames
+
+    class FakeDisplay:
+        def __init__(self):
+            self.auto_refresh = True
+            self.areas = []
+
+        def refresh_areas(self, areas):
+            self.areas.append(areas)
+
+    a, b = Box((10, 10)), Box((10, 10))
+    damage = _show(Group([a, b], layout=RowLayout(spacing=30)))
+    damage.take()
+
+    display = FakeDisplay()
+    moves = iter([(0, 10), None, (0, 0)])
+
+    def running():
+        move = next(moves, False)
+        if move:
+            a.move(move)
+        return move is not False
+
+    asyncio.run(run_frames(FrameScheduler(fps=500), running, display, damage))
+    assert display.auto_refresh is False
+    # the idle frame is skipped, each move refreshes the old and new area (they touch)
+    assert display.areas == [[(10, 10, 10, 20)], [(10, 10, 10, 20)]]
+
+
+def test_displays_without_areas_are_refreshed_whole():
+    import asyncio
+    from tg_gui._platform_displayio_.scheduler import run_frames
+
+    class StubDisplay:
+        auto_refresh = True
+
+        def __init__(self):
+            self.refreshes = 0
+
+        def refresh(self, **kwargs):
+            self.refreshes += 1
+
+    damage = DamageTracker()
+    display = StubDisplay()
+    frames = iter(range(3))
+
+    def running():
+        frame = next(frames, None)
+        if frame == 1:
+            damage.add((0, 0), (1, 1))
+        return frame is not None
+
+    asyncio.run(run_frames(FrameScheduler(fps=500), running, display, damage))
+    assert display.refreshes == 1
+
+
+def test_displayio_batches_hold_auto_refresh_and_work_without_a_display():
+    from tg_gui._platform_displayio_.backend import DisplayioBackend
+
+    class StubDisplay:
+        auto_refresh = True
+
+    display = StubDisplay()
+    backend = DisplayioBackend(display)
+    backend.begin_update(None)
+    backend.begin_update(None)
+    backend.end_update(None)
+    assert display.auto_refresh is False
+    backend.end_update(None)
+    assert display.auto_refresh is True
+
+    # ex widgets built off screen
+    offscreen = DisplayioBackend(display=None)
+    offscreen.begin_update(None)
+    offscreen.end_update(None)
+    offscreen.damage((0, 0), (1, 1))
+    assert offscreen.damage_tracker.take() == [(0, 0, 1, 1)]
@@ -0,0 +1,27 @@
+# no displayio needed, the metrics only use the font's methods
+from tg_gui._platform_displayio_.metrics import measure
+
+
+class _Glyph:
+    shift_x = 6
+
+
+class _BuiltinFont:
+    # like fontio.BuiltinFont (ex terminalio.FONT), a (width, height) bounding box
+    def get_bounding_box(self):
+        return (6, 14)
+
+    def get_glyph(self, codepoint):
+        return _Glyph() if codepoint != ord("\t") else None
+
+
+class _BitmapFont(_BuiltinFont):
+    # like adafruit_bitmap_font's BDF / PCF fonts
+    def get_bounding_box(self):
+        return (6, 10, 0, -2)
+
+
+def test_builtin_and_bitmap_fonts_are_measured():
+    assert measure(_BuiltinFont(), "hello", None) == (30, 14)
+    assert measure(_BuiltinFont(), "a\nbc\t", None) == (12, 28)
+    assert measure(_BitmapFont(), "hello", None) == (30, 10)
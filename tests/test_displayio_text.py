@@ -0,0 +1,70 @@
+import pytest
+
+pytest.importorskip("displayio")
+pytest.importorskip("terminalio")
+pytest.importorskip("adafruit_display_text")
+
+from displayio import Group
+
+from tg_gui._platform_setup_ import State, widget
+from tg_gui._platform_displayio_.backend import DisplayioBackend
+from tg_gui._platform_displayio_.palette import palettes
+from tg_gui._platform_displayio_.text import Text
+from tg_gui.view import View
+
+
+
+def test_move_and_rebuild_keep_the_label_in_place():
+    group = Group()
+    before, after = Group(), Group()
+    state = State("hello")
+    text = Text(state)
+    host = _Host()
+    host.native = group
+    host.abs_pos = (0, 0)
+    text.superior = host
+    text.platform = DisplayioBackend(display=None)
+
+    group.append(before)
+    text.build((100, 20))
+    text.place((1, 2))
+    group.append(after)
+    label = text.native
+
+    text.move((5, 6))
+    assert list(group) == [before, label, after]
+    assert (label.x, label.y) == (5, 6)
+
+    # onupdate_text requests a resize, the label is rebuilt in place
+    state.update("a longer string", writer=host)
+    assert text.native is label and list(group) == [before, label, after]
+
+
+def test_texts_of_a_theme_color_share_one_palette():
+    group = Group()
+    host = _Host()
+    host.native = group
+    host.abs_pos = (0, 0)
+    foreground = State(0xFFFFFF)
+    texts = [Text("a", foreground=foreground), Text("b", foreground=foreground)]
+    for text in texts:
+        text.superior = host
+        text.platform = DisplayioBackend(display=None)
+        text.build((100, 20))
+
+    first, second = (text.native for text in texts)
+    assert first._palette is second._palette
+
+    writes = palettes.writes
+    foreground.update(0x00FF00, writer=host)
+    assert palettes.writes == writes + 1 and first._palette[1] == 0x00FF00
+
+    for text in texts:
+        text.demolish()
+    assert foreground not in palettes._entries
+
+
+@widget
+class _Host(View):
+    def body(self):
+        return []
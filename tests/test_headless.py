@@ -0,0 +1,62 @@
+from tg_gui.stateful import State
+from tg_gui_core import ColumnLayout, ReadOnlyAttr, widget, ContainerWidget
+
+from tg_gui._platform_headless_.backend import HeadlessBackend, Screen
+from tg_gui._platform_headless_.shared import Recorder
+from tg_gui._platform_headless_.text import Text, text_metrics
+
+
+@widget
+class Column(ContainerWidget):
+    items: list = ReadOnlyAttr(init=True, kw_only=False)
+
+    @property
+    def children(self):
+        return self.items
+
+    def _layout_(self):
+        return ColumnLayout()
+
+
+def test_headless_tree_mirrors_the_widgets():
+    title, body = Text("title"), Text("two\nlines")
+    screen = Screen.show(Column([title, body]), (320, 240))
+
+    (column,) = screen.native.children
+    assert [native.text for native in column.children] == ["title", "two\nlines"]
+    assert body.native.pos == (0, 12) and body.dims == (30, 24)
+    assert body.abs_pos == (title.abs_pos[0], title.abs_pos[1] + 12)
+    assert len(list(screen.native.walk())) == 4
+
+
+def test_recorder_counts_the_ops_of_one_action():
+    label = State("short")
+    texts = [Text(label)] + [Text("row") for _ in range(3)]
+    recorder = Recorder()
+    Screen.show(Column(texts), (320, 240), HeadlessBackend(recorder))
+    # nested batches count once
+    assert recorder.counts == {"build": 6, "batch": 1, "place": 5}
+
+    with recorder.action() as ops:
+        label.update("a longer label", writer=texts[1])
+    # the text is re-measured in place, the column and screen grow to fit it
+    # and the other rows are re-centered in one batch
+    assert ops == {"rebuild": 1, "resize": 2, "batch": 1, "move": 3}
+
+
+def test_demolish_releases_the_text_natives():
+    texts = [Text(str(index)) for index in range(10)]
+    recorder = Recorder()
+    screen = Screen.show(Column(texts), (320, 240), HeadlessBackend(recorder))
+    natives = [text.native for text in texts]
+
+    with recorder.action() as ops:
+        screen.demolish()
+    # the texts, the column and the screen
+    assert ops["demolish"] == 12 and ops["pickup"] == 11
+    assert all(native.container is None for native in natives)
+    assert recorder.cost(ops) == sum(Recorder.weights[op] * n for op, n in ops.items())
+
+
+def test_wrapped_text_is_measured_by_cells():
+    assert text_metrics.size(None, "abcdef", 24) == (24, 24)
@@ -0,0 +1,35 @@
+from tg_gui_core import _isinstance_dispatch as dispatch
+from tg_gui_core._isinstance_dispatch import IsinstanceBase, isinstance_cp_compat
+
+
+class Small(IsinstanceBase):
+    @classmethod
+    def _inst_isinstance_check_(cls, instance):
+        return isinstance(instance, int) and 0 <= instance < 10
+
+
+class Plain:
+    pass
+
+
+def test_plain_types_take_the_direct_path():
+    assert isinstance_cp_compat(Plain(), Plain)
+    assert not isinstance_cp_compat(1, Plain)
+    assert isinstance_cp_compat(1.5, (Plain, float))
+    assert dispatch._dispatch[Plain] is None
+    assert dispatch._dispatch[(Plain, float)] is None
+
+
+def test_isinstance_base_subclasses_use_their_check():
+    assert isinstance_cp_compat(3, Small) and not isinstance_cp_compat(30, Small)
+    assert isinstance_cp_compat(30, (Small, int))
+    assert not isinstance_cp_compat("3", (Small, Plain))
+    assert dispatch._dispatch[(Small, int)] == ((int,), (Small._inst_isinstance_check_,))
+    # the base itself is checked as a type
+    assert isinstance_cp_compat(Small(), IsinstanceBase)
+
+
+def test_entries_that_are_neither_types_nor_checkable_never_match():
+    not_a_type = object()
+    assert not isinstance_cp_compat(1, not_a_type)
+    assert isinstance_cp_compat(1, (not_a_type, int))
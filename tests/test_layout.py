@@ -0,0 +1,280 @@
+from tg_gui_core import (
+    Widget,
+    ContainerWidget,
+    ReadOnlyAttr,
+    ReadWriteAttr,
+    RowLayout,
+    ColumnLayout,
+    GridLayout,
+    StackLayout,
+    widget,
+)
+from tg_gui_core.platform_support import PlatformBackend
+
+
+# a native element is a dict, containers keep their placed children's natives in "children"
+def _native(dims):
+    return {"dims": dims, "children": []}
+
+
+@widget
+class Box(Widget):
+    """
+    A leaf that is as big as `size` allows, counts how often it is built.
+    """
+
+    size: tuple[int, int] = ReadWriteAttr((10, 10), init=True, kw_only=False)
+    builds: int = ReadWriteAttr(0, init=False)
+
+    def _build_(self, suggestion):
+        self.builds += 1
+        dims = (min(self.size[0], suggestion[0]), min(self.size[1], suggestion[1]))
+        return _native(dims), dims
+
+    def _demolish_(self, native):
+        pass
+
+    def _place_(self, container, native, pos, abs_pos):
+        container["children"].append(native)
+
+    def _pickup_(self, container, native):
+        container["children"].remove(native)
+
+
+@widget
+class Group(ContainerWidget):
+    items: list[Widget] = ReadOnlyAttr(init=True, kw_only=False)
+    layout: object = ReadOnlyAttr(StackLayout(), init=True)
+
+    @property
+    def children(self):
+        return self.items
+
+    def _layout_(self):
+        return self.layout
+
+    def _build_(self, suggestion):
+        self.builds += 1
+        return super()._build_(suggestion)
+
+    builds: int = ReadWriteAttr(0, init=False)
+
+
+class Backend(PlatformBackend):
+    """
+    Native containers are dicts, counts the batched updates.
+    """
+
+    name = "test"
+
+    def __init__(self):
+        self.updates = []
+
+    def build_container(self, dims):
+        return _native(dims), dims
+
+    def resize_container(self, native, dims):
+        native["dims"] = dims
+        return dims
+
+    def demolish_container(self, native):
+        pass
+
+    def place_native(self, container, native, pos):
+        container["children"].append(native)
+
+    def pickup_native(self, container, native):
+        container["children"].remove(native)
+
+    def begin_update(self, container):
+        self.updates.append(("begin", len(container["children"])))
+
+    def end_update(self, container):
+        self.updates.append(("end", len(container["children"])))
+
+
+def _show(root, suggestion=(100, 100)):
+    # stands in for the window the root is shown in
+    screen = {"children": []}
+    root.superior = Group([])
+    root.superior.native = screen
+    root.superior.abs_pos = (0, 0)
+    root.platform = Backend()
+    root.build(suggestion)
+    root.place((0, 0))
+    return screen
+
+
+def test_row_and_column_split_the_suggestion():
+    a, b = Box((100, 5)), Box((10, 20))
+    row = Group([a, b], layout=RowLayout(spacing=2))
+    _show(row)
+    assert (a.dims, b.dims) == ((49, 5), (10, 20))
+    assert (a.pos, b.pos) == ((0, 7), (51, 0))
+    assert row.dims == (61, 20)
+    assert row.native["children"] == [a.native, b.native]
+
+    c, d = Box((5, 100)), Box((20, 10))
+    column = Group([c, d], layout=ColumnLayout())
+    _show(column)
+    assert (c.dims, d.dims) == ((5, 50), (20, 10))
+    assert (c.pos, d.pos) == ((7, 0), (0, 50))
+
+
+def test_grid_and_stack():
+    boxes = [Box((w, 10)) for w in (10, 20, 5, 5, 30)]
+    grid = Group(boxes, layout=GridLayout(columns=2, spacing=1))
+    _show(grid, (100, 100))
+    assert [box.pos for box in boxes] == [(0, 0), (31, 0), (0, 11), (31, 11), (0, 22)]
+    assert grid.dims == (51, 32)
+
+    small, large = Box((4, 4)), Box((10, 10))
+    stack = Group([small, large])
+    _show(stack)
+    assert small.pos == (3, 3) and large.pos == (0, 0)
+
+
+def test_unchanged_children_are_not_remeasured_or_moved():
+    a, b = Box((10, 10)), Box((10, 10))
+    inner = Group([a, b])
+    c = Box((10, 10))
+    root = Group([inner, c], layout=ColumnLayout())
+    _show(root, (40, 40))
+    assert (a.builds, b.builds, c.builds, inner.builds, root.builds) == (1,) * 5
+
+    # same suggestion: nothing is rebuilt or moved
+    moves = []
+    c._move_ = lambda *args: moves.append(args)
+    root.relayout()
+    assert (a.builds, b.builds, c.builds, inner.builds, root.builds) == (1,) * 5
+    assert moves == []
+
+    # a new child in the stack only builds the new child
+    d = Box((10, 10))
+    inner.items.append(d)
+    inner.relayout()
+    assert d.builds == 1 and d.native in inner.native["children"]
+    assert (a.builds, b.builds, c.builds, inner.builds) == (1,) * 4
+
+    # a new sibling of the stack changes its suggestion, so it and its children are remeasured
+    root.items.append(Box((10, 10)))
+    root.relayout()
+    assert (a.builds, b.builds, c.builds) == (2, 2, 2)
+    assert root.native["children"][-1] is root.items[-1].native
+
+
+def test_removed_children_are_demolished_and_unnested():
+    a, b = Box(), Box()
+    root = Group([a, b], layout=RowLayout())
+    _show(root)
+    root.items.remove(a)
+    root.relayout()
+    assert root.native["children"] == [b.native]
+    assert not Widget.superior.has_attr(a) and not Widget.native.has_attr(a)
+    assert b.pos == (0, 0)
+
+    root.demolish()
+    assert not Widget.native.has_attr(b) and not Widget.superior.has_attr(b)
+
+
+def _dashboard():
+    # root column of rows, each row has two boxes
+    rows = [Group([Box((10, 10)), Box((10, 10))], layout=RowLayout()) for _ in range(3)]
+    root = Group(rows, layout=ColumnLayout())
+    _show(root, (100, 300))
+    return root, rows
+
+
+def test_resize_stops_at_the_first_superior_that_keeps_its_dims():
+    root, rows = _dashboard()
+    first, second = rows[0].items
+
+    # grows inside its 50x100 slot, the row grows, the column grows
+    first.size = (20, 20)
+    first.request_resize()
+    assert first.dims == (20, 20) and first.builds == 2
+    assert rows[0].dims == (30, 20)
+    assert second.pos == (20, 5)
+    assert root.dims == (30, 40)
+    # the other rows moved down but were not rebuilt
+    assert rows[1].pos == (5, 20) and rows[1].builds == 1
+    assert [box.builds for box in rows[1].items] == [1, 1]
+
+    # a sibling grows within the row's height: the row keeps its dims so the column is untouched
+    root_builds = root.builds
+    moves = []
+    rows[1]._move_ = lambda *args: moves.append(args)
+    second.size = (10, 15)
+    second.request_resize()
+    assert second.pos == (20, 2)
+    assert rows[0].dims == (30, 20)
+    assert root.builds == root_builds and moves == []
+
+
+def test_resize_that_keeps_dims_is_local():
+    root, rows = _dashboard()
+    box = rows[2].items[0]
+    box.request_resize()  # same size
+    assert box.builds == 2
+    assert rows[2].builds == 1 and root.builds == 1
+    assert not root._layout_dirty_ and not rows[2]._layout_dirty_
+
+
+def test_batched_resizes_lay_out_once():
+    root, rows = _dashboard()
+    arranged = []
+    original = Group._update_layout
+
+    def counting(self):
+        arranged.append(self)
+        original(self)
+
+    Group._update_layout = counting
+    try:
+        with Group.batch_resizes():
+            for row in rows:
+                for box in row.items:
+                    box.size = (20, 20)
+                    box.request_resize()
+            assert arranged == []
+        assert arranged.count(root) == 1
+    finally:
+        del Group._update_layout
+    assert root.dims == (40, 60)
+    assert [row.pos for row in rows] == [(0, 0), (0, 20), (0, 40)]
+
+
+def test_moving_a_container_resolves_descendant_abs_pos_lazily():
+    root, rows = _dashboard()
+    box = rows[2].items[1]
+    assert box.abs_pos == (10, 20)
+    record = getattr(box, Widget.abs_pos.private_name)
+
+    moves = []
+    box._move_ = lambda *args: moves.append(args)
+    rows[2].move((40, 50))
+    # the row moved, its children were not walked
+    assert moves == [] and record[0] == (10, 20)
+    assert rows[2].abs_pos == (40, 50)
+    assert box.abs_pos == (50, 50) and box.pos == (10, 0)
+
+    # moving the root reaches every descendant on read
+    root.move((1, 2))
+    assert box.abs_pos == (51, 52)
+    assert rows[0].items[0].abs_pos == (1, 2)
+
+    # pinned positions (ex the screen a root is shown in) are used as-is
+    root.superior.abs_pos = (100, 100)
+    assert box.abs_pos == (151, 152)
+
+
+def test_children_are_placed_and_picked_up_in_one_update():
+    boxes = [Box((1, 1)) for _ in range(200)]
+    root = Group(boxes, layout=GridLayout(columns=20))
+    _show(root)
+    updates = root.platform.updates
+    assert updates == [("begin", 0), ("end", 200)]
+
+    updates.clear()
+    root.demolish()
+    assert updates == [("begin", 200), ("end", 0)]
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+
+def _run(code, **env):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def test_tg_gui_all_does_not_import_the_platform():
+    loaded = _run(
+        "import sys, tg_gui.all\n"
+        "print(sorted(name for name in sys.modules if 'platform_' in name"
+        " or name.startswith('PySide6')))"
+    )
+    assert loaded == "['tg_gui._platform_setup_']"
+
+
+def test_star_import_does_not_import_the_platform():
+    loaded = _run(
+        "import sys\n"
+        "from tg_gui.all import *\n"
+        "print('Text' in dir(), 'View' in dir(), 'main' in dir(),"
+        " any(name.startswith(('PySide6', 'tg_gui.platform')) for name in sys.modules))"
+    )
+    assert loaded == "False True True False"
+
+
+def test_platform_widgets_resolve_on_first_use():
+    out = _run(
+        "import sys, tg_gui.all as all, tg_gui.platform as platform\n"
+        "assert 'tg_gui.platform.text' not in sys.modules\n"
+        "print(all.Text is platform.Text, all.Text.__module__)\n"
+        "from tg_gui.all import Text\n"
+        "print(Text is all.Text)",
+        TG_GUI_PLATFORM="headless",
+    )
+    assert out.splitlines() == ["True tg_gui.platform.text", "True"]
+
+
+def test_unknown_attributes_still_raise():
+    import pytest
+    import tg_gui.all
+
+    with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+        tg_gui.all.Nope
@@ -0,0 +1,91 @@
+from tg_gui.list_view import ListView
+
+from test_layout import _show
+from test_subscriptions import Label
+
+
+def _rows(count=50_000):
+    made = []
+
+    def row(item):
+        made.append(label := Label(item))
+        return label
+
+    lines = [f"line {index}" for index in range(count)]
+    rows = ListView(lines, row, row_height=10, overscan=2)
+    _show(rows, (200, 100))
+    return rows, made
+
+
+def _shown(rows):
+    return {child.pos[1]: child.text for child in rows.children}
+
+
+def test_only_visible_rows_are_built():
+    rows, made = _rows()
+    # 10 rows fit, plus 2 overscan below (none above the first row)
+    assert len(made) == len(rows.children) == 12
+    assert rows.dims == (200, 100)
+    assert _shown(rows)[0] == "line 0" and _shown(rows)[90] == "line 9"
+
+
+def test_scrolling_recycles_row_widgets():
+    rows, made = _rows()
+    natives = {id(label.native) for label in made}
+
+    rows.scroll_to(25)
+    assert _shown(rows)[-5] == "line 2" and _shown(rows)[95] == "line 12"
+    rows.scroll_to(400_005)
+    shown = _shown(rows)
+    assert shown[-5] == "line 40000" and shown[-25] == "line 39998"
+
+    # the first widgets were rebound to the new rows, only the partial row and the
+    # overscan above it needed new ones
+    assert len(made) == 15
+    assert set(made) == set(rows.children)
+    assert {id(label.native) for label in rows.children} >= natives
+
+    # clamped to the last row
+    rows.scroll_to(10**9)
+    assert max(_shown(rows)) == 90 and _shown(rows)[90] == "line 49999"
+
+
+def test_refresh_rereads_the_source():
+    rows, made = _rows(5)
+    assert len(rows.children) == 5
+    rows.source[1] = "changed"
+    rows.refresh()
+    assert _shown(rows)[10] == "changed"
+    assert rows.children[1].native[-1] == "changed"
+
+
+def test_rebinding_resizing_rows_lays_out_once(monkeypatch):
+    from tg_gui_core import ContainerWidget
+    from tg_gui.screen import Screen
+    from tg_gui._platform_headless_.backend import HeadlessBackend
+    from tg_gui._platform_headless_.shared import Recorder
+    from tg_gui._platform_headless_.text import Text
+
+    recorder = Recorder()
+    lines = [f"line {index}" for index in range(50_000)]
+    rows = ListView(lines, Text, row_height=12)
+    Screen.show(rows, (200, 120), HeadlessBackend(recorder))
+
+    passes = []
+    update_layout = ContainerWidget._update_layout
+    monkeypatch.setattr(
+        ContainerWidget,
+        "_update_layout",
+        lambda self: passes.append(self) or update_layout(self),
+    )
+    # each rebound Text requests a resize, they are re-measured in one pass
+    with recorder.action() as ops:
+        rows.scroll_to(6000)
+    assert len(passes) <= 1
+    assert ops["rebuild"] == ops["move"] == 12
+
+    passes.clear()
+    lines[501] = "changed"
+    rows.refresh()
+    assert len(passes) <= 1
+    assert any(native.text == "changed" for native in rows.native.children)
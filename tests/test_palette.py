@@ -0,0 +1,80 @@
+import pytest
+
+from tg_gui.palette import SharedPalettes, rgb565, rgb565_bulk
+from tg_gui.stateful import State
+
+
+def _write(palette, color):
+    palette[0] = color
+
+
+def _palettes():
+    # a native palette is a one item list holding its color
+    return SharedPalettes(lambda color: [color], _write)
+
+
+def test_rgb565():
+    assert rgb565(0xFFFFFF) == 0xFFFF
+    assert rgb565(0xFF0000) == 0xF800
+    assert rgb565(0x00FF00) == 0x07E0
+    assert rgb565(0x0000FF) == 0x001F
+    assert rgb565(0x808080) == 0x8410
+
+
+def test_bulk_conversion_matches():
+    colors = [0x000000, 0x123456, 0xFFFFFF, 0x808080]
+    assert list(rgb565_bulk(colors)) == [rgb565(color) for color in colors]
+    assert list(rgb565_bulk(iter(colors))) == [rgb565(color) for color in colors]
+
+
+def test_bulk_conversion_is_vectorized_with_numpy():
+    numpy = pytest.importorskip("numpy")
+    converted = rgb565_bulk(numpy.array([0xFF0000, 0x0000FF]))
+    assert converted.dtype == numpy.uint16 and list(converted) == [0xF800, 0x001F]
+
+
+def test_same_colors_share_a_palette_until_released():
+    palettes = _palettes()
+    white = palettes.acquire(0xFFFFFF)
+    assert palettes.acquire(0xFFFFFF) is white
+    assert palettes.acquire(0x000000) is not white
+    assert len(palettes) == 2 and palettes.writes == 2
+
+    palettes.release(0xFFFFFF)
+    assert len(palettes) == 2
+    palettes.release(0xFFFFFF)
+    assert len(palettes) == 1
+
+
+def test_recoloring_a_state_key_is_one_write():
+    palettes = _palettes()
+    theme = State(0xFFFFFF)
+    shared = [palettes.acquire(theme, 0xFFFFFF) for _ in range(50)]
+    assert all(palette is shared[0] for palette in shared)
+
+    writes = palettes.writes
+    for _ in shared:
+        # every user is told, only the first write changes anything
+        palettes.recolor(theme, 0x00FF00)
+    assert palettes.writes == writes + 1
+    assert shared[0] == [0x00FF00]
+
+
+class _TileGrid:
+    pixel_shader = None
+
+
+class _StubLabel:
+    # the private attributes of an adafruit_display_text label that use_palette sets
+    def __init__(self):
+        self._palette = "own"
+        self._local_group = [_TileGrid(), _TileGrid()]
+
+
+def test_labels_use_the_shared_palette():
+    from tg_gui._platform_displayio_.palette import use_palette
+
+    label, shared = _StubLabel(), [0xFFFFFF]
+    use_palette(label, shared)
+    assert label._palette is shared
+    assert all(grid.pixel_shader is shared for grid in label._local_group)
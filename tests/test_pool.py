@@ -0,0 +1,40 @@
+from tg_gui.pool import NativePool
+
+
+def test_released_elements_are_reused_by_key():
+    pool = NativePool(capacity=4)
+    assert pool.acquire("label") is None
+    label = pool.allocated(object())
+    pool.release("label", label)
+
+    assert pool.acquire("button") is None
+    assert pool.acquire("label") is label
+    assert pool.acquire("label") is None
+    stats = pool.stats()
+    assert (stats["allocations"], stats["reuses"], stats["pooled"]) == (1, 1, 0)
+    assert "gc_collections" in stats
+
+
+def test_full_pool_evicts_the_least_recently_used_key():
+    disposed = []
+    pool = NativePool(capacity=3, dispose=disposed.append)
+    pool.release("a", "a1")
+    pool.release("b", "b1")
+    pool.release("a", "a2")  # a is now the most recent key
+    pool.release("c", "c1")
+    assert disposed == ["b1"]
+
+    pool.release("c", "c2")
+    assert disposed == ["b1", "a1"]
+    assert pool.stats()["evictions"] == 2 and pool.stats()["pooled"] == 3
+
+    pool.clear()
+    assert sorted(disposed) == ["a1", "a2", "b1", "c1", "c2"]
+    assert pool.acquire("c") is None
+
+
+def test_zero_capacity_disposes_right_away():
+    disposed = []
+    pool = NativePool(capacity=0, dispose=disposed.append)
+    pool.release("a", "a1")
+    assert disposed == ["a1"] and pool.acquire("a") is None
@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from tg_gui.screen import Screen
+from tg_gui._platform_qt_.backend import QtBackend
+from tg_gui._platform_qt_.text import Text
+
+from test_headless import Column
+
+
+def test_nested_updates_keep_the_container_frozen():
+    QApplication.instance() or QApplication([])
+    first, second = Text("first"), Text("second")
+    column = Column([first, second])
+    backend = QtBackend()
+    screen = Screen.show(column, (200, 100), backend)
+    native = column.native
+    assert native.updatesEnabled()
+
+    # ex a resize that re-places the children while an outer batch is open
+    backend.begin_update(native)
+    column.place_children([(first, (0, 20)), (second, (0, 40))])
+    assert not native.updatesEnabled()
+    backend.end_update(native)
+    assert native.updatesEnabled() and first.native.pos().toTuple() == (0, 20)
+
+    screen.demolish()
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from tg_gui.runner import Runner
+from tg_gui.stateful import State
+
+from test_subscriptions import Label
+
+
+class StubRunner(Runner):
+    frames: int
+
+    def _run_frames(self):
+        async def run_frames(scheduler, running, *platform_args):
+            self.frames = 0
+            while running():
+                scheduler.flush()
+                self.frames += 1
+                await asyncio.sleep(0)
+
+        return run_frames
+
+
+def test_runner_flushes_updates_from_coroutines():
+    state = State("a")
+    label = Label(state)
+    label.build((10, 10))
+    runner = StubRunner()
+
+    async def produce():
+        for text in ("b", "c", "d"):
+            state.update(text, writer=runner)
+            await asyncio.sleep(0)
+        assert await state.changed() == "e"
+        runner.stop()
+
+    async def later():
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        state.update("e", writer=runner)
+
+    runner.run(produce(), later())
+    assert label.native[-1] == "e"
+    assert runner.frames > 0
+    # the scheduler is removed once the runner returns
+    state.update("f", writer=runner)
+    assert label.native[-1] == "f"
+
+
+def test_runner_reraises_coroutine_errors():
+    runner = StubRunner()
+    cancelled = []
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("sensor unplugged")
+
+    async def forever():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(RuntimeError, match="sensor unplugged"):
+        runner.run(fail(), forever())
+    assert cancelled == [True]
+
+
+def test_main_shows_the_root():
+    import os
+    import subprocess
+    import sys
+
+    # main.py's entry point, on the headless platform, stopping instead of running
+    code = (
+        "import runpy\n"
+        "from tg_gui.runner import Runner\n"
+        "Runner.run = lambda self: print([native.text for native in"
+        " self.screen.native.walk() if native.kind == 'text'])\n"
+        "runpy.run_path('main.py', run_name='__main__')"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "TG_GUI_PLATFORM": "headless"},
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert out == "['hello']"
@@ -0,0 +1,131 @@
+from tg_gui.stateful import State
+from tg_gui.scheduler import FrameScheduler
+
+from test_stateful import Subscriber, _subscribed
+
+
+def test_scheduler_defers_and_coalesces():
+    state = State(0)
+    (sub,) = _subscribed(state)
+    writer = Subscriber()
+
+    scheduler = FrameScheduler(fps=60).install()
+    try:
+        for value in range(1, 101):
+            state.update(value, writer=writer)
+        assert sub.updates == [] and scheduler.pending == 1
+
+        assert scheduler.flush() == 1
+        assert sub.updates == [100]
+        assert scheduler.flush() == 0
+    finally:
+        scheduler.uninstall()
+
+    state.update(5, writer=writer)
+    assert sub.updates == [100, 5]
+
+
+def test_scheduler_skips_unsubscribed():
+    state = State(0)
+    (sub,) = _subscribed(state)
+    scheduler = FrameScheduler().install()
+    try:
+        state.update(1, writer=Subscriber())
+        state.unsubscribe(subscriber=sub)
+        assert scheduler.flush() == 0
+    finally:
+        scheduler.uninstall()
+
+
+def test_scheduler_requeues_after_a_failing_callback():
+    import pytest
+
+    state = State(0)
+    first, second = _subscribed(state, 2)
+
+    def fail(value):
+        raise RuntimeError("boom")
+
+    state.subscribe(subscriber=Subscriber(), onupdate=fail)
+    (last,) = _subscribed(state)
+
+    scheduler = FrameScheduler().install()
+    try:
+        state.update(1, writer=Subscriber())
+        with pytest.raises(RuntimeError):
+            scheduler.flush()
+        assert first.updates == second.updates == [1]
+        assert last.updates == [] and scheduler.pending == 1
+
+        assert scheduler.flush() == 1
+        assert last.updates == [1]
+    finally:
+        scheduler.uninstall()
+
+
+class _StubDisplay:
+    def __init__(self, frames):
+        self.auto_refresh = True
+        self.refreshes = []
+        self._frames = frames
+
+    def refresh(self, **kwargs):
+        self.refreshes.append(kwargs)
+        if len(self.refreshes) == self._frames:
+            raise _StopLoop
+
+
+class _StopLoop(Exception):
+    pass
+
+
+def test_displayio_drive_frames_flushes_before_each_refresh():
+    import pytest
+    from tg_gui._platform_displayio_.scheduler import drive_frames
+
+    state = State(0)
+    (sub,) = _subscribed(state)
+    display = _StubDisplay(frames=3)
+    scheduler = FrameScheduler(fps=50).install()
+    try:
+        state.update(1, writer=Subscriber())
+        with pytest.raises(_StopLoop):
+            drive_frames(scheduler, display)
+    finally:
+        scheduler.uninstall()
+
+    assert display.auto_refresh is False
+    assert sub.updates == [1]
+    assert display.refreshes[0] == {
+        "target_frames_per_second": 50,
+        "minimum_frames_per_second": 0,
+    }
+
+
+def test_displayio_run_frames_stops_when_not_running():
+    import asyncio
+    from tg_gui._platform_displayio_.scheduler import run_frames
+
+    display = _StubDisplay(frames=-1)
+    scheduler = FrameScheduler(fps=200)
+    frames = iter(range(3))
+    asyncio.run(run_frames(scheduler, lambda: next(frames, None) is not None, display))
+    assert len(display.refreshes) == 3 and display.auto_refresh is False
+
+
+def test_qt_drive_frames_starts_a_frame_timer():
+    import pytest
+
+    pytest.importorskip("PySide6")
+    import os
+    from PySide6.QtWidgets import QApplication
+    from tg_gui._platform_qt_.scheduler import drive_frames
+
+    # no display is needed to run a timer
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    QApplication.instance() or QApplication([])
+
+    timer = drive_frames(FrameScheduler(fps=50))
+    assert timer.isActive() and timer.interval() == 20
+    timer.stop()
@@ -0,0 +1,206 @@
+from tg_gui.stateful import State
+
+
+class Subscriber:
+    _next_id = 1000
+
+    def __init__(self):
+        self.id = Subscriber._next_id
+        Subscriber._next_id += 1
+        self.updates = []
+
+    def onupdate(self, value):
+        self.updates.append(value)
+
+
+def _subscribed(state, count=1):
+    subscribers = [Subscriber() for _ in range(count)]
+    for sub in subscribers:
+        state.subscribe(subscriber=sub, onupdate=sub.onupdate)
+    return subscribers
+
+
+def test_update_notifies_all_but_writer():
+    state = State(0)
+    writer, reader = _subscribed(state, 2)
+    state.update(1, writer=writer)
+    assert writer.updates == [] and reader.updates == [1]
+
+
+def test_batch_coalesces_writes():
+    reading, units = State(0), State("C")
+    (reading_sub,) = _subscribed(reading)
+    (units_sub,) = _subscribed(units)
+    writer = Subscriber()
+
+    with State.batch():
+        for value in (1, 2, 3):
+            reading.update(value, writer=writer)
+        units.update("F", writer=writer)
+        # values are visible right away, notifications are deferred
+        assert reading.value(reader=writer) == 3
+        assert reading_sub.updates == []
+
+    assert reading_sub.updates == [3]
+    assert units_sub.updates == ["F"]
+
+
+def test_batch_skips_last_writer_and_unchanged():
+    state, other = State(0), State(0)
+    first, last = _subscribed(state, 2)
+    (other_sub,) = _subscribed(other)
+
+    with State.batch():
+        with State.batch():
+            state.update(1, writer=first)
+            state.update(2, writer=last)
+            other.update(5, writer=first)
+        other.update(0, writer=first)
+        # nested batches flush with the outermost one
+        assert first.updates == []
+
+    assert first.updates == [2] and last.updates == []
+    assert other_sub.updates == []
+
+
+def test_computed_state_is_lazy_and_glitch_free():
+    from tg_gui.stateful import ComputedState
+
+    computes = []
+
+    def computed(name, fn):
+        def compute(reader):
+            computes.append(name)
+            return fn(reader)
+
+        return ComputedState(compute)
+
+    a = State(1)
+    b = computed("b", lambda r: a.value(reader=r) + 1)
+    c = computed("c", lambda r: a.value(reader=r) * 2)
+    d = computed("d", lambda r: (b.value(reader=r), c.value(reader=r)))
+    writer = Subscriber()
+
+    # nothing computes until read
+    a.update(2, writer=writer)
+    assert computes == []
+    assert d.value(reader=writer) == (3, 4)
+    assert sorted(computes) == ["b", "c", "d"]
+
+    # subscribers see one consistent value per change, each node recomputes once
+    (sub,) = _subscribed(d)
+    computes.clear()
+    a.update(3, writer=writer)
+    assert sub.updates == [(4, 6)]
+    assert sorted(computes) == ["b", "c", "d"]
+
+    # unchanged intermediate values stop the recompute
+    e = computed("e", lambda r: a.value(reader=r) > 0)
+    f = computed("f", lambda r: not e.value(reader=r))
+    assert f.value(reader=writer) is False
+    computes.clear()
+    a.update(4, writer=writer)
+    assert f.value(reader=writer) is False
+    assert "f" not in computes
+
+    with State.batch():
+        a.update(5, writer=writer)
+        a.update(6, writer=writer)
+        assert d.value(reader=writer) == (7, 12)
+    assert sub.updates == [(4, 6), (5, 8), (7, 12)]
+
+
+def test_unused_computed_states_are_not_kept_alive_by_their_sources():
+    import gc
+    from tg_gui.stateful import ComputedState
+
+    computes = []
+    source = State(1)
+    writer = Subscriber()
+
+    def compute(reader):
+        computes.append(source)
+        return source.value(reader=reader) + 1
+
+    doubled = ComputedState(compute)
+    assert doubled.value(reader=writer) == 2 and len(source._dependents) == 1
+
+    del doubled
+    gc.collect()
+    assert len(source._dependents) == 0
+    # nothing left to invalidate (or recompute) on later updates
+    source.update(2, writer=writer)
+    assert len(computes) == 1
+
+
+def test_changed_is_awaitable():
+    import asyncio
+    from tg_gui.stateful import ComputedState
+
+    state = State(0)
+    doubled = ComputedState(lambda reader: state.value(reader=reader) * 2)
+    writer = Subscriber()
+
+    async def produce():
+        for value in (1, 2):
+            while state._waiters is None:
+                await asyncio.sleep(0)
+            state.update(value, writer=writer)
+
+    async def consume():
+        producer = asyncio.create_task(produce())
+        first = await asyncio.gather(state.changed(), doubled.changed())
+        second = await state.changed()
+        await producer
+        return first, second
+
+    assert asyncio.run(consume()) == ([1, 2], 2)
+
+
+def test_computed_state_subscribed_before_read():
+    from tg_gui.stateful import ComputedState
+
+    a = State(1)
+    doubled = ComputedState(lambda reader: a.value(reader=reader) * 2)
+    (sub,) = _subscribed(doubled)
+    a.update(5, writer=Subscriber())
+    assert sub.updates == [10]
+
+
+def test_changed_returns_the_value_that_woke_it():
+    import asyncio
+
+    state = State(0)
+    writer = Subscriber()
+
+    async def main():
+        waiter = asyncio.create_task(state.changed())
+        await asyncio.sleep(0)
+        state.update(1, writer=writer)
+        state.update(2, writer=writer)
+        return await waiter
+
+    assert asyncio.run(main()) == 1
+
+
+def test_post_from_threads_applies_latest_value_on_drain():
+    import threading
+
+    states = [State(-1) for _ in range(4)]
+    subs = [_subscribed(state)[0] for state in states]
+
+    def produce(state):
+        for value in range(1000):
+            state.post(value)
+
+    threads = [threading.Thread(target=produce, args=(state,)) for state in states]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # nothing happens until the ui thread drains the queue
+    assert all(sub.updates == [] for sub in subs)
+    assert State.drain_posted() == 4
+    assert [sub.updates for sub in subs] == [[999]] * 4
+    assert State.drain_posted() == 0
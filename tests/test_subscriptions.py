@@ -0,0 +1,108 @@
+import gc
+import tracemalloc
+from time import perf_counter
+
+from tg_gui._platform_setup_ import NativeWidget, StatefulAttr, State, onupdate, widget
+
+from test_stateful import Subscriber
+
+
+@widget
+class Label(NativeWidget):
+    text: str = StatefulAttr(init=True, kw_only=False)
+
+    @onupdate(text)
+    def onupdate_text(self, text):
+        self.native.append(text)
+
+    def onupdate_theme(self, attr):
+        pass
+
+    def _build_(self, suggestion, *, text):
+        return [], suggestion
+
+    def _demolish_(self, native):
+        native.clear()
+
+    def _place_(self, container, native, pos, abs_pos):
+        pass
+
+    def _pickup_(self, container, native):
+        pass
+
+
+def test_demolish_unsubscribes_and_build_resubscribes():
+    state = State("a")
+    label = Label(state)
+    label.build((10, 10))
+    assert len(state._subscribed) == 1
+
+    label.demolish()
+    assert len(state._subscribed) == 0
+
+    label.build((10, 10))
+    state.update("b", writer=Subscriber())
+    assert label.native == ["b"]
+
+
+def test_subscriptions_do_not_keep_widgets_alive():
+    state = State("a")
+    Label(state)  # never demolished, dropped right away
+    gc.collect()
+    state.update("b", writer=Subscriber())
+    assert len(state._subscribed) == 0
+
+
+def _cycles(state, count):
+    for _ in range(count):
+        label = Label(state)
+        label.build((10, 10))
+        label.demolish()
+
+
+def _time_updates(state, writer, count=200):
+    start = perf_counter()
+    for value in range(count):
+        state.update(value, writer=writer)
+    return perf_counter() - start
+
+
+def test_memory_and_update_cost_stay_flat_over_10k_cycles():
+    state = State("a")
+    live = Label(state)
+    live.build((10, 10))
+    writer = Subscriber()
+
+    _cycles(state, 1_000)  # warm up
+    gc.collect()
+    before_time = _time_updates(state, writer)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    _cycles(state, 10_000)
+    gc.collect()
+
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    after_time = _time_updates(state, writer)
+
+    assert len(state._subscribed) == 1
+    # well under one byte per cycle
+    assert growth < 10_000, f"grew {growth} bytes over 10k build/demolish cycles"
+    assert after_time < before_time * 3 + 0.01
+
+
+def test_unnest_and_nest_again_resubscribes():
+    state = State("a")
+    label = Label(state)
+    label.build((10, 10))
+    superior, platform = object(), object()
+
+    label.nest_in(superior, platform)
+    label.unnest_from(superior, platform)
+    assert len(state._subscribed) == 0
+
+    label.nest_in(superior, platform)
+    state.update("b", writer=Subscriber())
+    assert label.native == ["b"]
+    assert len(state._subscribed) == 1
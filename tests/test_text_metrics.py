@@ -0,0 +1,46 @@
+from tg_gui.text_metrics import TextMetrics
+
+
+def _monospace(calls):
+    def measure(font, text, wrap_width):
+        calls.append(text)
+        width = len(text) * font
+        if wrap_width is None:
+            return width, font
+        return min(width, wrap_width), -(-width // wrap_width) * font
+
+    return measure
+
+
+def test_repeated_strings_are_cached_per_font_and_wrap():
+    calls = []
+    metrics = TextMetrics(_monospace(calls))
+    assert metrics.size(6, "hello") == (30, 6)
+    assert metrics.size(6, "hello") == (30, 6)
+    assert metrics.size(8, "hello") == (40, 8)
+    assert metrics.size(6, "hello", wrap_width=12) == (12, 18)
+    assert calls == ["hello"] * 3
+    assert (metrics.hits, metrics.misses) == (1, 3)
+
+
+def test_least_recently_used_sizes_are_evicted():
+    calls = []
+    metrics = TextMetrics(_monospace(calls), capacity=2)
+    metrics.size(6, "a")
+    metrics.size(6, "b")
+    metrics.size(6, "a")  # b is now the least recent
+    metrics.size(6, "c")
+    assert len(metrics) == 2
+
+    calls.clear()
+    metrics.size(6, "a")
+    metrics.size(6, "b")
+    assert calls == ["b"]
+
+
+def test_font_key():
+    calls = []
+    metrics = TextMetrics(_monospace(calls), font_key=lambda font: font % 2)
+    metrics.size(6, "x")
+    metrics.size(8, "x")  # same key as 6
+    assert calls == ["x"]
@@ -0,0 +1,80 @@
+import json
+
+from tg_gui.stateful import State
+from tg_gui.scheduler import FrameScheduler
+from tg_gui.tracing import Tracer
+from tg_gui_core import Widget, ContainerWidget
+
+from tg_gui._platform_headless_.backend import Screen
+from tg_gui._platform_headless_.text import Text
+
+from test_headless import Column
+from test_stateful import Subscriber, _subscribed
+
+
+def _names(tracer, category):
+    return [event[0] for event in tracer.events if event[1] == category]
+
+
+def test_tracer_records_lifecycle_spans_once_per_call():
+    label = State("hello")
+    with Tracer() as tracer:
+        screen = Screen.show(Column([Text(label), Text("static")]), (100, 100))
+        label.update("hello, world", writer=Subscriber())
+        screen.demolish()
+
+    widget_spans = _names(tracer, "widget")
+    # ContainerWidget.place calls Widget.place, it is one span
+    assert widget_spans.count("Column.place") == 1
+    assert widget_spans.count("Text.build") == 2
+    assert "Text.rebuild" in widget_spans and "Screen.demolish" in widget_spans
+    assert _names(tracer, "state") == ["State.update"]
+    assert _names(tracer, "callback") == ["Text.onupdate_text"]
+    assert _names(tracer, "theme") == ["Text.onupdate_theme"] * 2
+
+    (update,) = [event for event in tracer.events if event[0] == "State.update"]
+    (callback,) = [event for event in tracer.events if event[1] == "callback"]
+    # the callback ran inside the update
+    assert update[2] <= callback[2] <= callback[3] <= update[3]
+
+
+def test_scheduled_callbacks_are_traced_in_the_flush():
+    state = State(0)
+    (sub,) = _subscribed(state)
+    scheduler = FrameScheduler().install()
+    try:
+        with Tracer() as tracer:
+            state.update(1, writer=Subscriber())
+            scheduler.flush()
+    finally:
+        scheduler.uninstall()
+    assert sub.updates == [1]
+    assert [event[0] for event in tracer.events] == [
+        "State.update",
+        "Subscriber.onupdate",
+        "FrameScheduler.flush",
+    ]
+    assert tracer.events[-1][4] == {"callbacks": 1}
+
+
+def test_disabled_tracer_restores_the_original_methods():
+    originals = (Widget.place, ContainerWidget.place, Text.build, State.update)
+    tracer = Tracer().enable()
+    assert Widget.place is not originals[0] and tracer.enabled
+    tracer.disable()
+    assert (Widget.place, ContainerWidget.place, Text.build, State.update) == originals
+
+    state = State(0)
+    (sub,) = _subscribed(state)
+    state.update(1, writer=Subscriber())
+    assert sub.updates == [1] and tracer.events == []
+
+
+def test_chrome_trace_export(tmp_path):
+    with Tracer() as tracer:
+        State(0).update(1, writer=Subscriber())
+    path = tmp_path / "trace.json"
+    tracer.export(str(path))
+    (event,) = json.loads(path.read_text())["traceEvents"]
+    assert event["name"] == "State.update" and event["ph"] == "X"
+    assert event["dur"] >= 0 and event["args"] == {"subscribers": 0}
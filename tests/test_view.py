@@ -0,0 +1,79 @@
+from tg_gui._platform_setup_ import ReadOnlyAttr, State, Widget, widget
+from tg_gui.view import View
+
+from test_layout import _show
+from test_subscriptions import Label
+
+
+@widget
+class Panel(View):
+    """
+    Shows a label per item, the title is only shown when set.
+    """
+
+    items: list = ReadOnlyAttr(init=True, kw_only=False)
+    title: State = ReadOnlyAttr(init=True)
+
+    def body(self):
+        title = [Label(self.title, key="title")] if self.title.value(reader=self) else []
+        return title + [Label(text, key=text) for text in self.items]
+
+
+def test_reconcile_reuses_matching_children(monkeypatch):
+    builds = []
+    original = Label._build_
+
+    def _build_(self, suggestion, **kwargs):
+        builds.append(self)
+        return original(self, suggestion, **kwargs)
+
+    monkeypatch.setattr(Label, "_build_", _build_)
+    title = State("")
+    panel = Panel(["a", "b", "c"], title=title)
+    _show(panel)
+    a, b, c = panel.children
+    assert len(builds) == 3
+
+    # reorder, drop one, add one: only the added child is built
+    panel.items[:] = ["c", "a", "d"]
+    panel.update_body()
+    assert panel.children[:2] == [c, a]
+    assert not Widget.native.has_attr(b)
+    assert len(builds) == 4 and builds[-1] is panel.children[2]
+
+    # a keyed child appears, the others are untouched
+    title.update("hi", writer=panel)
+    panel.update_body()
+    assert len(builds) == 5
+    assert panel.children[1:] == [c, a, builds[3]]
+
+
+def test_reconcile_pushes_changed_stateful_attrs():
+    text = State("x")
+
+    @widget
+    class One(View):
+        value: str = ReadOnlyAttr(init=True, kw_only=False)
+
+        def body(self):
+            return Label(self.value)
+
+    one = One("a")
+    _show(one)
+    (label,) = one.children
+    native = label.native
+    # the body's label gets a new plain value, the native element is kept and updated
+    setattr(one, One.value.private_name, "b")
+    one.update_body()
+    assert one.children == [label] and label.native is native
+    assert native == ["b"]
+
+    # unchanged values are not pushed again
+    one.update_body()
+    assert native == ["b"]
+
+    # binding to a state subscribes the live label
+    label_attr = type(label).text
+    label_attr.rebind(label, text)
+    text.update("y", writer=one)
+    assert native == ["b", "x", "y"]
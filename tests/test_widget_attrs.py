@@ -0,0 +1,54 @@
+import pytest
+
+from tg_gui_core import Widget, WidgetAttr, ReadOnlyAttr, ReadWriteAttr, widget
+from tg_gui_core.shared import Missing
+from tg_gui.stateful import State, StatefulAttr
+
+
+@widget
+class Sample(Widget):
+    generic: int = WidgetAttr(1, init=True)
+    readonly: int = ReadOnlyAttr(2, init=True)
+    readwrite: int = ReadWriteAttr(init=False)
+    stateful: int = StatefulAttr(3)
+
+    def _build_(self, suggestion):
+        return object(), suggestion
+
+    def _demolish_(self, native):
+        pass
+
+    def _place_(self, container, native, pos, abs_pos):
+        pass
+
+    def _pickup_(self, container, native):
+        pass
+
+
+def test_reads():
+    sample = Sample(stateful=State(4))
+    assert (sample.generic, sample.readonly, sample.stateful) == (1, 2, 4)
+    assert isinstance(sample.id, int)
+    assert Sample.readonly is Sample.__widget_attrs__["readonly"]
+
+
+def test_missing_reads_raise():
+    sample = Sample()
+    with pytest.raises(AttributeError, match="uninited or cleared"):
+        sample.readwrite
+    with pytest.raises(AttributeError, match="uninited or cleared"):
+        sample.native
+
+
+def test_writes():
+    sample = Sample()
+    with pytest.raises(AttributeError):
+        sample.readonly = 5
+    with pytest.raises(AttributeError):
+        sample.generic = 5
+
+    sample.readwrite = 5
+    assert sample.readwrite == 5
+    sample.readwrite = Missing
+    with pytest.raises(AttributeError):
+        sample.readwrite
@@ -0,0 +1,107 @@
+import pytest
+
+from tg_gui_core import Widget, WidgetAttr, widget
+from tg_gui_core.attrs import _plan_init
+
+
+@widget
+class Button(Widget):
+    title: str = WidgetAttr(init=True, kw_only=False)
+    action: object = WidgetAttr(init=True)
+    size: int = WidgetAttr(10, init=True)
+    tags: list = WidgetAttr(init=True, default_factory=list)
+
+    def _build_(self, suggestion):
+        return object(), suggestion
+
+    def _demolish_(self, native):
+        pass
+
+    def _place_(self, container, native, pos, abs_pos):
+        pass
+
+    def _pickup_(self, container, native):
+        pass
+
+
+def _make_plan_button(*args, **kwargs):
+    button = object.__new__(Button)
+    _plan_init(Button, Button.__widget_init_plan__)(button, *args, **kwargs)
+    return button
+
+
+@pytest.mark.parametrize("make", [Button, _make_plan_button])
+def test_init_applies_args_and_defaults(make):
+    button = make("ok", action=print)
+    assert button._title == "ok"
+    assert button._action is print
+    assert button._size == 10
+    assert button._tags == [] and button._tags is not make("ok", action=None)._tags
+    assert isinstance(button._id, int)
+
+
+@pytest.mark.parametrize("make", [Button, _make_plan_button])
+def test_init_rejects_bad_arguments(make):
+    with pytest.raises(TypeError):
+        make(action=print)  # missing title
+    with pytest.raises(TypeError):
+        make("ok", "extra", action=print)
+    with pytest.raises(TypeError):
+        make("ok", action=print, unknown=1)
+    with pytest.raises(TypeError):
+        make("ok", title="again", action=print)
+    with pytest.raises(TypeError):
+        make("ok", action=print, id=4)  # init=False attrs are not arguments
+
+
+def test_plan_is_computed_per_class():
+    plan = Button.__widget_init_plan__
+    assert [wa.name for wa in plan.positional] == ["title"]
+    assert [wa.name for _, wa in plan.ordered][-4:] == ["title", "action", "size", "tags"]
+    assert Widget.__widget_init_plan__ is not plan
+
+
+def test_hand_written_init_is_kept_by_subclasses():
+    calls = []
+
+    @widget
+    class Custom(Widget):
+        def __init__(self, value):
+            calls.append(value)
+
+        _build_ = Button._build_
+        _demolish_ = Button._demolish_
+        _place_ = Button._place_
+        _pickup_ = Button._pickup_
+
+    @widget
+    class Sub(Custom):
+        extra: int = WidgetAttr(1, init=True)
+
+    assert Sub.__init__ is Custom.__init__
+    Sub(5)
+    assert calls == [5]
+
+
+def test_generated_init_is_replaced_by_subclasses():
+    @widget
+    class Sub(Button):
+        extra: int = WidgetAttr(1, init=True)
+
+    assert Sub.__init__ is not Button.__init__
+    assert Sub("ok", action=None, extra=2)._extra == 2
+
+
+def test_generated_inits_do_not_keep_classes_alive():
+    import gc
+    import weakref
+
+    @widget
+    class Temporary(Button):
+        extra: int = WidgetAttr(1, init=True)
+
+    assert Temporary("ok", action=None)._extra == 1
+    cls = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert cls() is None
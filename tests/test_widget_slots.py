@@ -0,0 +1,73 @@
+import weakref
+
+from tg_gui_core import Widget, WidgetAttr, ReadWriteAttr, widget
+
+
+@widget
+class Label(Widget):
+    __slots__ = ()
+
+    text: str = WidgetAttr(init=True, kw_only=False)
+
+    def _build_(self, suggestion):
+        return object(), suggestion
+
+    def _demolish_(self, native):
+        pass
+
+    def _place_(self, container, native, pos, abs_pos):
+        pass
+
+    def _pickup_(self, container, native):
+        pass
+
+    def describe(self):
+        return super().__repr__()
+
+
+@widget(slots=True)
+class SlotsLabel(Label):
+    size: int = WidgetAttr(12, init=True)
+
+    def describe(self):
+        return "slots " + super().describe()
+
+
+def test_slots_cover_all_widget_attrs():
+    assert set(SlotsLabel.__slots__) == {
+        wa.private_name for wa in SlotsLabel.__widget_attrs__.values()
+    } | {"__weakref__"}
+    label = SlotsLabel("hi", size=3)
+    assert not hasattr(label, "__dict__")
+    assert (label._text, label._size) == ("hi", 3)
+    assert weakref.ref(label)() is label
+
+
+def test_slotted_class_is_consistent():
+    assert SlotsLabel.size.owning_cls is SlotsLabel
+    assert "__widget_class_id__" in SlotsLabel.__dict__
+    # zero-argument super() in inherited and own methods still works
+    assert SlotsLabel("hi").describe().startswith("slots <")
+
+
+def test_unslotted_subclass_keeps_dict():
+    @widget
+    class DictLabel(Label):
+        pass
+
+    assert hasattr(DictLabel("hi"), "__dict__")
+
+
+@widget(slots=True)
+class CachingLabel(Label):
+    # an `_underscored_` attr, its slot must not be name-mangled
+    _cache_: int = ReadWriteAttr(0, init=False)
+
+
+def test_underscored_attrs_can_be_slotted():
+    assert CachingLabel._cache_.private_name in CachingLabel.__slots__
+    assert not CachingLabel._cache_.private_name.startswith("__")
+    label = CachingLabel("hi")
+    assert label._cache_ == 0
+    label._cache_ = 4
+    assert label._cache_ == 4 and not hasattr(label, "__dict__")
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+from sys import modules as _modules
+
+
+def lazy_getattr(module_name: str, attrs: dict[str, str]) -> Callable[[str], Any]:
+    """
+    Makes a module-level `__getattr__` that imports the listed attributes on first use,
+    so a module can export (ex) platform widgets without importing the native toolkit, ex:
+    ```
+    __getattr__ = lazy_getattr(__name__, {"Text": ".text:Text", "platform": "tg_gui.platform"})
+    ```
+    Values are `"module:attr"` or `"module"` (the module itself), modules starting with
+    a `.` are relative to the package, imported through `tg_gui.platform` when the
+    package is the platform that aliases it. Resolved values are cached on the module.
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = attrs.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        module = _modules[module_name]
+        path, _, attr = target.partition(":")
+        if path.startswith("."):
+            package = (
+                "tg_gui.platform"
+                if _modules.get("tg_gui.platform") is module
+                else module_name
+            )
+            path = package + path
+        value: Any = __import__(path, None, None, [attr or "__name__"])
+        if attr:
+            value = getattr(value, attr)
+        setattr(module, name, value)
+        return value
+
+    return __getattr__
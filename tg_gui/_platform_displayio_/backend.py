@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+    from displayio import Group
+
+from tg_gui_core import Pixels, Widget
+from tg_gui_core.platform_support import PlatformBackend
+
+from ..damage import DamageTracker
+from ..screen import Screen
+
+
+class DisplayioBackend(PlatformBackend):
+    """
+    Native containers are Groups. Batched updates hold the display's auto refresh off,
+    so a group populated with many children is refreshed once. The areas widgets change
+    are collected in `damage_tracker`, pass it to `drive_frames` to only refresh frames
+    (and areas) that changed.
+    Without a display (ex widgets built off screen, in tests) batches do nothing.
+    """
+
+    name = "displayio"
+
+    display: Any
+    damage_tracker: DamageTracker
+    _depth: int
+    _auto_refresh: bool
+
+    def __init__(self, display: Any = None) -> None:
+        self.display = display
+        self.damage_tracker = DamageTracker()
+        self._depth = 0
+        self._auto_refresh = False
+
+    def build_container(
+        self, dims: tuple[Pixels, Pixels]
+    ) -> tuple[Group, tuple[Pixels, Pixels]]:
+        # imported here so the backend can be used (and tested) without displayio
+        from displayio import Group
+
+        # groups have no size of their own
+        return Group(), dims
+
+    def resize_container(
+        self, native: Group, dims: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        return dims
+
+    def demolish_container(self, native: Group) -> None:
+        pass
+
+    def place_native(
+        self, container: Group, native: Group, pos: tuple[Pixels, Pixels]
+    ) -> None:
+        native.x, native.y = pos
+        container.append(native)
+
+    def pickup_native(self, container: Group, native: Group) -> None:
+        container.remove(native)
+
+    def move_native(
+        self, container: Group, native: Group, pos: tuple[Pixels, Pixels]
+    ) -> None:
+        # keeps its place (z-order) in the group
+        native.x, native.y = pos
+
+    def begin_update(self, container: Group) -> None:
+        display = self.display
+        if self._depth == 0 and display is not None:
+            self._auto_refresh = display.auto_refresh
+            display.auto_refresh = False
+        self._depth += 1
+
+    def end_update(self, container: Group) -> None:
+        self._depth -= 1
+        display = self.display
+        if self._depth == 0 and display is not None:
+            # turning auto refresh back on refreshes the whole batch at once
+            display.auto_refresh = self._auto_refresh
+
+    def damage(
+        self, abs_pos: tuple[Pixels, Pixels], dims: tuple[Pixels, Pixels]
+    ) -> None:
+        self.damage_tracker.add(abs_pos, dims)
+
+
+def show(
+    root: Widget, dims: tuple[Pixels, Pixels] | None = None, display: Any = None
+) -> Screen:
+    """
+    Shows the root on the display, sized to the display by default, see
+    `tg_gui.runner.main`.
+    """
+    assert display is not None, "pass the display to show the root on"
+    if dims is None:
+        dims = (display.width, display.height)
+    screen = Screen.show(root, dims, DisplayioBackend(display))
+    display.root_group = screen.native
+    return screen
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fontio import BuiltinFont
+    from adafruit_bitmap_font.bdf import BDF
+    from adafruit_bitmap_font.pcf import PCF
+
+from ..text_metrics import TextMetrics
+
+
+def measure(
+    font: BuiltinFont | BDF | PCF, text: str, wrap_width: int | None
+) -> tuple[int, int]:
+    # add up the glyph advances instead of building a label to read its bounding_box
+    if wrap_width is None:
+        lines = text.split("\n")
+    else:
+        from adafruit_display_text import wrap_text_to_pixels
+
+        lines = wrap_text_to_pixels(text, wrap_width, font)
+    # a BuiltinFont's (ex terminalio.FONT) bounding box is (width, height),
+    # bitmap fonts' are (width, height, x offset, y offset)
+    line_height = font.get_bounding_box()[1]
+    width = 0
+    for line in lines:
+        line_width = 0
+        for char in line:
+            glyph = font.get_glyph(ord(char))
+            if glyph is not None:
+                line_width += glyph.shift_x
+        width = max(width, line_width)
+    return width, line_height * len(lines)
+
+
+# kept small, every entry is a few tuples in ram
+text_metrics = TextMetrics(measure, capacity=64)
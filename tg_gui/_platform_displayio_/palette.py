@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from displayio import Palette
+    from adafruit_display_text import LabelBase
+
+from ..palette import SharedPalettes
+
+
+def _make(color: int) -> Palette:
+    # imported here so use_palette can be used (and tested) without displayio
+    from displayio import Palette
+
+    # the layout labels draw with: 0 is the (transparent) background, 1 the text
+    palette = Palette(2)
+    palette[0] = 0x000000
+    palette.make_transparent(0)
+    palette[1] = color
+    return palette
+
+
+def _write(palette: Palette, color: int) -> None:
+    palette[1] = color
+
+
+# shared by the displayio widgets, one palette per color (or theme color State)
+palettes: SharedPalettes[Palette] = SharedPalettes(_make, _write)
+
+
+def use_palette(label: LabelBase, palette: Palette) -> None:
+    """
+    Draws the label with the given (shared) palette instead of the one it made itself.
+    NOTE: adafruit_display_text has no public way to give a label its palette, this sets
+    the private `_palette` the label makes new tile grids with, and the `pixel_shader` of
+    the tile grids it already has (in the private `_local_group`). `label.color = ...`
+    then writes into the shared palette, re-check both when updating adafruit_display_text.
+    """
+    label._palette = palette
+    for tile_grid in label._local_group:
+        tile_grid.pixel_shader = palette
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ..pool import NativePool
+
+# shared by the displayio widgets, keyed by the native class and its font.
+# kept small, idle elements still hold their bitmaps in ram
+native_pool: NativePool[object] = NativePool(capacity=16)
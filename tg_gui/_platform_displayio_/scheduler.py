@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable
+    from displayio import Display
+    from ..damage import DamageTracker, Rect
+
+from time import monotonic, sleep
+
+from ..scheduler import FrameScheduler
+
+
+def drive_frames(
+    scheduler: FrameScheduler,
+    display: Display,
+    damage: DamageTracker | None = None,
+) -> None:
+    """
+    Runs the refresh loop: flushes the scheduler then refreshes the display, once per frame.
+    `auto_refresh` is turned off so the display only refreshes after a flush.
+    With a `damage` tracker (ex `DisplayioBackend.damage_tracker`) frames where no widget
+    changed are skipped, see `_refresh_damage`.
+    This does not return.
+    """
+    display.auto_refresh = False
+    fps = scheduler.fps
+    if damage is None:
+        while True:
+            scheduler.flush()
+            # waits for the next frame, returns immediately if this frame ran long
+            display.refresh(target_frames_per_second=fps, minimum_frames_per_second=0)
+
+    interval = scheduler.frame_interval
+    next_frame = monotonic()
+    while True:
+        scheduler.flush()
+        _refresh_damage(display, damage.take())
+        next_frame = max(next_frame + interval, monotonic())
+        sleep(next_frame - monotonic())
+
+
+async def run_frames(
+    scheduler: FrameScheduler,
+    running: Callable[[], bool],
+    display: Display,
+    damage: DamageTracker | None = None,
+) -> None:
+    """
+    The asyncio version of `drive_frames`: once per frame, flushes the scheduler and
+    refreshes the display, sleeping in between so other tasks can run.
+    """
+    import asyncio
+
+    display.auto_refresh = False
+    interval = scheduler.frame_interval
+    next_frame = monotonic()
+    while running():
+        scheduler.flush()
+        if damage is None:
+            display.refresh(minimum_frames_per_second=0)
+        else:
+            _refresh_damage(display, damage.take())
+        next_frame = max(next_frame + interval, monotonic())
+        await asyncio.sleep(next_frame - monotonic())
+
+
+def _refresh_damage(display: Display, areas: list[Rect]) -> None:
+    """
+    Refreshes the damaged areas, if any. CircuitPython's `Display.refresh()` takes no
+    area (displayio already only re-sends the groups that changed), so this skips idle
+    frames. Displays with a `refresh_areas(areas)` method (ex a custom driver) are
+    passed the merged (x, y, width, height) areas.
+    """
+    if not areas:
+        return
+    refresh_areas = getattr(display, "refresh_areas", None)
+    if refresh_areas is not None:
+        refresh_areas(areas)
+    else:
+        display.refresh(minimum_frames_per_second=0)
@@ -7,6 +7,9 @@ from typing import TYPE_CHECKING
 from tg_gui_core import *
 
 from .shared import NativeElement, NativeContainer
+from .pool import native_pool
+from .metrics import text_metrics
+from .palette import palettes, use_palette
 from .._platform_setup_ import *
 
 # ---
@@ -17,11 +20,16 @@ if TYPE_CHECKING:
     from adafruit_bitmap_font.pcf import PCF
 
 from terminalio import FONT as _FONT
-from adafruit_display_text import LabelBase, wrap_text_to_pixels, wrap_text_to_lines
+from adafruit_display_text import LabelBase
 from adafruit_display_text.label import Label as TextLabel
 from adafruit_display_text.bitmap_label import Label as BitmapLabel
 
 
+def _label_cls(text: str | State[str]) -> type[LabelBase]:
+    # text that changes needs a label that can re-layout, static text can be a bitmap
+    return TextLabel if isinstance(text, State) else BitmapLabel
+
+
 @widget
 class Text(NativeWidget[LabelBase]):
 
@@ -32,13 +40,29 @@ class Text(NativeWidget[LabelBase]):
     foreground: Color = StatefulAttr(default=Color.white)
     font: BuiltinFont | BDF | PCF = _FONT
 
+    # the foreground color, or the State it comes from, the label's palette is shared by
+    _palette_key_: Color | State[Color] = ReadWriteAttr(init=False)
+
     @onupdate(text)
     def onupdate_text(self, text: str) -> None:
         self.native.text = text
+        # the bounding box follows the text
+        self.request_resize()
+
+    @onupdate(foreground)
+    def onupdate_foreground(self, color: Color) -> None:
+        key = Text.foreground.get_raw_attr(self)
+        if key == self._palette_key_:
+            # the shared State changed, one write recolors every text using it
+            palettes.recolor(key, color)
+        else:
+            # rebound to another color or State
+            palettes.release(self._palette_key_)
+            self._share_palette(self.native)
 
     def onupdate_theme(self, attr: ThemedAttr[Any] | None) -> None:
-        print(f"WARNING: Text.onupdate_theme() not implemented")
-        self.native.color = self.foreground
+        # colors are drawn from the shared palettes, see _share_palette
+        pass
 
     def _build_(
         self,
@@ -46,25 +70,60 @@ class Text(NativeWidget[LabelBase]):
         *,
         text: str | State[str],
     ) -> tuple[LabelBase, tuple[Pixels, Pixels]]:
-        variable_width = isinstance(text, State)
-
-        label: LabelBase
-        if variable_width:
-            label = TextLabel(
-                self.font,
-                # max_glyphs=len(self.text),
-                text=text,
-            )
+        label_cls = _label_cls(text)
+
+        # labels can't change font, pool them by both
+        label: LabelBase | None = native_pool.acquire((label_cls, self.font))
+        if label is None:
+            label = native_pool.allocated(label_cls(self.font, text=self.text))
         else:
-            label = BitmapLabel(
-                self.font,
-                text=text,
-            )
+            label.text = self.text
 
-        return label, label.bounding_box[2:4]
+        self._share_palette(label)
+        return label, text_metrics.size(self.font, self.text)
+
+    def _share_palette(self, label: LabelBase) -> None:
+        key = Text.foreground.get_raw_attr(self)
+        palette = palettes.acquire(key, self.foreground)
+        self._palette_key_ = key
+        # labels draw with their own palette, swap in the one shared by every text
+        # of this color
+        use_palette(label, palette)
+
+    def _rebuild_(
+        self, native: LabelBase, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[LabelBase, tuple[Pixels, Pixels]]:
+        text = self.text
+        label_cls = _label_cls(Text.text.get_raw_attr(self))
+        if type(native) is label_cls:
+            # same kind of label, update it where it is
+            if native.text != text:
+                native.text = text
+            return native, text_metrics.size(self.font, text)
+
+        # the text became (or stopped being) stateful, swap the label in the same group slot
+        label, dims = self._build_(suggestion, text=Text.text.get_raw_attr(self))
+        if Widget.pos.has_attr(self):
+            group = self.superior.native
+            group[group.index(native)] = label
+            label.x, label.y = self.pos
+        self._demolish_(native)
+        return label, dims
 
     def _demolish_(self, native: LabelBase) -> None:
-        del native
+        palettes.release(self._palette_key_)
+        native_pool.release((type(native), self.font), native)
+
+    def _move_(
+        self,
+        container: NativeContainer,
+        native: LabelBase,
+        pos: tuple[Pixels, Pixels],
+        abs_pos: tuple[Pixels, Pixels],
+    ) -> None:
+        # keeps the label's place (z-order) in the group
+        native.x = pos[0]
+        native.y = pos[1]
 
     def _place_(
         self,
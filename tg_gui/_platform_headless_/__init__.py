@@ -0,0 +1,6 @@
+from .._lazy_ import lazy_getattr as _lazy_getattr
+
+# aliased as tg_gui.platform, the submodules (and the native toolkit) load on first use
+__getattr__ = _lazy_getattr(
+    __name__, {"Text": ".text:Text", "native_pool": ".pool:native_pool"}
+)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from tg_gui_core import Pixels, Widget
+from tg_gui_core.platform_support import PlatformBackend
+
+from ..screen import Screen
+from .shared import HeadlessNative, Recorder, recorder as _recorder
+
+
+class HeadlessBackend(PlatformBackend):
+    """
+    Native containers are `HeadlessNative`s, nothing is drawn. Every operation is
+    counted in `recorder`, so widget trees can be built and benchmarked without a
+    native toolkit (ex in CI).
+    """
+
+    name = "headless"
+
+    recorder: Recorder
+    # how many begin_update calls are open
+    depth: int
+
+    def __init__(self, recorder: Recorder = _recorder) -> None:
+        self.recorder = recorder
+        self.depth = 0
+
+    def build_container(
+        self, dims: tuple[Pixels, Pixels]
+    ) -> tuple[HeadlessNative, tuple[Pixels, Pixels]]:
+        native = HeadlessNative("container", dims)
+        self.recorder.record("build", native)
+        return native, dims
+
+    def resize_container(
+        self, native: HeadlessNative, dims: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        native.dims = dims
+        self.recorder.record("resize", native)
+        return dims
+
+    def demolish_container(self, native: HeadlessNative) -> None:
+        self.recorder.record("demolish", native)
+
+    def place_native(
+        self,
+        container: HeadlessNative,
+        native: HeadlessNative,
+        pos: tuple[Pixels, Pixels],
+    ) -> None:
+        place(container, native, pos)
+        self.recorder.record("place", native)
+
+    def pickup_native(self, container: HeadlessNative, native: HeadlessNative) -> None:
+        pickup(container, native)
+        self.recorder.record("pickup", native)
+
+    def move_native(
+        self,
+        container: HeadlessNative,
+        native: HeadlessNative,
+        pos: tuple[Pixels, Pixels],
+    ) -> None:
+        native.pos = pos
+        self.recorder.record("move", native)
+
+    def begin_update(self, container: HeadlessNative) -> None:
+        if self.depth == 0:
+            self.recorder.record("batch", container)
+        self.depth += 1
+
+    def end_update(self, container: HeadlessNative) -> None:
+        self.depth -= 1
+
+
+def place(
+    container: HeadlessNative, native: HeadlessNative, pos: tuple[Pixels, Pixels]
+) -> None:
+    assert native.container is None, f"{native} is already placed in {native.container}"
+    native.pos = pos
+    native.container = container
+    container.children[native] = None
+
+
+def pickup(container: HeadlessNative, native: HeadlessNative) -> None:
+    assert native.container is container, f"{native} is not placed in {container}"
+    del container.children[native]
+    native.pos = None
+    native.container = None
+
+
+def show(root: Widget, dims: tuple[Pixels, Pixels] | None = None) -> Screen:
+    """
+    Shows the root on a headless screen (320x240 by default), see `tg_gui.runner.main`.
+    """
+    return Screen.show(root, (320, 240) if dims is None else dims)
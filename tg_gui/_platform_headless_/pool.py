@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ..pool import NativePool
+from .shared import HeadlessNative
+
+# shared by the headless widgets, keyed by the widget class
+native_pool: NativePool[HeadlessNative] = NativePool(capacity=64)
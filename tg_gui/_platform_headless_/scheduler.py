@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+from time import monotonic
+
+from ..scheduler import FrameScheduler
+
+
+def drive_frames(scheduler: FrameScheduler, frames: int) -> None:
+    """
+    Flushes the scheduler `frames` times back to back, there is no display to wait for.
+    """
+    for _ in range(frames):
+        scheduler.flush()
+
+
+async def run_frames(scheduler: FrameScheduler, running: Callable[[], bool]) -> None:
+    """
+    The asyncio version of `drive_frames`: once per frame, flushes the scheduler,
+    sleeping in between so other tasks can run.
+    """
+    import asyncio
+
+    interval = scheduler.frame_interval
+    next_frame = monotonic()
+    while running():
+        scheduler.flush()
+        next_frame = max(next_frame + interval, monotonic())
+        await asyncio.sleep(next_frame - monotonic())
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+# ---
+
+from tg_gui_core import Pixels
+
+
+class HeadlessNative:
+    """
+    A stand-in for a native element, it only keeps what a real toolkit would be told:
+    its size, position, container and (for containers) children, (for labels) text.
+    """
+
+    __slots__ = ("kind", "dims", "pos", "container", "children", "text")
+
+    kind: str
+    dims: tuple[Pixels, Pixels]
+    pos: tuple[Pixels, Pixels] | None
+    container: HeadlessNative | None
+    # in placement order, a dict so picking up is O(1)
+    children: dict[HeadlessNative, None]
+    text: str
+
+    def __init__(self, kind: str, dims: tuple[Pixels, Pixels], text: str = "") -> None:
+        self.kind = kind
+        self.dims = dims
+        self.pos = None
+        self.container = None
+        self.children = {}
+        self.text = text
+
+    def walk(self) -> Iterator[HeadlessNative]:
+        """
+        Yields this element and every element placed in it, depth first.
+        """
+        stack = [self]
+        while stack:
+            native = stack.pop()
+            yield native
+            stack.extend(reversed(native.children))
+
+    def __repr__(self) -> str:
+        return f"<HeadlessNative {self.kind} {self.dims} at {self.pos}>"
+
+
+NativeElement = HeadlessNative
+NativeContainer = HeadlessNative
+
+
+class Recorder:
+    """
+    Counts the native operations the headless platform performs, ex the ops one
+    user action costs:
+    ```
+    with recorder.action() as ops:
+        state.update("new text", writer=...)
+    assert ops == {"rebuild": 1, "move": 3}
+    ```
+    `cost()` weighs the counts by `weights`, a rough model of how expensive each
+    operation is on a real toolkit, so runs can be compared by a single number.
+    Set `log` to a list to also keep every (op, kind) in order, off by default so
+    large trees can be recorded in constant memory.
+    """
+
+    # relative cost of each op, build / demolish allocate or free a native element
+    weights: dict[str, int] = {
+        "build": 4,
+        "rebuild": 2,
+        "demolish": 2,
+        "place": 2,
+        "pickup": 2,
+        "move": 1,
+        "resize": 1,
+        "batch": 1,
+    }
+
+    counts: dict[str, int]
+    log: list[tuple[str, str]] | None
+
+    def __init__(self) -> None:
+        self.counts = {}
+        self.log = None
+
+    def record(self, op: str, native: HeadlessNative) -> None:
+        counts = self.counts
+        counts[op] = counts.get(op, 0) + 1
+        if self.log is not None:
+            self.log.append((op, native.kind))
+
+    def cost(self, counts: dict[str, int] | None = None) -> int:
+        """
+        :return: the weighted sum of the counts, all recorded ops by default
+        """
+        weights = self.weights
+        counts = self.counts if counts is None else counts
+        return sum(weights.get(op, 1) * count for op, count in counts.items())
+
+    def reset(self) -> None:
+        self.counts = {}
+        if self.log is not None:
+            self.log = []
+
+    def action(self) -> _Action:
+        """
+        :return: a context manager, the dict it enters as is filled with the ops
+            recorded inside the with block when it exits
+        """
+        return _Action(self)
+
+
+class _Action:
+    __slots__ = ("_recorder", "_before", "_ops")
+
+    def __init__(self, recorder: Recorder) -> None:
+        self._recorder = recorder
+        self._ops: dict[str, int] = {}
+
+    def __enter__(self) -> dict[str, int]:
+        self._before = dict(self._recorder.counts)
+        return self._ops
+
+    def __exit__(self, *exc_info: object) -> None:
+        before = self._before
+        for op, count in self._recorder.counts.items():
+            count -= before.get(op, 0)
+            if count:
+                self._ops[op] = count
+
+
+# the headless widgets and backends record here by default
+recorder = Recorder()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+# ---
+
+from tg_gui_core import *
+
+from .shared import NativeElement, NativeContainer, HeadlessNative
+from .backend import place, pickup
+from .pool import native_pool
+from .._platform_setup_ import *
+from ..text_metrics import TextMetrics
+
+# a fixed cell per character, like a small monospace bitmap font
+CHAR_WIDTH = 6
+LINE_HEIGHT = 12
+
+
+def _measure(font: None, text: str, wrap_width: int | None) -> tuple[int, int]:
+    lines = text.split("\n")
+    if wrap_width is not None:
+        per_line = max(1, wrap_width // CHAR_WIDTH)
+        lines = [
+            line[start : start + per_line]
+            for line in lines
+            for start in range(0, max(1, len(line)), per_line)
+        ]
+    return max(len(line) for line in lines) * CHAR_WIDTH, len(lines) * LINE_HEIGHT
+
+
+text_metrics = TextMetrics(_measure, capacity=512)
+
+
+@widget
+class Text(NativeWidget[HeadlessNative]):
+    """
+    Records its ops on its platform's (a `HeadlessBackend`) recorder.
+    """
+
+    text: str = StatefulAttr(init=True, kw_only=False)
+
+    @onupdate(text)
+    def onupdate_text(self, text: str) -> None:
+        self.native.text = text
+        self.request_resize()
+
+    def onupdate_theme(self, attr: ThemedAttr[Any] | None) -> None:
+        pass
+
+    def _build_(
+        self, suggestion: tuple[Pixels, Pixels], *, text: str | State[str]
+    ) -> tuple[NativeElement, tuple[Pixels, Pixels]]:
+        text = self.text
+        dims = text_metrics.size(None, text)
+        native = native_pool.acquire(Text)
+        if native is None:
+            native = native_pool.allocated(HeadlessNative("text", dims, text))
+        else:
+            native.dims = dims
+            native.text = text
+        self.platform.recorder.record("build", native)
+        return native, dims
+
+    def _rebuild_(
+        self, native: NativeElement, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[NativeElement, tuple[Pixels, Pixels]]:
+        # the label already shows the current text, only re-measure it
+        native.dims = dims = text_metrics.size(None, self.text)
+        self.platform.recorder.record("rebuild", native)
+        return native, dims
+
+    def _demolish_(self, native: NativeElement) -> None:
+        self.platform.recorder.record("demolish", native)
+        native_pool.release(Text, native)
+
+    def _place_(
+        self,
+        container: NativeContainer,
+        native: NativeElement,
+        pos: tuple[Pixels, Pixels],
+        abs_pos: tuple[Pixels, Pixels],
+    ) -> None:
+        place(container, native, pos)
+        self.platform.recorder.record("place", native)
+
+    def _pickup_(self, container: NativeContainer, native: NativeElement) -> None:
+        pickup(container, native)
+        self.platform.recorder.record("pickup", native)
+
+    def _move_(
+        self,
+        container: NativeContainer,
+        native: NativeElement,
+        pos: tuple[Pixels, Pixels],
+        abs_pos: tuple[Pixels, Pixels],
+    ) -> None:
+        native.pos = pos
+        self.platform.recorder.record("move", native)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+from tg_gui_core import Pixels, Widget
+from tg_gui_core.platform_support import PlatformBackend
+
+from ..screen import Screen
+
+
+class QtBackend(PlatformBackend):
+    """
+    Native containers are plain QWidgets, children are positioned in them absolutely.
+    """
+
+    name = "qt"
+
+    # container -> how many begin_update calls are open on it
+    _depths: dict[QWidget, int]
+
+    def __init__(self) -> None:
+        self._depths = {}
+
+    def build_container(
+        self, dims: tuple[Pixels, Pixels]
+    ) -> tuple[QWidget, tuple[Pixels, Pixels]]:
+        native = QWidget()
+        native.resize(*dims)
+        return native, dims
+
+    def resize_container(
+        self, native: QWidget, dims: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        native.resize(*dims)
+        return dims
+
+    def demolish_container(self, native: QWidget) -> None:
+        native.deleteLater()
+
+    def place_native(
+        self, container: QWidget, native: QWidget, pos: tuple[Pixels, Pixels]
+    ) -> None:
+        native.setParent(container)
+        native.move(*pos)
+        native.show()
+
+    def pickup_native(self, container: QWidget, native: QWidget) -> None:
+        native.setParent(None)  # type: ignore[call-overload]
+
+    def move_native(
+        self, container: QWidget, native: QWidget, pos: tuple[Pixels, Pixels]
+    ) -> None:
+        native.move(*pos)
+
+    def begin_update(self, container: QWidget) -> None:
+        # one layout and paint for the whole batch instead of one per child
+        depth = self._depths.get(container, 0)
+        if depth == 0:
+            container.setUpdatesEnabled(False)
+        self._depths[container] = depth + 1
+
+    def end_update(self, container: QWidget) -> None:
+        depth = self._depths.pop(container) - 1
+        if depth:
+            # a nested batch, the outermost one re-enables updates
+            self._depths[container] = depth
+        else:
+            container.setUpdatesEnabled(True)
+
+
+def show(root: Widget, dims: tuple[Pixels, Pixels] | None = None) -> Screen:
+    """
+    Shows the root in a new top-level window (320x240 by default), see
+    `tg_gui.runner.main`. The window stays open while the screen is referenced.
+    """
+    # natives can only be made once there is an application
+    QApplication.instance() or QApplication([])
+    screen = Screen.show(root, (320, 240) if dims is None else dims, QtBackend())
+    screen.native.show()
+    return screen
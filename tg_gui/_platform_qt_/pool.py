@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from PySide6.QtWidgets import QWidget
+
+from ..pool import NativePool
+
+
+def _dispose(native: QWidget) -> None:
+    native.deleteLater()
+
+
+# shared by the qt widgets, keyed by the native class (and any fixed configuration)
+native_pool: NativePool[QWidget] = NativePool(capacity=64, dispose=_dispose)
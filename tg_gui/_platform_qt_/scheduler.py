@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+from time import monotonic
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QApplication
+
+from ..scheduler import FrameScheduler
+
+
+def drive_frames(scheduler: FrameScheduler) -> QTimer:
+    """
+    Flushes the scheduler once per frame from a timer on the Qt event loop.
+    The timer runs while the application's event loop runs, keep a reference to it.
+    """
+    timer = QTimer()
+    timer.setTimerType(Qt.TimerType.PreciseTimer)
+    timer.setInterval(round(1000 * scheduler.frame_interval))
+    timer.timeout.connect(scheduler.flush)
+    timer.start()
+    return timer
+
+
+async def run_frames(scheduler: FrameScheduler, running: Callable[[], bool]) -> None:
+    """
+    The asyncio version of `drive_frames`: once per frame, flushes the scheduler and
+    processes pending Qt events, sleeping in between so other tasks can run.
+    """
+    import asyncio
+
+    app = QApplication.instance() or QApplication([])
+    interval = scheduler.frame_interval
+    next_frame = monotonic()
+    while running():
+        scheduler.flush()
+        app.processEvents()
+        next_frame = max(next_frame + interval, monotonic())
+        await asyncio.sleep(next_frame - monotonic())
@@ -1,4 +1,4 @@
-from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6.QtWidgets import QWidget
 
-NativeElement = QtWidgets.QWidget
-NativeContainer = QtWidgets.QWidget
+NativeElement = QWidget
+NativeContainer = QWidget
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
 from PySide6.QtWidgets import QLabel
-from PySide6.QtCore import QSize
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QFont, QFontMetrics
 
 from .shared import NativeElement, NativeContainer
+from .pool import native_pool
 from .._platform_setup_ import *
+from ..text_metrics import TextMetrics
+
+
+def _measure(font: QFont, text: str, wrap_width: int | None) -> tuple[int, int]:
+    metrics = QFontMetrics(font)
+    if wrap_width is None:
+        return metrics.size(0, text).toTuple()  # type: ignore
+    rect = metrics.boundingRect(0, 0, wrap_width, 0, Qt.TextWordWrap, text)  # type: ignore
+    return rect.width(), rect.height()
+
+
+# sizes labels from the font, without showing them
+text_metrics = TextMetrics(_measure, capacity=512, font_key=QFont.key)
 
 
 @widget
@@ -16,23 +31,39 @@ class Text(NativeWidget[QLabel]):
         """
         called when a dependent themed attribute changes
         """
-        raise NotImplementedError
+        # no themed attrs yet, the label is drawn with Qt's default palette
+        pass
 
     @onupdate(text)
     def onupdate_text(self, text: str) -> None:
         self.native.setText(text)
+        # a longer / shorter string changes the label's size hint
+        self.request_resize()
 
     def _build_(
         self, suggestion: tuple[Pixels, Pixels], *, text: str | State[str]
     ) -> tuple[NativeElement, tuple[Pixels, Pixels]]:
-        native = QLabel()
-        native.setText(self.text)
-        native.show()
-        native.hide()
-        return native, native.sizeHint().toTuple()  # type: ignore
+        native = native_pool.acquire(QLabel)
+        if native is None:
+            native = native_pool.allocated(QLabel())
+        text = self.text
+        native.setText(text)
+        dims = text_metrics.size(native.font(), text)
+        native.resize(*dims)
+        return native, dims
+
+    def _rebuild_(
+        self, native: NativeElement, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[NativeElement, tuple[Pixels, Pixels]]:
+        # the label already shows the current text, only re-measure it
+        dims = text_metrics.size(native.font(), self.text)
+        native.resize(*dims)
+        return native, dims
 
     def _demolish_(self, native: NativeElement) -> None:
-        native.destroy()  # TODO: Should this be here?
+        # recycled by the next Text built, the pool deletes it if it is full
+        native.hide()
+        native_pool.release(QLabel, native)
 
     def _place_(
         self,
@@ -42,7 +73,9 @@ class Text(NativeWidget[QLabel]):
         abs_pos: tuple[Pixels, Pixels],
     ) -> None:
         native.setParent(container)  # type: ignore
-        native.move(x=pos[0], y=pos[1])  # type: ignore
+        native.move(*pos)  # type: ignore
+        # recycled labels were hidden when demolished
+        native.show()
 
     def _pickup_(
         self,
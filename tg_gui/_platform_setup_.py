@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, TypeVar
 
 from .shared import Color
 
-from .stateful import State, StatefulAttr
+from .stateful import State, ComputedState, StatefulAttr
 from .theming import ThemedAttr
 
 from .native import NativeWidget
@@ -29,13 +29,23 @@ if TYPE_CHECKING:
         kw_only_default=True,
         field_descriptors=(
             WidgetAttr,
+            ReadOnlyAttr,
+            ReadWriteAttr,
             StatefulAttr,
             ThemedAttr,
         ),
     )
+    @overload
     def widget(cls: Type[_W]) -> Type[_W]:
         ...
 
+    @overload
+    def widget(*, slots: bool = False) -> Callable[[Type[_W]], Type[_W]]:
+        ...
+
+    def widget(cls: Type[_W] | None = None, *, slots: bool = False) -> Any:
+        ...
+
 else:
     from tg_gui_core.attrs import widget
 
@@ -1,9 +1,24 @@
 from tg_gui_core import *
 from ._platform_setup_ import *
-from . import platform
+from ._lazy_ import lazy_getattr as _lazy_getattr
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from . import platform
+    from .platform.text import Text
+
 from .view import View
-from .platform.text import Text
+from .list_view import ListView
+from .runner import Runner, main
+
+# the platform and its widgets are imported on first use, so scripts that only define
+# widgets or run core logic do not load the native toolkit (ex PySide6).
+# they are left out of `__all__` so `from tg_gui.all import *` stays lazy too, import
+# them by name: `from tg_gui.all import Text`
+_platform_attrs = {
+    "platform": "tg_gui.platform",
+    "Text": "tg_gui.platform.text:Text",
+}
+__getattr__ = _lazy_getattr(__name__, _platform_attrs)
+__all__ = [name for name in globals() if not name.startswith("_")]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Tuple
+
+    # x, y, width, height
+    Rect = Tuple[int, int, int, int]
+
+# ---
+
+from tg_gui_core import Pixels
+
+
+class DamageTracker:
+    """
+    Collects the screen areas that changed since the last frame, merging overlapping
+    (or touching) areas so each pixel is refreshed once. Past `max_rects` separate
+    areas they are merged into their bounding box, which bounds the per-frame cost.
+    """
+
+    max_rects: int
+    _rects: list[Rect]
+
+    def __init__(self, max_rects: int = 8) -> None:
+        assert max_rects > 0, f"max_rects must be positive, got {max_rects}"
+        self.max_rects = max_rects
+        self._rects = []
+
+    def add(self, pos: tuple[Pixels, Pixels], dims: tuple[Pixels, Pixels]) -> None:
+        """
+        Marks the area at the absolute position with the given size as changed.
+        """
+        width, height = dims
+        if width <= 0 or height <= 0:
+            return
+        x, y = pos
+        x2, y2 = x + width, y + height
+
+        rects = self._rects
+        index = 0
+        while index < len(rects):
+            rx, ry, rw, rh = rects[index]
+            if rx <= x2 and x <= rx + rw and ry <= y2 and y <= ry + rh:
+                # overlaps or touches, grow the new rect and re-check against the others
+                rects.pop(index)
+                x, y, x2, y2 = min(x, rx), min(y, ry), max(x2, rx + rw), max(y2, ry + rh)
+                index = 0
+            else:
+                index += 1
+        rects.append((x, y, x2 - x, y2 - y))
+
+        if len(rects) > self.max_rects:
+            self._rects = [_bounds(rects)]
+
+    def take(self) -> list[Rect]:
+        """
+        :return: the changed areas since the last call, and forgets them
+        """
+        rects = self._rects
+        self._rects = []
+        return rects
+
+    def __bool__(self) -> bool:
+        return bool(self._rects)
+
+
+def _bounds(rects: list[Rect]) -> Rect:
+    x = min(rect[0] for rect in rects)
+    y = min(rect[1] for rect in rects)
+    x2 = max(rect[0] + rect[2] for rect in rects)
+    y2 = max(rect[1] + rect[3] for rect in rects)
+    return (x, y, x2 - x, y2 - y)
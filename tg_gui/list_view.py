@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from typing import Callable, Sequence, Any
+
+_T = TypeVar("_T")
+
+# ---
+
+from abc import ABC
+
+from tg_gui_core._lib_env import *
+
+from .stateful import State
+
+
+class _Slot(Generic[_T]):
+    """
+    A row widget and the State it shows, rebound to another row when it scrolls out.
+    """
+
+    __slots__ = ("state", "widget", "row")
+
+    state: State[_T]
+    widget: Widget
+    row: int
+
+    def __init__(self, state: State[_T], widget: Widget, row: int) -> None:
+        self.state = state
+        self.widget = widget
+        self.row = row
+
+
+class _RowsLayout(Layout):
+    """
+    Consecutive fixed-height rows, the first one at `top` (negative when scrolled into).
+    """
+
+    __slots__ = ("row_height", "top")
+
+    row_height: Pixels
+    top: Pixels
+
+    def __init__(self, row_height: Pixels, top: Pixels) -> None:
+        self.row_height = row_height
+        self.top = top
+
+    def suggest(
+        self, index: int, count: int, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        return (suggestion[0], self.row_height)
+
+    def arrange(
+        self,
+        dims: Sequence[tuple[Pixels, Pixels]],
+        suggestion: tuple[Pixels, Pixels],
+    ) -> tuple[tuple[Pixels, Pixels], list[tuple[Pixels, Pixels]]]:
+        top = self.top
+        row_height = self.row_height
+        return suggestion, [(0, top + index * row_height) for index in range(len(dims))]
+
+
+# used directly rather than subclassed, so it is slotted itself
+@widget(slots=True)
+class ListView(ContainerWidget, Generic[_T], ABC):
+    """
+    A scrolling list that only builds widgets for the rows in its viewport, plus
+    `overscan` rows above and below, ex:
+    ```
+    ListView(log_lines, lambda line: Text(line), row_height=12)
+    ```
+    `row` is called with a State holding the row's item, once per visible slot. When the
+    list scrolls, slots that leave the viewport are rebound to the rows that enter it by
+    updating their State, so scrolling and memory cost O(visible rows) for any number of rows.
+    The list fills the size it is suggested, rows are `row_height` tall.
+    """
+
+    source: Sequence[_T] = ReadOnlyAttr(init=True, kw_only=False)
+    row: Callable[[State[_T]], Widget] = ReadOnlyAttr(init=True, kw_only=False)
+    row_height: Pixels = ReadOnlyAttr(init=True)
+    overscan: int = ReadOnlyAttr(2, init=True)
+
+    _offset_: Pixels = ReadWriteAttr(0, init=False)
+    # the visible slots, in row order
+    _slots_: list[_Slot[_T]] = ReadWriteAttr(init=False, default_factory=list)
+
+    @property
+    def children(self) -> list[Widget]:
+        return [slot.widget for slot in self._slots_]
+
+    @property
+    def offset(self) -> Pixels:
+        """
+        How far the list is scrolled, in pixels from the top of the first row.
+        """
+        return self._offset_
+
+    def scroll_to(self, offset: Pixels) -> None:
+        """
+        Scrolls so the given pixel offset is at the top of the viewport.
+        """
+        viewport = self._suggestion_[1] if ListView._suggestion_.has_attr(self) else 0
+        bottom = max(0, len(self.source) * self.row_height - viewport)
+        offset = min(max(0, offset), bottom)
+        if offset == self._offset_:
+            return
+        self._offset_ = offset
+        if Widget.native.has_attr(self):
+            self.relayout()
+
+    def refresh(self) -> None:
+        """
+        Re-reads the visible rows from `source`, call after it changes.
+        """
+        source = self.source
+        # rows that resize are re-measured by the relayout, see _measure
+        with ContainerWidget.batch_resizes():
+            for slot in self._slots_:
+                if slot.row < len(source):
+                    slot.state.update(source[slot.row], writer=self)
+            if Widget.native.has_attr(self):
+                self.relayout()
+
+    def _layout_(self) -> Layout:
+        slots = self._slots_
+        first = slots[0].row if slots else 0
+        return _RowsLayout(self.row_height, first * self.row_height - self._offset_)
+
+    def _measure(self, suggestion: tuple[Pixels, Pixels]) -> tuple[Pixels, Pixels]:
+        # rebound rows that resize (ex Text) are marked dirty and re-measured once below,
+        # not laid out once per row while the others are still being rebound
+        with ContainerWidget.batch_resizes():
+            self._sync_slots(suggestion[1])
+            return super()._measure(suggestion)
+
+    def _sync_slots(self, viewport: Pixels) -> None:
+        """
+        Binds a slot to each row in the viewport (plus overscan), reusing the slots
+        of rows that are still visible as they are and rebinding the others.
+        """
+        source = self.source
+        row_height = self.row_height
+        offset = self._offset_
+        first = max(0, offset // row_height - self.overscan)
+        end = min(len(source), -(-(offset + viewport) // row_height) + self.overscan)
+
+        kept: dict[int, _Slot[_T]] = {}
+        spare: list[_Slot[_T]] = []
+        for slot in self._slots_:
+            if first <= slot.row < end:
+                kept[slot.row] = slot
+            else:
+                spare.append(slot)
+
+        slots: list[_Slot[_T]] = []
+        for row in range(first, end):
+            slot = kept.get(row)
+            if slot is None:
+                if spare:
+                    slot = spare.pop()
+                    slot.row = row
+                    slot.state.update(source[row], writer=self)
+                else:
+                    state = State(source[row])
+                    slot = _Slot(state, self.row(state), row)
+            slots.append(slot)
+        # slots still spare are dropped, the layout pass demolishes their widgets
+        self._slots_ = slots
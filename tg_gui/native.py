@@ -19,7 +19,7 @@ from abc import ABC, abstractmethod
 from tg_gui_core import (
     Pixels,
     Widget,
-    WidgetAttr,
+    ReadWriteAttr,
     widget,
     implementation_support as impl_support,
 )
@@ -34,18 +34,21 @@ from .theming import ThemedAttr
 
 @widget
 class NativeWidget(Widget, ABC, Generic[_NE]):
+    __slots__ = ()
 
-    native: _NE = WidgetAttr(init=False)
+    native: _NE = ReadWriteAttr(init=False)
 
     def build(self, suggestion: tuple[Pixels, Pixels]) -> None:
         # see super()._build_ for docs
         # dins the stateful attrs and pass it to the build method
+        # demolishing / unnesting releases the subscriptions, restore them
+        self._restore_attrs()
         stateful_attr_values = {
             name: attr.get_raw_attr(self)
             for name, attr in self.__widget_attrs__.items()
             if isinstance(attr, StatefulAttr)
         }
-        super().build(suggestion, **stateful_attr_values)
+        self.native, self.dims = self._build_(suggestion, **stateful_attr_values)
         self.onupdate_theme(None)
 
     @abstractmethod
@@ -63,7 +66,7 @@ class NativeWidget(Widget, ABC, Generic[_NE]):
             self,
             suggestion: tuple[Pixels, Pixels],
             **kwargs: Any | State[Any],
-        ) -> None:
+        ) -> tuple[_NE, tuple[Pixels, Pixels]]:
             raise NotImplementedError
 
         @abstractmethod
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from typing import Callable, Hashable, Iterable, Any
+
+_P = TypeVar("_P")
+
+# ---
+
+
+def rgb565(color: int) -> int:
+    """
+    :return: the 0xRRGGBB color in the RGB565 pixel format most small displays use
+    """
+    return ((color >> 8) & 0xF800) | ((color >> 5) & 0x07E0) | ((color >> 3) & 0x001F)
+
+
+def rgb565_bulk(colors: Iterable[int]) -> Any:
+    """
+    Converts many 0xRRGGBB colors at once, ex for a backend rendering into a framebuffer.
+    :return: a uint16 NumPy array when NumPy is installed (vectorized), otherwise a list
+    """
+    try:
+        import numpy
+    except ImportError:
+        return [rgb565(color) for color in colors]
+
+    if isinstance(colors, numpy.ndarray):
+        rgb = colors.astype(numpy.uint32, copy=False)
+    else:
+        rgb = numpy.fromiter(colors, dtype=numpy.uint32)
+    return (
+        ((rgb >> 8) & 0xF800) | ((rgb >> 5) & 0x07E0) | ((rgb >> 3) & 0x001F)
+    ).astype(numpy.uint16)
+
+
+class _Entry(Generic[_P]):
+    __slots__ = ("palette", "color", "refs")
+
+    palette: _P
+    color: int
+    refs: int
+
+    def __init__(self, palette: _P, color: int) -> None:
+        self.palette = palette
+        self.color = color
+        self.refs = 0
+
+
+class SharedPalettes(Generic[_P]):
+    """
+    Shares one native palette (ex a `displayio.Palette`) between every widget drawn in
+    the same color, instead of one per widget, ex:
+    ```
+    palette = palettes.acquire(Color.white)
+    ...
+    palettes.release(Color.white)
+    ```
+    Palettes are keyed by the color, or by the `State` a color comes from (ex a theme
+    color) so `recolor(state, color)` updates every widget using it with one write.
+    A palette is dropped when its last user releases it.
+    """
+
+    writes: int
+
+    _make: Callable[[int], _P]
+    _write: Callable[[_P, int], None]
+    _entries: dict[Hashable, _Entry[_P]]
+
+    def __init__(
+        self, make: Callable[[int], _P], write: Callable[[_P, int], None]
+    ) -> None:
+        """
+        :param make: makes a native palette showing the color
+        :param write: changes the color a native palette shows
+        """
+        self._make = make
+        self._write = write
+        self._entries = {}
+        self.writes = 0
+
+    def acquire(self, key: Hashable, color: int | None = None) -> _P:
+        """
+        :param color: the color to show for a new key, the key itself by default
+        :return: the palette shared by the key's users
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            color = key if color is None else color  # type: ignore[assignment]
+            assert isinstance(color, int), f"no color given for {key!r}"
+            entry = self._entries[key] = _Entry(self._make(color), color)
+            self.writes += 1
+        entry.refs += 1
+        return entry.palette
+
+    def release(self, key: Hashable) -> None:
+        entry = self._entries[key]
+        entry.refs -= 1
+        if entry.refs == 0:
+            del self._entries[key]
+
+    def recolor(self, key: Hashable, color: int) -> None:
+        """
+        Changes the color every user of the key shows, one palette write.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.color == color:
+            return
+        entry.color = color
+        self._write(entry.palette, color)
+        self.writes += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -8,7 +8,14 @@ from sys import implementation as _implementation, modules as _sys_modules
 
 
 if TYPE_CHECKING or _implementation.name == "cpython":
-    from .. import _platform_qt_ as _platform_  # type: ignore
+    from os import environ as _environ
+
+    # TG_GUI_PLATFORM=headless runs without a native toolkit, ex for tests and benchmarks
+    if not TYPE_CHECKING and _environ.get("TG_GUI_PLATFORM") == "headless":
+        from .. import _platform_headless_ as _platform_  # type: ignore
+    else:
+        from .. import _platform_qt_ as _platform_  # type: ignore
+    del _environ
 elif _implementation.name == "circuitpython":
     from .. import _platform_displayio_ as _platform_  # type: ignore
 else:
@@ -0,0 +1,16 @@
+from typing import Any
+
+from tg_gui_core import Pixels, Widget
+
+from ..screen import Screen
+
+def show(
+    root: Widget, dims: tuple[Pixels, Pixels] | None = None, *platform_args: Any
+) -> Screen:
+    """
+    Shows the root widget on a new `Screen`, the one `tg_gui.runner.main` uses.
+    - qt: `show(root, dims=None)`, in a new top-level window (320x240 by default)
+    - displayio: `show(root, dims=None, display)`, as the display's root group
+    - headless: `show(root, dims=None)`, on a 320x240 screen by default
+    """
+    ...
@@ -0,0 +1,5 @@
+from ..pool import NativePool
+from .shared import NativeElement
+
+# the platform's shared pool of native elements, see `tg_gui.pool.NativePool`
+native_pool: NativePool[NativeElement]
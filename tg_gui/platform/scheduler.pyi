@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from ..scheduler import FrameScheduler
+
+def drive_frames(scheduler: FrameScheduler, *args: Any) -> Any:
+    """
+    Flushes the scheduler once per frame using the platform's event or refresh loop.
+    - qt: `drive_frames(scheduler) -> QTimer`, runs on the Qt event loop
+    - displayio: `drive_frames(scheduler, display, damage=None) -> None`, runs the refresh
+      loop forever, only refreshing damaged areas when given a `DamageTracker`
+    """
+    ...
+
+async def run_frames(
+    scheduler: FrameScheduler, running: Callable[[], bool], *args: Any
+) -> None:
+    """
+    The asyncio version of `drive_frames`, runs once per frame while `running()` is true.
+    - qt: `run_frames(scheduler, running)`, also processes pending Qt events
+    - displayio: `run_frames(scheduler, running, display, damage=None)`
+    """
+    ...
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from typing import Callable, Hashable, Any
+
+_NE = TypeVar("_NE")
+
+# ---
+
+import gc as _gc
+
+
+class NativePool(Generic[_NE]):
+    """
+    Recycles native elements (ex QLabels, displayio labels) between widgets instead of
+    allocating a new one per build, which fragments the heap and causes gc pauses
+    on CircuitPython. Elements are pooled by a key of the widget class and whatever
+    configuration the element can't change after it is made (ex its font), ex:
+    ```
+    native = native_pool.acquire(key)
+    if native is None:
+        native = native_pool.allocated(QLabel())
+    ...
+    native_pool.release(key, native)
+    ```
+    Once `capacity` elements are pooled, releasing another evicts (disposes) an element
+    of the least recently used key. Only released elements count toward the capacity,
+    elements in use are not tracked.
+    """
+
+    capacity: int
+
+    # key -> idle elements, keys are re-inserted when used so the first is the least recent
+    _free: dict[Hashable, list[_NE]]
+    _pooled: int
+    _dispose: Callable[[_NE], None] | None
+
+    # counts, see stats()
+    allocations: int
+    reuses: int
+    evictions: int
+
+    def __init__(
+        self, capacity: int, dispose: Callable[[_NE], None] | None = None
+    ) -> None:
+        """
+        :param capacity: the most idle elements kept, across all keys
+        :param dispose: called with each evicted element, ex to delete the native widget
+        """
+        assert capacity >= 0, f"capacity must not be negative, got {capacity}"
+        self.capacity = capacity
+        self._dispose = dispose
+        self._free = {}
+        self._pooled = 0
+        self.allocations = 0
+        self.reuses = 0
+        self.evictions = 0
+
+    def acquire(self, key: Hashable) -> _NE | None:
+        """
+        :return: an idle element for the key or None, the caller then allocates one
+        """
+        free = self._free.get(key)
+        if not free:
+            return None
+        native = free.pop()
+        self._pooled -= 1
+        self._touch(key, free)
+        self.reuses += 1
+        return native
+
+    def allocated(self, native: _NE) -> _NE:
+        """
+        Counts an element the caller had to allocate, returns it for chaining.
+        """
+        self.allocations += 1
+        return native
+
+    def release(self, key: Hashable, native: _NE) -> None:
+        """
+        Returns an element to the pool, it must already be removed from its container.
+        """
+        if self.capacity == 0:
+            self._evict(native)
+            return
+        if self._pooled >= self.capacity:
+            self._evict_least_recent()
+        free = self._free.get(key)
+        if free is None:
+            self._free[key] = free = []
+        free.append(native)
+        self._pooled += 1
+        self._touch(key, free)
+
+    def clear(self) -> None:
+        """
+        Disposes every idle element.
+        """
+        free = self._free
+        self._free = {}
+        self._pooled = 0
+        for natives in free.values():
+            for native in natives:
+                self._evict(native)
+
+    def stats(self) -> dict[str, int]:
+        """
+        :return: the pool's counts and the interpreter's gc counts, for tuning `capacity`:
+            - allocations, reuses, evictions: since the pool was made
+            - pooled: idle elements right now
+            - gc_collections (cpython): collections run so far
+            - mem_free / mem_alloc (circuitpython): heap bytes
+        """
+        stats = {
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+            "evictions": self.evictions,
+            "pooled": self._pooled,
+        }
+        if hasattr(_gc, "get_stats"):
+            stats["gc_collections"] = sum(gen["collections"] for gen in _gc.get_stats())
+        elif hasattr(_gc, "mem_free"):
+            stats["mem_free"] = _gc.mem_free()  # type: ignore[attr-defined]
+            stats["mem_alloc"] = _gc.mem_alloc()  # type: ignore[attr-defined]
+        return stats
+
+    def _touch(self, key: Hashable, free: list[_NE]) -> None:
+        # move the key to the end, the most recently used.
+        # NOTE: on CircuitPython dicts may not keep insertion order, eviction is then by any key
+        del self._free[key]
+        if free:
+            self._free[key] = free
+
+    def _evict_least_recent(self) -> None:
+        key = next(iter(self._free))
+        free = self._free[key]
+        # the oldest element of that key
+        native = free.pop(0)
+        self._pooled -= 1
+        if not free:
+            del self._free[key]
+        self._evict(native)
+
+    def _evict(self, native: _NE) -> None:
+        self.evictions += 1
+        if self._dispose is not None:
+            self._dispose(native)
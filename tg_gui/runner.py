@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Coroutine, Type
+    from asyncio import Task
+    from tg_gui_core import Pixels, Widget
+    from .screen import Screen
+
+    _RunFrames = Callable[..., Coroutine[Any, Any, None]]
+
+# ---
+
+from .scheduler import FrameScheduler
+
+
+class Runner:
+    """
+    Runs an app on asyncio: the platform's frame loop (flushing state updates and
+    refreshing the native ui) runs as one task next to the app's own coroutines, ex:
+    ```
+    async def acquire(runner):
+        while True:
+            reading.update(await sensor.read(), writer=runner)
+
+    runner = main(Application)
+    runner.run(acquire(runner))
+    ```
+    Coroutines can `await state.changed()` and call `State.update` without blocking rendering.
+    If one of them raises, the runner stops and `run()` re-raises the error.
+    On CircuitPython pass the display: `main(Application, display=board.DISPLAY)`.
+    """
+
+    scheduler: FrameScheduler
+    id: int
+    # the screen showing the app's root, see `main`
+    screen: Screen | None
+
+    _platform_args: tuple[Any, ...]
+    _running: bool
+    _error: BaseException | None
+
+    def __init__(self, *, fps: int = 30, display: Any = None) -> None:
+        from tg_gui_core import UID
+
+        # runners can write to states, so they are Identifiable
+        self.id = UID()
+        self.scheduler = FrameScheduler(fps)
+        self.screen = None
+        self._platform_args = () if display is None else (display,)
+        self._running = False
+        self._error = None
+
+    def run(self, *coroutines: Coroutine[Any, Any, Any]) -> None:
+        """
+        Runs the frame loop and the given coroutines until `stop()` is called
+        or one of the coroutines raises.
+        """
+        import asyncio
+
+        asyncio.run(self._main(coroutines))
+
+    def stop(self) -> None:
+        """
+        Stops the frame loop after the current frame, `run()` then returns.
+        """
+        self._running = False
+
+    def create_task(self, coroutine: Coroutine[Any, Any, Any]) -> Task[Any]:
+        """
+        Starts a coroutine alongside the frame loop, call from inside a running app.
+        Like the coroutines passed to `run()`, an error in it stops the runner.
+        """
+        import asyncio
+
+        task = asyncio.create_task(coroutine)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _run_frames(self) -> _RunFrames:
+        # imported here so the platform (and its native toolkit) load only when run
+        from .platform.scheduler import run_frames
+
+        return run_frames
+
+    async def _main(self, coroutines: tuple[Coroutine[Any, Any, Any], ...]) -> None:
+        import asyncio
+
+        self._running = True
+        self._error = None
+        self.scheduler.install()
+        tasks = [self.create_task(coroutine) for coroutine in coroutines]
+        try:
+            await self._run_frames()(
+                self.scheduler, self._is_running, *self._platform_args
+            )
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.scheduler.uninstall()
+
+        if self._error is not None:
+            raise self._error
+
+    def _on_task_done(self, task: Task[Any]) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None and self._error is None:
+            self._error = error
+            self.stop()
+
+    def _is_running(self) -> bool:
+        return self._running
+
+
+def main(
+    root_cls: Type[Widget],
+    *,
+    dims: tuple[Pixels, Pixels] | None = None,
+    fps: int = 30,
+    display: Any = None,
+) -> Runner:
+    """
+    Creates the root widget, shows it with the platform (in a window, or on the display)
+    and returns a `Runner` for it, call `.run(...)` to start the app.
+    :param dims: the size of the window, the display's size on displayio
+    """
+    # imported here so the platform (and its native toolkit) load only when run
+    from .platform.backend import show
+
+    runner = Runner(fps=fps, display=display)
+    runner.screen = show(root_cls(), dims, *runner._platform_args)
+    return runner
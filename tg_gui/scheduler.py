@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+    from tg_gui_core import UID
+    from .stateful import State
+
+# ---
+
+from time import monotonic as _monotonic
+
+from tg_gui_core import ContainerWidget
+
+from .stateful import State
+
+
+class FrameScheduler:
+    """
+    Defers `State` subscriber notifications (the `onupdate_*` callbacks) to the next frame.
+    While installed, a `State.update` only marks its subscribers dirty. `flush()` then calls
+    each dirty subscriber once with the state's latest value, so a value that changes
+    hundreds of times per second only reaches the native element at the frame rate.
+
+    The platform drives `flush()`, see `tg_gui.platform.scheduler.drive_frames(...)`.
+    """
+
+    fps: int
+    frame_interval: float
+
+    # (state, subscriber uid) -> None, used as an ordered set
+    _dirty: dict[tuple[State[Any], UID], None]
+    _last_flush: float
+
+    def __init__(self, fps: int = 30) -> None:
+        assert fps > 0, f"fps must be positive, got {fps}"
+        self.fps = fps
+        self.frame_interval = 1 / fps
+        self._dirty = {}
+        self._last_flush = 0.0
+
+    def install(self) -> FrameScheduler:
+        """
+        Routes all `State` notifications through this scheduler.
+        """
+        assert (
+            State._scheduler is None or State._scheduler is self
+        ), f"another scheduler is already installed, {State._scheduler}"
+        State._scheduler = self
+        return self
+
+    def uninstall(self) -> None:
+        """
+        Restores synchronous notifications, flushing anything still pending.
+        """
+        assert State._scheduler is self, f"{self} is not installed"
+        State._scheduler = None
+        self.flush()
+
+    def mark_dirty(self, state: State[Any], subscriber: UID) -> None:
+        self._dirty[(state, subscriber)] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    def flush(self) -> int:
+        """
+        Applies the values posted from other threads (see `State.post`), then calls the
+        `onupdate` of each dirty subscriber with its state's current value.
+        Updates made by those callbacks are deferred to the next flush.
+        :return: the number of callbacks called
+        """
+        self._last_flush = _monotonic()
+        # apply the values worker threads posted since the last frame
+        State.drain_posted()
+        if not self._dirty:
+            return 0
+
+        dirty = self._dirty
+        self._dirty = {}
+        called = 0
+        # widgets resized by the callbacks are laid out once, after all of them
+        with ContainerWidget.batch_resizes():
+            for key in dirty:
+                state, uid = key
+                # the subscriber may have unsubscribed since it was marked
+                onupdate = state._subscriber_onupdate(uid)
+                if onupdate is None:
+                    continue
+                try:
+                    onupdate(state._value)
+                except BaseException:
+                    # re-queue the subscribers after the failing one for the next flush
+                    remaining = list(dirty)
+                    for later in remaining[remaining.index(key) + 1 :]:
+                        self._dirty[later] = None
+                    raise
+                called += 1
+        return called
+
+    def tick(self) -> bool:
+        """
+        Flushes if at least one frame interval has passed since the last flush,
+        for use in hand-written loops.
+        :return: True if it flushed
+        """
+        if _monotonic() - self._last_flush >= self.frame_interval:
+            self.flush()
+            return True
+        else:
+            return False
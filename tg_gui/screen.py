@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from tg_gui_core import Pixels, Widget, ContainerWidget, ReadOnlyAttr, widget
+from tg_gui_core.platform_support import PlatformBackend
+
+
+@widget
+class Screen(ContainerWidget):
+    """
+    The top of a widget tree, it stands in for a window or display of `dims`
+    and shows one root widget in the corner, ex:
+    ```
+    screen = Screen.show(root, (320, 240))
+    ```
+    Each platform's `backend.show` puts a screen's native container on screen.
+    """
+
+    root: Widget = ReadOnlyAttr(init=True, kw_only=False)
+
+    @property
+    def children(self) -> list[Widget]:
+        return [self.root]
+
+    @classmethod
+    def show(
+        cls,
+        root: Widget,
+        dims: tuple[Pixels, Pixels],
+        backend: PlatformBackend | None = None,
+    ) -> Screen:
+        """
+        :param backend: a `HeadlessBackend` by default, any backend's containers work
+        """
+        if backend is None:
+            from ._platform_headless_.backend import HeadlessBackend
+
+            backend = HeadlessBackend()
+
+        screen = cls(root)
+        screen.platform = backend
+        screen.build(dims)
+        # the screen is never placed in anything, pin it at the origin
+        screen.pos = (0, 0)
+        screen.abs_pos = (0, 0)
+        screen._arrange()
+        return screen
@@ -15,8 +15,10 @@ if TYPE_CHECKING:
         Type,
         TypeGuard,
         TypeAlias,
+        MutableMapping,
     )
     from typing_extensions import Self
+    from .scheduler import FrameScheduler
 
     _C = TypeVar("_C", bound="Callable")
 
@@ -27,6 +29,27 @@ if TYPE_CHECKING:
 
 # ---
 
+try:
+    from weakref import WeakMethod as _WeakMethod, WeakKeyDictionary as _Dependents
+    from types import MethodType as _MethodType
+except ImportError:
+    # circuitpython has no weakref, subscriptions are strong and rely on
+    # widgets unsubscribing when demolished or unnested
+    _WeakMethod = None  # type: ignore[assignment, misc]
+    _Dependents = dict  # type: ignore[assignment, misc]
+
+try:
+    from collections import deque as _deque
+
+    # (state, value) pairs posted from other threads, see State.post()
+    # deque.append and .popleft are atomic, so posting needs no lock
+    _posted = _deque()
+    _posted_popleft = _posted.popleft
+except (ImportError, TypeError):
+    # circuitpython has no threads (and its deque requires a maxlen)
+    _posted = []  # type: ignore[assignment]
+    _posted_popleft = lambda: _posted.pop(0)  # type: ignore[assignment]
+
 _T = TypeVar("_T")
 _Widget = Widget
 
@@ -67,25 +90,159 @@ class State(Generic[_T]):
 
     _value: _T
     _subscribed: dict[UID, _OnupdateCallback[_T]]
+    # the ComputedStates that read this state, used as an ordered set
+    # held weakly, so a ComputedState nothing uses anymore is not kept alive (or
+    # invalidated on every update) by its sources
+    _dependents: MutableMapping[ComputedState[Any], None]
+    # [event, value] pairs for the coroutines awaiting .changed(), allocated on first use
+    _waiters: list[list[Any]] | None
+
+    # the sources being collected by the ComputedState currently computing, if any
+    _tracking: ClassVar[dict[State[Any], None] | None] = None
+
+    # when set, notifications are deferred to the next frame, see tg_gui.scheduler
+    _scheduler: ClassVar[FrameScheduler | None] = None
+
+    # --- batching, see State.batch() ---
+    _batch_depth: ClassVar[int] = 0
+    # state -> (value before the batch, last writer), in first-write order
+    _batched: ClassVar[dict[State[Any], tuple[Any, Identifiable]]] = {}
+
+    @staticmethod
+    def batch() -> _StateBatch:
+        """
+        Returns a context manager that defers subscriber notifications until it exits, ex:
+        ```
+        with State.batch():
+            reading.update(21.5, writer=sensor)
+            units.update("C", writer=sensor)
+        ```
+        Values update immediately, but each changed State notifies its subscribers once
+        with its final value (skipping its last writer) when the outermost batch exits.
+        States that end the batch with their original value do not notify.
+        """
+        return _state_batch
+
+    def post(self, value: _T) -> None:
+        """
+        Thread-safe update, for worker threads: queues the value for the ui thread
+        instead of updating the state (and running native callbacks) on this thread.
+        The ui thread applies the queued values with `State.drain_posted()`, which the
+        frame scheduler calls once per frame.
+        """
+        _posted.append((self, value))
+
+    @staticmethod
+    def drain_posted() -> int:
+        """
+        Applies the values queued by `State.post(...)`, call on the ui thread.
+        Only the latest value posted to each state is applied and the updates are batched.
+        :return: the number of states updated
+        """
+        latest: dict[State[Any], Any] = {}
+        try:
+            while True:
+                state, value = _posted_popleft()
+                latest[state] = value
+        except IndexError:
+            pass
+
+        if len(latest):
+            with _state_batch:
+                for state, value in latest.items():
+                    state.update(value, writer=_posted_writer)
+        return len(latest)
 
     def get_proxy(self, owner: Widget) -> Proxy[_T]:
         return self
 
     def value(self, *, reader: Identifiable) -> _T:
+        tracking = State._tracking
+        if tracking is not None:
+            tracking[self] = None
         return self._value
 
     def update(self, value: _T, *, writer: Identifiable) -> None:
         if value == self._value:
             return
 
+        # mark the dependent computed states first so anything notified reads fresh values
+        stale = ComputedState._invalidate(self) if self._dependents else ()
+
+        if State._batch_depth:
+            batched = State._batched
+            original = batched[self][0] if self in batched else self._value
+            batched[self] = (original, writer)
+            for computed in stale:
+                batched.setdefault(computed, (Missing, computed))
+            self._value = value
+            return
+
         self._value = value
+        self._notify(value, writer)
+        for computed in stale:
+            computed._refresh()
 
-        #
-        for uid, onupdate in self._subscribed.items():
+    async def changed(self) -> _T:
+        """
+        Waits for the next change to this state and returns the value it changed to
+        (even if more updates land before the awaiting coroutine resumes), ex:
+        ```
+        async def log_readings():
+            while True:
+                print(await reading.changed())
+        ```
+        """
+        import asyncio  # only needed by async apps
+
+        # the notifying value is stored next to the event, asyncio.Future is
+        # not available on circuitpython
+        waiter = [asyncio.Event()]
+        if self._waiters is None:
+            self._waiters = []
+        self._waiters.append(waiter)
+        await waiter[0].wait()
+        return waiter[1]
+
+    def _notify(self, value: _T, writer: Identifiable) -> None:
+        waiters = self._waiters
+        if waiters is not None:
+            self._waiters = None
+            for waiter in waiters:
+                waiter.append(value)
+                waiter[0].set()
+
+        scheduler = State._scheduler
+        # iterate a snapshot, callbacks may (un)subscribe widgets as they rebuild
+        for uid, onupdate in tuple(self._subscribed.items()):
             if uid == writer.id:
                 continue
+            if scheduler is not None:
+                scheduler.mark_dirty(self, uid)
+                continue
+            if onupdate.__class__ is _WeakMethod:
+                onupdate = onupdate()
+                if onupdate is None:
+                    # the subscriber was garbage collected, prune it
+                    self._subscribed.pop(uid, None)
+                    continue
             onupdate(value)
 
+    def _subscriber_onupdate(self, uid: UID) -> _OnupdateCallback[_T] | None:
+        """
+        Returns the onupdate callback for a subscriber, or None if it is no longer subscribed.
+        """
+        onupdate = self._subscribed.get(uid, None)
+        if onupdate.__class__ is _WeakMethod:
+            onupdate = onupdate()
+            if onupdate is None:
+                self._subscribed.pop(uid, None)
+        return onupdate
+
+    def _flush_batched(self, original: _T, writer: Identifiable) -> None:
+        if self._value != original:
+            self._notify(self._value, writer)
+
     def subscribe(
         self,
         *,
@@ -95,6 +252,10 @@ class State(Generic[_T]):
         if subscriber.id in self._subscribed:
             raise ValueError(f"{subscriber} is already subscribed to {self}")
 
+        # hold bound methods weakly so a subscription does not keep its widget alive
+        if _WeakMethod is not None and isinstance(onupdate, _MethodType):
+            onupdate = _WeakMethod(onupdate)  # type: ignore[assignment]
+
         self._subscribed[subscriber.id] = onupdate
 
         return self
@@ -135,6 +296,201 @@ class State(Generic[_T]):
             # TODO: allow write locking based on id
             self._value = value
             self._subscribed: dict[UID, _OnupdateCallback[_T]] = {}
+            self._dependents = _Dependents()
+            self._waiters = None
+
+
+class _StateBatch:
+    """
+    The context manager returned by `State.batch()`, batches may be nested.
+    """
+
+    def __enter__(self) -> None:
+        State._batch_depth += 1
+        # widgets resized by the notifications are laid out once, after all of them
+        _resize_batch.__enter__()
+
+    def __exit__(self, *exc_info: object) -> None:
+        State._batch_depth -= 1
+        if State._batch_depth:
+            _resize_batch.__exit__()
+            return
+
+        # notify once per changed state, after all the writes in the batch
+        batched = State._batched
+        State._batched = {}
+        try:
+            for state, (original, writer) in batched.items():
+                state._flush_batched(original, writer)
+        finally:
+            _resize_batch.__exit__()
+
+
+_resize_batch = ContainerWidget.batch_resizes()
+
+
+_state_batch = _StateBatch()
+
+
+class _PostedWriter:
+    """
+    The writer of the values applied by `State.drain_posted()`, it never subscribes
+    so no subscriber is skipped.
+    """
+
+    id: UID
+
+    def __init__(self) -> None:
+        self.id = UID()
+
+
+_posted_writer = _PostedWriter()
+
+
+# ComputedState staleness levels
+_CLEAN = 0
+_CHECK = 1  # a source further up may have changed
+_DIRTY = 2  # a direct source changed
+
+
+class ComputedState(State[_T]):
+    """
+    A read-only State derived from other States, ex:
+    ```
+    label = ComputedState(
+        lambda reader: f"{reading.value(reader=reader)} {units.value(reader=reader)}"
+    )
+    ```
+    The States read while computing are recorded as its sources. When a source changes
+    the ComputedState is only marked stale, it recomputes when it is read (or when it
+    has subscribers to notify). Staleness is propagated before anything recomputes,
+    so diamond-shaped dependencies recompute each ComputedState at most once per
+    change and never see a mix of old and new values.
+    """
+
+    id: UID
+    _compute: Callable[[ComputedState[_T]], _T]
+    _sources: dict[State[Any], None]
+    _level: int
+    # the last value subscribers have seen
+    _notified: _T | MissingType
+
+    def value(self, *, reader: Identifiable) -> _T:
+        if self._level:
+            self._update_if_necessary()
+        tracking = State._tracking
+        if tracking is not None:
+            tracking[self] = None
+        return self._value
+
+    def update(self, value: _T, *, writer: Identifiable) -> None:
+        raise TypeError(f"{self} is a ComputedState and cannot be updated, by {writer}")
+
+    def subscribe(
+        self,
+        *,
+        subscriber: Identifiable,
+        onupdate: _OnupdateCallback[_T],
+    ) -> Self:
+        # compute first so there are sources to be notified by
+        self.value(reader=self)
+        return State.subscribe(self, subscriber=subscriber, onupdate=onupdate)
+
+    async def changed(self) -> _T:
+        # compute first so there are sources to be notified by
+        self.value(reader=self)
+        return await State.changed(self)
+
+    def _flush_batched(self, original: _T, writer: Identifiable) -> None:
+        self._refresh()
+
+    @staticmethod
+    def _invalidate(source: State[Any]) -> list[ComputedState[Any]]:
+        """
+        Marks the dependents of a changed source stale.
+        :return: the newly stale computed states that have subscribers to notify
+        """
+        stale: list[ComputedState[Any]] = []
+        for computed in source._dependents:
+            computed._mark(_DIRTY, stale)
+        return stale
+
+    def _mark(self, level: int, stale: list[ComputedState[Any]]) -> None:
+        if self._level >= level:
+            return
+        was_clean = self._level == _CLEAN
+        self._level = level
+        if was_clean:
+            if len(self._subscribed) or self._waiters is not None:
+                stale.append(self)
+            for computed in self._dependents:
+                computed._mark(_CHECK, stale)
+
+    def _update_if_necessary(self) -> None:
+        # only recompute if a source actually changed
+        if self._level == _CHECK:
+            for source in self._sources:
+                if isinstance(source, ComputedState):
+                    source._update_if_necessary()
+                    if self._level == _DIRTY:
+                        break
+
+        if self._level == _DIRTY:
+            self._recompute()
+
+        self._level = _CLEAN
+
+    def _recompute(self) -> None:
+        outer = State._tracking
+        State._tracking = sources = {}
+        try:
+            value = self._compute(self)
+        finally:
+            State._tracking = outer
+
+        # re-link to this computation's sources
+        for source in self._sources:
+            if source not in sources:
+                source._dependents.pop(self, None)
+        for source in sources:
+            source._dependents[self] = None
+        self._sources = sources
+
+        self._level = _CLEAN
+        if self._notified is Missing:
+            self._notified = value
+        if value != self._value:
+            self._value = value
+            for computed in self._dependents:
+                computed._level = _DIRTY
+
+    def _refresh(self) -> None:
+        """
+        Recomputes (if stale) and notifies the subscribers if the value changed.
+        """
+        if not len(self._subscribed) and self._waiters is None:
+            return
+        value = self.value(reader=self)
+        if value != self._notified:
+            self._notified = value
+            self._notify(value, self)
+
+    if TYPE_CHECKING:
+
+        def __new__(
+            cls: type[Self], compute: Callable[[ComputedState[_T]], _T]
+        ) -> _T:
+            ...
+
+    else:
+
+        def __init__(self, compute: Callable[[ComputedState[_T]], _T]) -> None:
+            State.__init__(self, Missing)
+            self.id = UID()
+            self._compute = compute
+            self._sources = {}
+            self._level = _DIRTY
+            self._notified = Missing
 
 
 _T = TypeVar("_T")
@@ -154,9 +510,41 @@ class StatefulAttr(WidgetAttr[_T]):
 
     def del_attr(self, owner: _Widget) -> None:
         # unsubscribe from the old state if it is a state
-        existing = self.get_raw_attr(owner)
-        if isstate(existing):
+        existing = getattr(owner, self.private_name, Missing)
+        if existing is not Missing and isstate(existing):
+            existing.unsubscribe(subscriber=owner)
+
+    def restore_attr(self, owner: _Widget) -> None:
+        """
+        Re-subscribes the owner to its state after `del_attr` released it, ex when an
+        unnested widget is nested again or a demolished one is built again.
+        """
+        existing = getattr(owner, self.private_name, Missing)
+        if existing is not Missing and isstate(existing):
+            # unsubscribe first so this is a no-op if it was never released
             existing.unsubscribe(subscriber=owner)
+            self._subscribe_to_state(owner, existing)
+
+    def rebind(self, owner: _Widget, value: _T | State[_T]) -> None:
+        """
+        Binds the attribute to a new value or State, ex when a reconciled or recycled
+        widget is given new data. A built owner's onupdate is called if the value changed.
+        """
+        existing = getattr(owner, self.private_name, Missing)
+        if value is existing:
+            return
+        self.del_attr(owner)
+        setattr(owner, self.private_name, value)
+        if isstate(value):
+            self._subscribe_to_state(owner, value)
+
+        if self._onupdate is None or not Widget.native.has_attr(owner):
+            return
+        new = value.value(reader=owner) if isstate(value) else value
+        if existing is not Missing and isstate(existing):
+            existing = existing.value(reader=owner)
+        if new != existing:
+            getattr(owner, self._onupdate.__name__)(new)
 
     def get_raw_attr(self, widget: _Widget) -> _T | State[_T]:
         """
@@ -175,6 +563,21 @@ class StatefulAttr(WidgetAttr[_T]):
 
         return value
 
+    # typed by WidgetAttr.__get__'s overloads
+    if not TYPE_CHECKING:
+
+        def __get__(self, owner, ownertype):
+            # inlined get_raw_attr + get_attr, one lookup on the hit path
+            if owner is None:
+                return self
+            attr = getattr(owner, self.private_name, Missing)
+            if attr is Missing:
+                raise self._missing_error(owner)
+            elif isinstance(attr, State):
+                return attr.value(reader=owner)
+            else:
+                return attr
+
     def get_proxy(self, owner: _Widget) -> State[_T]:
         existing = self.get_raw_attr(owner)
 
@@ -272,6 +675,9 @@ class StatefulAttr(WidgetAttr[_T]):
             ), f"{self.__class__.__name__}(...) got arguments for 'factory' and 'kw_only', only one is allowed."
             super(StatefulAttr, self).__widattr_init__(default_factory=factory, init=True)  # type: ignore
         else:
-            super(StatefulAttr, self).__widattr_init__(init=True, kw_only=kw_only or True)  # type: ignore
+            super(StatefulAttr, self).__widattr_init__(  # type: ignore
+                init=True,
+                kw_only=True if kw_only is Missing else kw_only,
+            )
 
         self._onupdate = None
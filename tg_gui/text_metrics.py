@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Hashable, Any
+
+    _Measure = Callable[[Any, str, "int | None"], "tuple[int, int]"]
+
+# ---
+
+from tg_gui_core import Pixels
+
+
+def _same(font: Any) -> Hashable:
+    return font
+
+
+class TextMetrics:
+    """
+    An LRU cache of text sizes keyed by (font, text, wrap width), shared by a platform's
+    text widgets so they can size a string without building or showing a native label, ex:
+    ```
+    text_metrics = TextMetrics(measure, capacity=256, font_key=lambda font: font.key())
+    dims = text_metrics.size(font, "hello")
+    ```
+    Re-measuring a string already seen (ex on relayout) is a dictionary lookup.
+    """
+
+    capacity: int
+    hits: int
+    misses: int
+
+    _measure: _Measure
+    _font_key: Callable[[Any], Hashable]
+    # (font key, text, wrap width) -> dims, re-inserted when used so the first is the least recent
+    _sizes: dict[tuple[Hashable, str, Pixels | None], tuple[Pixels, Pixels]]
+
+    def __init__(
+        self,
+        measure: _Measure,
+        capacity: int = 256,
+        font_key: Callable[[Any], Hashable] = _same,
+    ) -> None:
+        """
+        :param measure: `measure(font, text, wrap_width) -> dims`, called on a cache miss
+        :param capacity: the most sizes kept
+        :param font_key: makes a hashable key for a font, fonts are used as-is by default
+        """
+        assert capacity > 0, f"capacity must be positive, got {capacity}"
+        self.capacity = capacity
+        self._measure = measure
+        self._font_key = font_key
+        self._sizes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def size(
+        self, font: Any, text: str, wrap_width: Pixels | None = None
+    ) -> tuple[Pixels, Pixels]:
+        """
+        :param wrap_width: the width the text is wrapped to, None for no wrapping
+        :return: the size of the text drawn in the font
+        """
+        key = (self._font_key(font), text, wrap_width)
+        sizes = self._sizes
+        dims = sizes.pop(key, None)
+        if dims is None:
+            self.misses += 1
+            dims = self._measure(font, text, wrap_width)
+            if len(sizes) >= self.capacity:
+                # NOTE: on CircuitPython dicts may not keep insertion order, any key is evicted
+                del sizes[next(iter(sizes))]
+        else:
+            self.hits += 1
+        sizes[key] = dims
+        return dims
+
+    def clear(self) -> None:
+        self._sizes = {}
+
+    def __len__(self) -> int:
+        return len(self._sizes)
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+    # name, category, start ns, end ns, args
+    _Event = tuple[str, str, int, int, dict[str, Any]]
+
+# ---
+
+from time import monotonic_ns as _now
+
+from tg_gui_core import Widget
+
+from .stateful import State
+from .scheduler import FrameScheduler
+
+# the widget methods traced, on every widget class that defines them
+_WIDGET_METHODS = ("build", "rebuild", "place", "move", "pickup", "demolish")
+_THEME_METHOD = "onupdate_theme"
+
+_active: Tracer | None = None
+
+
+class Tracer:
+    """
+    Records how long widget lifecycle methods, `State.update`, subscriber callbacks
+    (`onupdate_*`), `onupdate_theme` and scheduler flushes take, for viewing in a
+    Chrome trace viewer (chrome://tracing, https://ui.perfetto.dev), ex:
+    ```
+    with Tracer() as tracer:
+        show_next_screen()
+    tracer.export("transition.json")
+    ```
+    Enabling wraps those methods on the classes that exist at that time, disabling
+    restores the originals, so a disabled tracer costs nothing.
+    Only one tracer can be enabled at a time.
+    """
+
+    events: list[_Event]
+
+    # (class, name, original) of each patched method, to restore
+    _patches: list[tuple[type, str, Any]]
+    # (id(widget), method) of the widget methods running, see _traced_method
+    _stack: list[tuple[int, str]]
+
+    def __init__(self) -> None:
+        self.events = []
+        self._patches = []
+        self._stack = []
+
+    @property
+    def enabled(self) -> bool:
+        return _active is self
+
+    def enable(self) -> Tracer:
+        global _active
+        assert _active is None, f"another tracer is already enabled, {_active}"
+        _active = self
+
+        for cls in _subclasses(Widget):
+            for name in _WIDGET_METHODS + (_THEME_METHOD,):
+                original = cls.__dict__.get(name)
+                if callable(original):
+                    self._patch(cls, name, self._traced_method(name, original))
+
+        self._patch(State, "update", self._traced_update(State.update))
+        self._patch(State, "_notify", self._traced_notify(State._notify))
+        self._patch(
+            State,
+            "_subscriber_onupdate",
+            self._traced_lookup(State._subscriber_onupdate),
+        )
+        self._patch(FrameScheduler, "flush", self._traced_flush(FrameScheduler.flush))
+        return self
+
+    def disable(self) -> None:
+        global _active
+        assert _active is self, f"{self} is not enabled"
+        for cls, name, original in reversed(self._patches):
+            setattr(cls, name, original)
+        self._patches = []
+        self._stack = []
+        _active = None
+
+    def __enter__(self) -> Tracer:
+        return self.enable()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.disable()
+
+    def clear(self) -> None:
+        # in place, the installed wrappers hold the list
+        del self.events[:]
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """
+        :return: the events in the Chrome trace-event format, as complete ("X") events
+        """
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": start / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": args,
+                }
+                for name, category, start, end, args in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def export(self, path: str) -> None:
+        """
+        Writes `chrome_trace()` to a JSON file.
+        """
+        import json
+
+        with open(path, "w") as file:
+            json.dump(self.chrome_trace(), file)
+
+    # --- wrappers ---
+
+    def _patch(self, cls: type, name: str, traced: Any) -> None:
+        self._patches.append((cls, name, cls.__dict__[name]))
+        setattr(cls, name, traced)
+
+    def _traced_method(self, method: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        events = self.events
+        stack = self._stack
+        category = "theme" if method == _THEME_METHOD else "widget"
+
+        def traced(widget: Widget, *args: Any, **kwargs: Any) -> Any:
+            key = (id(widget), method)
+            if stack and stack[-1] == key:
+                # a subclass's override calling super(), the outer call is the span
+                return fn(widget, *args, **kwargs)
+            stack.append(key)
+            start = _now()
+            try:
+                return fn(widget, *args, **kwargs)
+            finally:
+                events.append(
+                    (
+                        f"{type(widget).__name__}.{method}",
+                        category,
+                        start,
+                        _now(),
+                        {"uid": widget.id},
+                    )
+                )
+                stack.pop()
+
+        return traced
+
+    def _traced_update(self, fn: Callable[..., None]) -> Callable[..., None]:
+        events = self.events
+
+        def update(state: State[Any], value: Any, *, writer: Any) -> None:
+            start = _now()
+            try:
+                fn(state, value, writer=writer)
+            finally:
+                args = {"subscribers": len(state._subscribed)}
+                events.append(("State.update", "state", start, _now(), args))
+
+        return update
+
+    def _traced_notify(self, fn: Callable[..., None]) -> Callable[..., None]:
+        collector = _Collector()
+
+        def notify(state: State[Any], value: Any, writer: Any) -> None:
+            if State._scheduler is not None:
+                fn(state, value, writer)
+                return
+            # collect who the original would call (in order, skipping the writer), then
+            # call them through _subscriber_onupdate so each callback is traced
+            State._scheduler = collector  # type: ignore[assignment]
+            try:
+                fn(state, value, writer)
+            finally:
+                State._scheduler = None
+            uids = collector.take()
+            for uid in uids:
+                onupdate = state._subscriber_onupdate(uid)
+                if onupdate is not None:
+                    onupdate(value)
+
+        return notify
+
+    def _traced_lookup(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        events = self.events
+
+        def lookup(state: State[Any], uid: Any) -> Any:
+            onupdate = fn(state, uid)
+            if onupdate is None:
+                return None
+            name = getattr(onupdate, "__qualname__", None) or repr(onupdate)
+
+            def traced(value: Any) -> Any:
+                start = _now()
+                try:
+                    return onupdate(value)
+                finally:
+                    events.append((name, "callback", start, _now(), {"uid": uid}))
+
+            return traced
+
+        return lookup
+
+    def _traced_flush(self, fn: Callable[..., int]) -> Callable[..., int]:
+        events = self.events
+
+        def flush(scheduler: FrameScheduler) -> int:
+            start = _now()
+            called = 0
+            try:
+                called = fn(scheduler)
+                return called
+            finally:
+                args = {"callbacks": called}
+                events.append(("FrameScheduler.flush", "frame", start, _now(), args))
+
+        return flush
+
+
+class _Collector:
+    """
+    Stands in for the frame scheduler while a traced `State._notify` runs.
+    """
+
+    __slots__ = ("_uids",)
+
+    def __init__(self) -> None:
+        self._uids: list[Any] = []
+
+    def mark_dirty(self, state: State[Any], subscriber: Any) -> None:
+        self._uids.append(subscriber)
+
+    def take(self) -> list[Any]:
+        uids = self._uids
+        self._uids = []
+        return uids
+
+
+def _subclasses(cls: type) -> list[type]:
+    # classes can be reached twice through multiple inheritance
+    found = [cls]
+    seen = {cls}
+    for subclass in found:
+        for nested in subclass.__subclasses__():
+            if nested not in seen:
+                seen.add(nested)
+                found.append(nested)
+    return found
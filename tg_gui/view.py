@@ -15,6 +15,8 @@ from abc import ABC, abstractmethod
 
 from tg_gui_core._lib_env import *
 
+from .stateful import StatefulAttr
+
 
 Wrapped = TypeVar("Wrapped", bound=Widget)
 SomeSelf = TypeVar("SomeSelf", bound="View", contravariant=True)
@@ -22,6 +24,16 @@ SomeSelf = TypeVar("SomeSelf", bound="View", contravariant=True)
 
 @widget
 class View(ContainerWidget, Generic[Wrapped], ABC):
+    """
+    A container whose children are returned by its `body`, a widget or a list of widgets.
+    `update_body()` re-runs `body` and reconciles the result with the live children.
+    """
+
+    __slots__ = ()
+
+    # the live children, from the last run of `body`
+    _body_: list[Widget] = ReadWriteAttr(init=False)
+
     class Syntax(Protocol[SomeSelf]):
         @staticmethod
         def __call__(
@@ -30,3 +42,93 @@ class View(ContainerWidget, Generic[Wrapped], ABC):
             ...
 
     body: ClassVar[Syntax[Self]]
+
+    @property
+    def children(self) -> list[Widget]:
+        if not View._body_.has_attr(self):
+            self._body_ = _as_children(self.body())
+        return self._body_
+
+    def update_body(self) -> None:
+        """
+        Re-runs `body` and reconciles it with the live children. Children are matched by
+        class and `key` (or their order among unkeyed siblings of the same class).
+        A matched child is kept, with its native element, and only its stateful attributes
+        that changed are pushed to it. Children that cannot be updated in place, were added
+        or were removed are built or demolished by the next layout pass.
+        """
+        fresh = _as_children(self.body())
+        if not View._body_.has_attr(self):
+            self._body_ = fresh
+            return
+        self._body_ = _reconcile(self._body_, fresh)
+        if Widget.native.has_attr(self):
+            self.relayout()
+
+
+def _as_children(body: Widget | list[Widget] | tuple[Widget, ...]) -> list[Widget]:
+    if isinstance(body, (list, tuple)):
+        return list(body)
+    else:
+        return [body]
+
+
+def _match_key(widget: Widget, unkeyed: dict[type, int]) -> tuple[Any, ...]:
+    cls = type(widget)
+    key = widget.key
+    if key is not None:
+        return (cls, key)
+    index = unkeyed.get(cls, 0)
+    unkeyed[cls] = index + 1
+    return (cls, None, index)
+
+
+def _reconcile(live: list[Widget], fresh: list[Widget]) -> list[Widget]:
+    """
+    :return: the new children, live widgets where they match and can be updated
+    """
+    unkeyed: dict[type, int] = {}
+    by_key = {_match_key(widget, unkeyed): widget for widget in live}
+
+    unkeyed = {}
+    seen: set[tuple[Any, ...]] = set()
+    children: list[Widget] = []
+    for widget in fresh:
+        match_key = _match_key(widget, unkeyed)
+        assert (
+            match_key not in seen
+        ), f"duplicate key {widget.key!r} for {type(widget).__name__} in a view body"
+        seen.add(match_key)
+        existing = by_key.pop(match_key, None)
+        if existing is not None and _update_in_place(existing, widget):
+            # the fresh widget is dropped, release what it subscribed to at init
+            widget._release_attrs()
+            children.append(existing)
+        else:
+            children.append(widget)
+    return children
+
+
+def _update_in_place(live: Widget, fresh: Widget) -> bool:
+    """
+    Pushes the fresh widget's init attrs into the live one.
+    :return: False if a non-stateful attr differs, the live widget must be replaced
+    """
+    rebind: list[tuple[StatefulAttr[Any], Any]] = []
+    for attr in type(live).__widget_attrs__.values():
+        if not attr.init:
+            continue
+        old = getattr(live, attr.private_name, Missing)
+        new = getattr(fresh, attr.private_name, Missing)
+        if new is old:
+            continue
+        elif isinstance(attr, StatefulAttr):
+            rebind.append((attr, new))
+        elif new != old:
+            return False
+
+    for attr, value in rebind:
+        attr.rebind(live, value)
+    if rebind and isinstance(live, View):
+        live.update_body()
+    return True
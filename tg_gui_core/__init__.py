@@ -5,5 +5,6 @@ from .implementation_support import TYPE_CHECKING
 from .shared import Identifiable, Pixels, UID
 
 from .widget import Widget
-from .attrs import WidgetAttr, widget
+from .attrs import WidgetAttr, ReadOnlyAttr, ReadWriteAttr, widget
 from .container import ContainerWidget
+from .layout import Layout, StackLayout, RowLayout, ColumnLayout, GridLayout
@@ -0,0 +1,60 @@
+# The `isinstance` replacement used on CircuitPython, see `_impl_support_circuitpy`.
+# This has no imports so it can be benchmarked on its own on the MicroPython unix port,
+# see benchmarks/isinstance_dispatch.py
+
+_orig_isinstance = isinstance
+
+
+class IsinstanceBase:
+    ## check_if_isinstance handled by isinstance_cp_compat
+    ## subclasses must have
+    # @classmethod
+    # def _inst_isinstance_check_(cls, instance: Any) -> TypeGuard[Self]:...
+    if __debug__:
+
+        @classmethod
+        def _inst_isinstance_check_(cls, inst):
+            raise NotImplementedError(f"{cls}._inst_isinstance_check_")
+
+
+# classinfo -> None when it only has plain types (checked by the builtin isinstance as-is),
+# otherwise (plain types tuple, duck-type checks). Filled on the first check of a classinfo.
+_dispatch = {}
+
+
+def _plan(classinfo):
+    entries = classinfo if _orig_isinstance(classinfo, tuple) else (classinfo,)
+    types = []
+    checks = []
+    for cls in entries:
+        if cls is not IsinstanceBase and hasattr(cls, "_inst_isinstance_check_"):
+            # ducktype the custom _inst_isinstance_check_ on circuitpython
+            checks.append(cls._inst_isinstance_check_)
+        elif cls.__class__ is type:
+            types.append(cls)
+        # else: neither a type nor checkable, never matches
+    if not checks and len(types) == len(entries):
+        return None
+    return (tuple(types), tuple(checks))
+
+
+def isinstance_cp_compat(obj, classinfo):
+    try:
+        plan = _dispatch[classinfo]
+    except KeyError:
+        plan = _dispatch[classinfo] = _plan(classinfo)
+    except TypeError:
+        # unhashable, planned every time
+        plan = _plan(classinfo)
+
+    if plan is None:
+        # the fast path, only plain types
+        return _orig_isinstance(obj, classinfo)
+
+    types, checks = plan
+    if types and _orig_isinstance(obj, types):
+        return True
+    for check in checks:
+        if check(obj):
+            return True
+    return False
@@ -5,7 +5,8 @@ from .shared import UID, Pixels, MissingType, Missing, Identifiable
 
 
 from .widget import Widget
-from .attrs import WidgetAttr, widget
+from .attrs import WidgetAttr, ReadOnlyAttr, ReadWriteAttr, widget
 from .container import ContainerWidget
+from .layout import Layout, StackLayout, RowLayout, ColumnLayout, GridLayout
 
 # from .platform_support import PlatformWidget
@@ -41,8 +41,11 @@ if TYPE_CHECKING:
     from tg_gui._platform_setup_ import widget
 else:
 
-    def widget(cls):
-        return _widget(cls)
+    def widget(cls=None, *, slots=False):
+        if cls is None:
+            return lambda cls: _widget(cls, slots=slots)
+        else:
+            return _widget(cls, slots=slots)
 
 
 # ----------- @widget attribute descriptor -----------
@@ -71,7 +74,6 @@ class WidgetAttr(Generic[_Attr]):
         self.__widattr_init__(*args, **kwargs)  # pyright: reportUnknownMemberType=false
     )
 
-    # TODO: add del_attr method
     def init_attr(self, widget: Widget, value: _Attr | MissingType) -> None:
         """
         Called when the widget is being initialized, this can be used to reserve the attribute
@@ -82,17 +84,37 @@ class WidgetAttr(Generic[_Attr]):
         """
         setattr(widget, self.private_name, value)
 
+    def del_attr(self, widget: Widget) -> None:
+        """
+        Called when the widget is demolished or unnested, this can be used to release
+        anything the attribute holds on to for the widget (ex state subscriptions).
+        The value itself is kept so the widget can be built again.
+        NOTE: only called for subclasses that override it, see `_WidgetInitPlan.releasing`
+        """
+        pass
+
+    def restore_attr(self, widget: Widget) -> None:
+        """
+        Called when the widget is nested or built, undoes `del_attr`. Must be safe to
+        call when nothing was released.
+        NOTE: only called for subclasses that override it, see `_WidgetInitPlan.releasing`
+        """
+        pass
+
+    def has_attr(self, widget: Widget) -> bool:
+        """
+        :return: if the attribute is currently set on the widget, without raising when it is not
+        """
+        return getattr(widget, self.private_name, Missing) is not Missing
+
     def get_attr(self, owner: Widget) -> _Attr:
         """
         Called when the widget is being accessed, find and return the value of the attribute this widgetattr describes.
         :param owner: the widget being accessed
         """
-        attr: _Attr | MissingType = getattr(self, self.private_name, Missing)
+        attr: _Attr | MissingType = getattr(owner, self.private_name, Missing)
         if attr is Missing:
-            raise AttributeError(
-                f"{self} has not attribute `.{self.name}`, "
-                "either uninited or cleared"
-            )
+            raise self._missing_error(owner)
         else:
             return attr
 
@@ -126,16 +148,17 @@ class WidgetAttr(Generic[_Attr]):
         if widget is None:
             return self
 
-        value = self.get_attr(widget)
-
-        if value is Missing:
-            raise AttributeError(f"{self.name} cleared or not set, cannot be accessed")
-
-        return value
+        return self.get_attr(widget)
 
     def __set__(self, widget: Widget, value: _Attr | MissingType = Missing) -> None:
         return self.set_attr(widget, value)
 
+    def _missing_error(self, widget: Widget) -> AttributeError:
+        # only built on the miss path, keep the hit path to a single lookup
+        return AttributeError(
+            f"{widget} has no attribute `.{self.name}`, either uninited or cleared"
+        )
+
     def __set_name__(self, cls: Type[Widget], name: str) -> None:
         assert (
             getattr(self, "name", None) is None
@@ -149,7 +172,7 @@ class WidgetAttr(Generic[_Attr]):
         self.name = name
         self.owning_cls = cls
         if not getattr(self, "private_name", None):
-            self.private_name = f"_{name if __debug__ else self.id}"
+            self.private_name = _private_name(name, self.id)
 
         assert (
             name != self.private_name
@@ -290,16 +313,53 @@ class WidgetAttr(Generic[_Attr]):
             self.default_source = ("required", None)
 
 
+# ----------- fast-path attribute descriptors -----------
+# `WidgetAttr` routes every read through the `get_attr` hook so subclasses can customize
+# it. These kinds inline the common cases instead: one lookup on the hit path and the
+# "uninited or cleared" error only on the miss path.
+
+
+class ReadOnlyAttr(WidgetAttr[_Attr]):
+    """
+    A `WidgetAttr` whose value is stored as-is and can only be set at init.
+    """
+
+    # typed by WidgetAttr.__get__'s overloads
+    if not TYPE_CHECKING:
+
+        def __get__(self, widget, ownertype):
+            if widget is None:
+                return self
+            value = getattr(widget, self.private_name, Missing)
+            if value is Missing:
+                raise self._missing_error(widget)
+            return value
+
+
+class ReadWriteAttr(ReadOnlyAttr[_Attr]):
+    """
+    A `ReadOnlyAttr` that can also be assigned to, assigning `Missing` clears it.
+    Used for the lifecycle attributes a widget updates on itself (`.native`, `.pos`, etc).
+    """
+
+    def set_attr(self, widget: Widget, value: _Attr | MissingType = Missing) -> None:
+        setattr(widget, self.private_name, value)
+
+    def __set__(self, widget: Widget, value: _Attr | MissingType = Missing) -> None:
+        setattr(widget, self.private_name, value)
+
+
 # ----------- decorator impl -----------
 
 
-def _widget(cls: Type[_W]) -> Type[_W]:
+def _widget(cls: Type[_W], *, slots: bool = False) -> Type[_W]:
     """
     Decorator for widget classes that performs the following:
     - circuitpython-compat(__set_name__), call `__set_name__` for the attributes in the class
     - circuitpython-compat(__init_subclass__), a limited version of `__init_subclass__` without kwargs
     - validates widgets use only single inheritance for widget base classes
     - validate it's parent widget class is in it's first position
+    - (opt-in, `slots=True`) re-creates the class with `__slots__` for the widget attrs
     - sets the widget class id (runtime id)
     - setup the widget attrs if included in `__init__` signature
     """
@@ -340,6 +400,10 @@ def _widget(cls: Type[_W]) -> Type[_W]:
         init_attrs.update(widget_attrs)
         cls.__widget_attrs__ = init_attrs
 
+    # store the widget attrs in slots instead of the instance __dict__
+    if slots:
+        cls = _slotted_widget_class(cls)
+
     # set an id for the widget class, unless it already has one
     # this is used to validate that the @widget decorator is called on widget classes and
     assert (
@@ -347,14 +411,286 @@ def _widget(cls: Type[_W]) -> Type[_W]:
     ), f"widget class {cls} already has a class id, make sure it is not decorated with `@widget` twice"
     cls.__widget_class_id__ = UID()
 
+    # --- specialize the init ---
+    # the init plan only depends on the class, so compute it once here instead of
+    # on every instantiation. classes that define (or inherit) a hand-written __init__ keep it.
+    cls.__widget_init_plan__ = plan = _WidgetInitPlan(cls)
+    inherited_init = cls.__init__
+    if inherited_init is _widget_init_attrs or inherited_init is getattr(
+        cls, "__widget_generated_init__", None
+    ):
+        cls.__init__ = init = _specialized_init(cls, plan)  # type: ignore[assignment]
+        # marks the init as generated so subclasses know they may replace it, on the
+        # class since circuitpython functions have no __dict__ to mark
+        cls.__widget_generated_init__ = init
+
     return cls  # type: ignore
 
 
+# ----------- __slots__ support -----------
+
+
+def _private_name(name: str, attr_id: UID) -> str:
+    """
+    :return: the name a widget attr stores its value under, a slot name on slotted widgets
+    """
+    # `_attr_` would become `__attr_`, which python name-mangles in `__slots__`
+    prefix = "_attr" if name.startswith("_") else "_"
+    return f"{prefix}{name if __debug__ else attr_id}"
+
+
+def _slotted_widget_class(cls: Type[_W]) -> Type[_W]:
+    """
+    Re-creates a widget class with `__slots__` for the private names of all its widget
+    attrs (including the ones inherited from `Widget`) that no base class has a slot for.
+    Like `@dataclass(slots=True)` the returned class is a new class object.
+    NOTE: an instance only drops its `__dict__` if every base class also uses slots,
+    otherwise the slots still skip the `__dict__` for the widget attrs' values.
+    """
+    if impl_support.isoncircuitpython():
+        # circuitpython ignores __slots__, keep the class as is
+        return cls
+
+    assert (
+        "__slots__" not in cls.__dict__
+    ), f"{cls} already defines __slots__, cannot use @widget(slots=True)"
+
+    inherited: set[str] = set()
+    for base in cls.__mro__[1:]:
+        base_slots = base.__dict__.get("__slots__", ())
+        inherited.update((base_slots,) if isinstance(base_slots, str) else base_slots)
+
+    slot_names = list(
+        dict.fromkeys(
+            wa.private_name
+            for wa in cls.__widget_attrs__.values()
+            if wa.private_name not in inherited
+        )
+    )
+    # keep widgets weak-referencable
+    if not any(hasattr(base, "__weakref__") for base in cls.__mro__[1:]):
+        slot_names.append("__weakref__")
+
+    # widget attrs have already had __set_name__ called, so they are re-attached
+    # after the class is created instead of passed through the namespace
+    namespace = dict(cls.__dict__)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    own_attrs = {
+        name: namespace.pop(name)
+        for name, value in cls.__dict__.items()
+        if isinstance(value, WidgetAttr)
+    }
+    namespace["__slots__"] = tuple(slot_names)
+    namespace["__qualname__"] = cls.__qualname__
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    for name, attr in own_attrs.items():
+        setattr(new_cls, name, attr)
+        attr.owning_cls = new_cls
+
+    # point zero-argument `super()` in the methods at the new class
+    for value in namespace.values():
+        for fn in (value, getattr(value, "__func__", None), getattr(value, "fget", None)):
+            closure = getattr(fn, "__closure__", None)
+            if closure is None:
+                continue
+            for name, cell in zip(fn.__code__.co_freevars, closure):
+                if name == "__class__" and cell.cell_contents is cls:
+                    cell.cell_contents = new_cls
+
+    return new_cls  # type: ignore[return-value]
+
+
+# ----------- init plan / specialized __init__ -----------
+
+
+class _WidgetInitPlan:
+    """
+    The per-class metadata needed to initialize a widget's attrs, derived once
+    from `__widget_attrs__` when the class is decorated.
+    - `positional`: init attrs that accept positional args, in argument order
+    - `ordered`: every widget attr in `__widget_attrs__` order, as (kind, attr) pairs
+        where kind is one of "required", "default", or "default_factory"
+    - `releasing`: the attrs with a `del_attr` / `restore_attr` to call as the widget is
+        demolished or unnested / nested or built
+    """
+
+    positional: tuple[WidgetAttr[Any], ...]
+    ordered: tuple[tuple[str, WidgetAttr[Any]], ...]
+    releasing: tuple[WidgetAttr[Any], ...]
+
+    def __init__(self, cls: Type[Widget]) -> None:
+        widget_attrs: dict[str, WidgetAttr[Any]] = getattr(cls, "__widget_attrs__", {})
+
+        # find which positional args are init attrs, sort by order by id (childmost -> parentmost, top -> down)
+        self.positional = tuple(
+            sorted(
+                (wa for wa in widget_attrs.values() if wa.init and not wa.kw_only),
+                key=id_attr_as_int,
+            )
+        )
+        self.ordered = tuple((wa.default_source[0], wa) for wa in widget_attrs.values())
+        self.releasing = tuple(
+            wa
+            for wa in widget_attrs.values()
+            if type(wa).del_attr is not WidgetAttr.del_attr
+            or type(wa).restore_attr is not WidgetAttr.restore_attr
+        )
+
+        for kind, wa in self.ordered:
+            if kind not in ("required", "default", "default_factory"):
+                raise TypeError(f"internal error: unknown default_source kind {kind}")
+
+
+def _specialized_init(cls: Type[Widget], plan: _WidgetInitPlan) -> Callable[..., None]:
+    # circuitpython has no `exec` worth using, fall back to the generic plan walker
+    if impl_support.isoncircuitpython():
+        return _plan_init(cls, plan)
+    return _exec_init(cls, plan)
+
+
+def _plan_init(cls: Type[Widget], plan: _WidgetInitPlan) -> Callable[..., None]:
+    """
+    Returns an `__init__` that walks the precomputed init plan for the class.
+    """
+    positional = plan.positional
+    ordered = plan.ordered
+    n_positional = len(positional)
+    cls_name = cls.__name__
+
+    def __init__(self: Widget, *args: object, **kwargs: object) -> None:
+        if len(args) > n_positional:
+            raise TypeError(
+                f"{cls_name}.__init__(...) expected at most {n_positional} positional args, but {len(args)} were passed"
+            )
+        for arg, wa in zip(args, positional):
+            if wa.name in kwargs:
+                raise TypeError(
+                    f"{cls_name}.__init__(...) got multiple values for {wa.name}="
+                )
+            kwargs[wa.name] = arg
+
+        missing_kwargs: list[str] = []
+        for kind, wa in ordered:
+            value = kwargs.pop(wa.name, Missing) if wa.init else Missing
+            if value is Missing:
+                if kind == "default":
+                    value = wa.default_source[1]
+                elif kind == "default_factory":
+                    value = wa.default_source[1]()
+                elif wa.init:
+                    missing_kwargs.append(wa.name)
+                    continue
+            wa.init_attr(self, value)
+
+        if len(missing_kwargs):
+            raise TypeError(
+                f"{cls_name}(...) missing required kwarg(s) ({'=..., '.join(missing_kwargs)}=...)"
+            )
+        elif len(kwargs):
+            raise TypeError(
+                f"{cls_name}(...) got unexpected kwarg(s) ({'=..., '.join(kwargs)}=...)"
+            )
+
+    return __init__
+
+
+def _exec_init(cls: Type[Widget], plan: _WidgetInitPlan) -> Callable[..., None]:
+    """
+    Generates an `__init__` with the class's widget attrs as real parameters, ex:
+    ```
+    def __init__(self, text=_M, *, action=_M):
+        if text is _M or action is _M:
+            _missing(self, text, action, names=('text', 'action'))
+        _init_0(self, _src_0())  # id, init=False with a default_factory
+        ...
+        _init_7(self, text)
+        _init_8(self, action)
+    ```
+    """
+    # all the parameters default to Missing so required attrs can be reported together
+    # and so positional attrs may follow each other in any default order
+    namespace: dict[str, Any] = {"_M": Missing, "_missing": _missing_kwargs_error}
+    positional_params: list[str] = []
+    keyword_params: list[str] = []
+    body: list[str] = []
+    required: list[str] = []
+
+    positional_names = [wa.name for wa in plan.positional]
+    for index, (kind, wa) in enumerate(plan.ordered):
+        init_ref = f"_init_{index}"
+        src_ref = f"_src_{index}"
+        namespace[init_ref] = wa.init_attr
+        namespace[src_ref] = wa.default_source[1]
+
+        if wa.init:
+            if wa.name in positional_names:
+                positional_params.append(wa.name)
+            else:
+                keyword_params.append(f"{wa.name}=_M")
+
+        if not wa.init:
+            value = {
+                "required": "_M",
+                "default": src_ref,
+                "default_factory": f"{src_ref}()",
+            }[kind]
+            body.append(f"    {init_ref}(self, {value})")
+        elif kind == "required":
+            required.append(wa.name)
+            body.append(f"    {init_ref}(self, {wa.name})")
+        elif kind == "default":
+            body.append(
+                f"    {init_ref}(self, {src_ref} if {wa.name} is _M else {wa.name})"
+            )
+        else:  # default_factory
+            body.append(
+                f"    {init_ref}(self, {src_ref}() if {wa.name} is _M else {wa.name})"
+            )
+
+    # keep the positional parameters in argument order, not attr order
+    positional_params.sort(key=positional_names.index)
+    params = ["self", *(f"{name}=_M" for name in positional_params)]
+    if keyword_params:
+        params.append("*")
+        params.extend(keyword_params)
+
+    check: list[str] = []
+    if required:
+        check.append(
+            "    if " + " or ".join(f"{name} is _M" for name in required) + ":"
+        )
+        check.append(
+            f"        _missing(self, {', '.join(required)}, names={tuple(required)!r})"
+        )
+
+    src = "\n".join(
+        [f"def __init__({', '.join(params)}):", *check, *body, "    pass"]
+    )
+    exec(src, namespace)  # pylint: disable=exec-used
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return init
+
+
+def _missing_kwargs_error(self: Widget, *values: object, names: tuple[str, ...]) -> None:
+    missing_kwargs = [name for name, value in zip(names, values) if value is Missing]
+    raise TypeError(
+        f"{self.__class__.__name__}(...) missing required kwarg(s) ({'=..., '.join(missing_kwargs)}=...)"
+    )
+
+
 def _widget_init_attrs(
     self: Widget,
     *args,
     **kwargs: object,
 ) -> None:
+    """
+    The generic, unspecialized widget init. `@widget` replaces this with an init
+    specialized from the class's `__widget_init_plan__`, see `_specialized_init`.
+    """
 
     init_attrs = self.__widget_attrs__.copy()
 
@@ -366,13 +702,13 @@ def _widget_init_attrs(
     )
     # number of function arguments
     if not (len(args) <= len(pos_args)):
-        TypeError(
+        raise TypeError(
             f"{self.__class__}.__init__(...) expected {len(pos_args)} positional args, but {len(args)} were passed"
         )
     # match positional args and remove them from the remaining kwargs
     for arg, wa in zip(args, pos_args):
         if not (wa.name not in kwargs):
-            TypeError(
+            raise TypeError(
                 f"{self.__class__}.__init__(...) got multiple values for {wa.name}="
             )
         wa.init_attr(self, arg)
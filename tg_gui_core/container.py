@@ -4,15 +4,373 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import ClassVar, Type, Iterable, Any
+    from tg_gui.platform.shared import NativeContainer
+    from .platform_support import PlatformBackend
 
 # ---
 
+from .shared import UID, Pixels
 from .widget import Widget
+from .attrs import ReadWriteAttr, widget
+from .layout import Layout, StackLayout
 
 from abc import ABC, abstractmethod, abstractproperty
 
 
+class _ChildLayout:
+    """
+    What a container remembers about a child between layout passes.
+    """
+
+    __slots__ = ("child", "suggestion", "pos", "dirty")
+
+    child: Widget
+    # the suggestion the child was last built / rebuilt with, its dims are cached for it
+    suggestion: tuple[Pixels, Pixels]
+    # the position from the last arrange pass
+    pos: tuple[Pixels, Pixels]
+    # the child asked to be re-measured, see `Widget.request_resize`
+    dirty: bool
+
+    def __init__(self, child: Widget, suggestion: tuple[Pixels, Pixels]) -> None:
+        self.child = child
+        self.suggestion = suggestion
+        self.dirty = False
+
+
+class _ResizeBatch:
+    """
+    The context manager returned by `ContainerWidget.batch_resizes()`, batches may be nested.
+    """
+
+    depth: int
+    # the topmost dirty containers, laid out when the outermost batch exits
+    roots: list[ContainerWidget]
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.roots = []
+
+    def __enter__(self) -> None:
+        self.depth += 1
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.depth -= 1
+        if self.depth:
+            return
+        roots = self.roots
+        self.roots = []
+        for root in roots:
+            root._update_layout()
+
+
+_resize_batch = _ResizeBatch()
+
+
+_default_layout = StackLayout()
+
+
+@widget
 class ContainerWidget(Widget, ABC):
+    """
+    A widget that nests, sizes and positions its children using a `Layout`.
+    Layout runs in two passes:
+    - measure (on `build` / `rebuild`): each child is suggested a size and built, children
+      whose suggestion did not change since the last pass are not rebuilt
+    - arrange (on `place`): each child is placed, children that did not move are skipped
+    Subclasses provide `children` and can override `_layout_` (stacks by default).
+    The native container is built with the dims the layout measured as the suggestion.
+
+    When a child's size changes (`Widget.request_resize`) it is marked dirty, as are its
+    superiors up to the first one already dirty. The dirty path is then laid out bottom-up:
+    only dirty children are rebuilt, siblings are only moved if their position changed,
+    and a container whose dims did not change stops the change from reaching its superior.
+    """
+
+    __slots__ = ()
+
+    _suggestion_: tuple[Pixels, Pixels] = ReadWriteAttr(init=False)
+    # child id -> layout info, in the order of `.children`
+    _child_layouts_: dict[UID, _ChildLayout] = ReadWriteAttr(
+        init=False, default_factory=dict
+    )
+    _arranged_: list[_ChildLayout] = ReadWriteAttr(init=False, default_factory=list)
+    # set while the container is on a dirty path, see `_mark_dirty`
+    _layout_dirty_: bool = ReadWriteAttr(False, init=False)
+    _dirty_children_: list[_ChildLayout] = ReadWriteAttr(
+        init=False, default_factory=list
+    )
+
+    if TYPE_CHECKING:
+        platform: PlatformBackend
+
     @abstractproperty
     def children(self) -> Iterable[Widget]:
         raise NotImplementedError
+
+    def _layout_(self) -> Layout:
+        """
+        :return: the layout used to size and position the children
+        """
+        return _default_layout
+
+    @staticmethod
+    def batch_resizes() -> _ResizeBatch:
+        """
+        Returns a context manager that defers laying out resized widgets until it exits,
+        so many resizes in one container only lay it out once, ex:
+        ```
+        with ContainerWidget.batch_resizes():
+            for label in labels:
+                label.request_resize()
+        ```
+        The frame scheduler and `State.batch()` batch the updates they deliver.
+        """
+        return _resize_batch
+
+    # --- lifecycle ---
+
+    def build(self, suggestion: tuple[Pixels, Pixels]) -> None:
+        self._restore_attrs()
+        self.native, self.dims = self._build_(self._measure(suggestion))
+
+    def rebuild(self, suggestion: tuple[Pixels, Pixels]) -> None:
+        dims = self._measure(suggestion)
+        if dims != self.dims:
+            self._resize_native(dims)
+        # else: the native container still fits, only the children may have moved
+        if Widget.pos.has_attr(self):
+            self._arrange()
+
+    def relayout(self) -> None:
+        """
+        Lays the children out again with the last suggestion, ex after children were
+        added or removed. Only new children and children whose suggestion changed are built.
+        """
+        self.rebuild(self._suggestion_)
+
+    def place(self, pos: tuple[Pixels, Pixels]) -> None:
+        super().place(pos)
+        self._arrange()
+
+    def demolish(self) -> None:
+        self.pickup_children([entry.child for entry in self._arranged_])
+        for entry in self._arranged_:
+            self._remove_child(entry.child)
+        self._child_layouts_ = {}
+        self._arranged_ = []
+        super().demolish()
+
+    def place_children(
+        self, placements: Iterable[tuple[Widget, tuple[Pixels, Pixels]]]
+    ) -> None:
+        """
+        Places the children at the given positions, or moves those already placed,
+        as one native update (see `PlatformBackend.begin_update`).
+        """
+        native = self.native
+        platform = self.platform
+        platform.begin_update(native)
+        try:
+            for child, pos in placements:
+                if not Widget.pos.has_attr(child):
+                    child.place(pos)
+                elif child.pos != pos:
+                    child.move(pos)
+        finally:
+            platform.end_update(native)
+
+    def pickup_children(self, children: Iterable[Widget]) -> None:
+        """
+        Picks up the placed children as one native update.
+        """
+        native = self.native
+        platform = self.platform
+        platform.begin_update(native)
+        try:
+            for child in children:
+                if Widget.pos.has_attr(child):
+                    child.pickup()
+        finally:
+            platform.end_update(native)
+
+    # --- native container, made by the platform ---
+
+    def _build_(
+        self, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[NativeContainer, tuple[Pixels, Pixels]]:
+        # containers are built with the dims their layout measured as the suggestion
+        return self.platform.build_container(suggestion)
+
+    def _rebuild_(
+        self, native: NativeContainer, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[NativeContainer, tuple[Pixels, Pixels]]:
+        return native, self.platform.resize_container(native, suggestion)
+
+    def _demolish_(self, native: NativeContainer) -> None:
+        self.platform.demolish_container(native)
+
+    def _place_(
+        self,
+        container: NativeContainer,
+        native: NativeContainer,
+        pos: tuple[Pixels, Pixels],
+        abs_pos: tuple[Pixels, Pixels],
+    ) -> None:
+        self.platform.place_native(container, native, pos)
+
+    def _pickup_(self, container: NativeContainer, native: NativeContainer) -> None:
+        self.platform.pickup_native(container, native)
+
+    def _move_(
+        self,
+        container: NativeContainer,
+        native: NativeContainer,
+        pos: tuple[Pixels, Pixels],
+        abs_pos: tuple[Pixels, Pixels],
+    ) -> None:
+        self.platform.move_native(container, native, pos)
+
+    # --- layout passes ---
+
+    def _measure(self, suggestion: tuple[Pixels, Pixels]) -> tuple[Pixels, Pixels]:
+        """
+        Builds or rebuilds the children that need it and returns the container's dims.
+        """
+        layout = self._layout_()
+        children = tuple(self.children)
+        count = len(children)
+        previous = self._child_layouts_
+        current: dict[UID, _ChildLayout] = {}
+        arranged: list[_ChildLayout] = []
+        dims: list[tuple[Pixels, Pixels]] = []
+
+        # a full pass re-measures the dirty children below
+        self._layout_dirty_ = False
+        self._dirty_children_ = []
+
+        for index, child in enumerate(children):
+            child_suggestion = layout.suggest(index, count, suggestion)
+            entry = previous.pop(child.id, None)
+            if entry is None:
+                child.nest_in(self, self.platform)
+                child.build(child_suggestion)
+                entry = _ChildLayout(child, child_suggestion)
+            elif entry.dirty or entry.suggestion != child_suggestion:
+                entry.dirty = False
+                child.rebuild(child_suggestion)
+                entry.suggestion = child_suggestion
+            # else: same input, keep the cached dims
+            current[child.id] = entry
+            arranged.append(entry)
+            dims.append(child.dims)
+
+        # anything left was removed from the container
+        if previous:
+            removed = [entry.child for entry in previous.values()]
+            self.pickup_children(removed)
+            for child in removed:
+                self._remove_child(child)
+
+        container_dims, positions = layout.arrange(dims, suggestion)
+        for entry, pos in zip(arranged, positions):
+            entry.pos = pos
+
+        self._suggestion_ = suggestion
+        self._child_layouts_ = current
+        self._arranged_ = arranged
+        return container_dims
+
+    def _arrange(self) -> None:
+        """
+        Places or moves the children to the positions from the last measure pass.
+        """
+        changed = [
+            (entry.child, entry.pos)
+            for entry in self._arranged_
+            if not Widget.pos.has_attr(entry.child) or entry.child.pos != entry.pos
+        ]
+        if changed:
+            self.place_children(changed)
+
+    def _resize_native(self, dims: tuple[Pixels, Pixels]) -> None:
+        if type(self)._rebuild_ is not Widget._rebuild_:
+            self.native, self.dims = self._rebuild_(self.native, dims)
+            return
+
+        # the default _rebuild_ replaces the native container, take everything out first
+        self.pickup_children([entry.child for entry in self._arranged_])
+        placed = Widget.pos.has_attr(self)
+        native = self.native
+        if placed:
+            self._pickup_(self.superior.native, native)
+        self._demolish_(native)
+        self.native, self.dims = self._build_(dims)
+        if placed:
+            self._place_(self.superior.native, self.native, self.pos, self.abs_pos)
+
+    # --- incremental resizes ---
+
+    def _mark_dirty(self, child: Widget) -> None:
+        entry = self._child_layouts_.get(child.id)
+        if entry is None:
+            # not measured by this container yet, it will be when it is
+            return
+        if entry.dirty:
+            return
+        entry.dirty = True
+        self._dirty_children_.append(entry)
+        if self._layout_dirty_:
+            # already on a dirty path, whoever marked it will lay it out
+            return
+        self._layout_dirty_ = True
+
+        superior = self.superior if Widget.superior.has_attr(self) else None
+        if superior is not None and self.id in superior._child_layouts_:
+            superior._mark_dirty(self)
+        elif _resize_batch.depth:
+            _resize_batch.roots.append(self)
+        else:
+            self._update_layout()
+
+    def _update_layout(self) -> None:
+        """
+        Lays out the dirty path under this container, bottom-up.
+        """
+        if not self._layout_dirty_:
+            # already laid out, ex by a full `rebuild`
+            return
+        dirty = self._dirty_children_
+        self._dirty_children_ = []
+        self._layout_dirty_ = False
+
+        resized = False
+        for entry in dirty:
+            if not entry.dirty:
+                continue
+            entry.dirty = False
+            child = entry.child
+            before = child.dims
+            if isinstance(child, ContainerWidget) and child._layout_dirty_:
+                child._update_layout()
+            else:
+                child.rebuild(entry.suggestion)
+            resized = resized or child.dims != before
+        if not resized:
+            return
+
+        dims, positions = self._layout_().arrange(
+            [entry.child.dims for entry in self._arranged_], self._suggestion_
+        )
+        for entry, pos in zip(self._arranged_, positions):
+            entry.pos = pos
+        if dims != self.dims:
+            self._resize_native(dims)
+        if Widget.pos.has_attr(self):
+            self._arrange()
+
+    def _remove_child(self, child: Widget) -> None:
+        if Widget.pos.has_attr(child):
+            child.pickup()
+        child.demolish()
+        child.unnest_from(self, self.platform)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Sequence
+
+# ---
+
+from .shared import Pixels
+
+# ---
+
+# A layout is the pure-math half of a container: `suggest` tells each child how much
+# space it may take (the measure pass), `arrange` turns the children's final dims into
+# the container's dims and each child's position (the arrange pass).
+# Containers cache what `suggest` returned per child, a child is only re-measured when its
+# suggestion changes, see `ContainerWidget._measure`.
+
+
+class Layout:
+    """
+    Base class for the container layouts, subclasses implement `suggest` and `arrange`.
+    """
+
+    __slots__ = ()
+
+    def suggest(
+        self, index: int, count: int, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        """
+        :param index: the index of the child being measured
+        :param count: the number of children in the container
+        :param suggestion: the size suggested to the container
+        :return: the size suggested to the child at `index`
+        """
+        raise NotImplementedError
+
+    def arrange(
+        self,
+        dims: Sequence[tuple[Pixels, Pixels]],
+        suggestion: tuple[Pixels, Pixels],
+    ) -> tuple[tuple[Pixels, Pixels], list[tuple[Pixels, Pixels]]]:
+        """
+        :param dims: the final dims of each child, in order
+        :param suggestion: the size suggested to the container
+        :return: the container's dims and the position of each child in it
+        """
+        raise NotImplementedError
+
+
+class StackLayout(Layout):
+    """
+    Children are stacked on top of each other, centered in the container.
+    """
+
+    __slots__ = ()
+
+    def suggest(
+        self, index: int, count: int, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        return suggestion
+
+    def arrange(
+        self,
+        dims: Sequence[tuple[Pixels, Pixels]],
+        suggestion: tuple[Pixels, Pixels],
+    ) -> tuple[tuple[Pixels, Pixels], list[tuple[Pixels, Pixels]]]:
+        width = max((w for w, _ in dims), default=0)
+        height = max((h for _, h in dims), default=0)
+        return (width, height), [
+            ((width - w) // 2, (height - h) // 2) for w, h in dims
+        ]
+
+
+class RowLayout(Layout):
+    """
+    Children are placed left to right, the width is split evenly between them
+    and each is centered vertically.
+    """
+
+    __slots__ = ("spacing",)
+
+    spacing: Pixels
+
+    def __init__(self, spacing: Pixels = 0) -> None:
+        self.spacing = spacing
+
+    def suggest(
+        self, index: int, count: int, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        width, height = suggestion
+        return (max(0, width - self.spacing * (count - 1)) // count, height)
+
+    def arrange(
+        self,
+        dims: Sequence[tuple[Pixels, Pixels]],
+        suggestion: tuple[Pixels, Pixels],
+    ) -> tuple[tuple[Pixels, Pixels], list[tuple[Pixels, Pixels]]]:
+        height = max((h for _, h in dims), default=0)
+        positions: list[tuple[Pixels, Pixels]] = []
+        x = 0
+        for w, h in dims:
+            positions.append((x, (height - h) // 2))
+            x += w + self.spacing
+        width = x - self.spacing if dims else 0
+        return (width, height), positions
+
+
+class ColumnLayout(Layout):
+    """
+    Children are placed top to bottom, the height is split evenly between them
+    and each is centered horizontally.
+    """
+
+    __slots__ = ("spacing",)
+
+    spacing: Pixels
+
+    def __init__(self, spacing: Pixels = 0) -> None:
+        self.spacing = spacing
+
+    def suggest(
+        self, index: int, count: int, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        width, height = suggestion
+        return (width, max(0, height - self.spacing * (count - 1)) // count)
+
+    def arrange(
+        self,
+        dims: Sequence[tuple[Pixels, Pixels]],
+        suggestion: tuple[Pixels, Pixels],
+    ) -> tuple[tuple[Pixels, Pixels], list[tuple[Pixels, Pixels]]]:
+        width = max((w for w, _ in dims), default=0)
+        positions: list[tuple[Pixels, Pixels]] = []
+        y = 0
+        for w, h in dims:
+            positions.append(((width - w) // 2, y))
+            y += h + self.spacing
+        height = y - self.spacing if dims else 0
+        return (width, height), positions
+
+
+class GridLayout(Layout):
+    """
+    Children fill a grid with a fixed number of columns, row by row. Each cell is
+    suggested an even share of the space, columns and rows then shrink to fit the
+    widest / tallest child in them. Children are placed at the top-left of their cell.
+    """
+
+    __slots__ = ("columns", "spacing")
+
+    columns: int
+    spacing: Pixels
+
+    def __init__(self, columns: int, spacing: Pixels = 0) -> None:
+        assert columns > 0, f"a grid needs at least one column, got {columns}"
+        self.columns = columns
+        self.spacing = spacing
+
+    def suggest(
+        self, index: int, count: int, suggestion: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        width, height = suggestion
+        columns = min(self.columns, count)
+        rows = -(-count // self.columns)
+        return (
+            max(0, width - self.spacing * (columns - 1)) // columns,
+            max(0, height - self.spacing * (rows - 1)) // rows,
+        )
+
+    def arrange(
+        self,
+        dims: Sequence[tuple[Pixels, Pixels]],
+        suggestion: tuple[Pixels, Pixels],
+    ) -> tuple[tuple[Pixels, Pixels], list[tuple[Pixels, Pixels]]]:
+        if not dims:
+            return (0, 0), []
+        columns = self.columns
+        spacing = self.spacing
+        widths = [0] * min(columns, len(dims))
+        heights = [0] * -(-len(dims) // columns)
+        for index, (w, h) in enumerate(dims):
+            row, column = divmod(index, columns)
+            widths[column] = max(widths[column], w)
+            heights[row] = max(heights[row], h)
+
+        xs = _offsets(widths, spacing)
+        ys = _offsets(heights, spacing)
+        positions = [
+            (xs[index % columns], ys[index // columns]) for index in range(len(dims))
+        ]
+        return (
+            xs[-1] + widths[-1],
+            ys[-1] + heights[-1],
+        ), positions
+
+
+def _offsets(sizes: list[Pixels], spacing: Pixels) -> list[Pixels]:
+    offsets = []
+    offset = 0
+    for size in sizes:
+        offsets.append(offset)
+        offset += size + spacing
+    return offsets
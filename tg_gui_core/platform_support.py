@@ -4,13 +4,97 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import ClassVar, Type, Iterable, Any
+    from tg_gui.platform.shared import NativeElement, NativeContainer
 
 # ---
 
 from abc import ABC, abstractmethod, abstractproperty
 
+from .shared import Pixels
+
 
 class PlatformBackend(ABC):
+    """
+    The `.platform` widgets are nested with. It makes the native containers that
+    `ContainerWidget`s are built as, leaf widgets (ex `Text`) make their own natives.
+    """
+
     @abstractproperty
     def name(self) -> str:
         raise NotImplementedError
+
+    # --- native containers ---
+    @abstractmethod
+    def build_container(
+        self, dims: tuple[Pixels, Pixels]
+    ) -> tuple[NativeContainer, tuple[Pixels, Pixels]]:
+        """
+        :return: a new, empty native container and its size
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def resize_container(
+        self, native: NativeContainer, dims: tuple[Pixels, Pixels]
+    ) -> tuple[Pixels, Pixels]:
+        """
+        Resizes the native container in place, keeping its children.
+        :return: the new size
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def demolish_container(self, native: NativeContainer) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def place_native(
+        self,
+        container: NativeContainer,
+        native: NativeElement,
+        pos: tuple[Pixels, Pixels],
+    ) -> None:
+        """
+        Adds a native container to its superior's native container at the position.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def pickup_native(self, container: NativeContainer, native: NativeElement) -> None:
+        raise NotImplementedError
+
+    def move_native(
+        self,
+        container: NativeContainer,
+        native: NativeElement,
+        pos: tuple[Pixels, Pixels],
+    ) -> None:
+        """
+        Moves a placed native container, the default picks it up and places it again.
+        """
+        self.pickup_native(container, native)
+        self.place_native(container, native, pos)
+
+    # --- batching ---
+    def begin_update(self, container: NativeContainer) -> None:
+        """
+        Called before many children are placed in or picked up from a native container,
+        so the platform can hold off re-drawing until `end_update`. Calls may be nested.
+        """
+        pass
+
+    def end_update(self, container: NativeContainer) -> None:
+        """
+        Undoes `begin_update`, the container is then re-drawn once.
+        """
+        pass
+
+    # --- redraw ---
+    def damage(
+        self, abs_pos: tuple[Pixels, Pixels], dims: tuple[Pixels, Pixels]
+    ) -> None:
+        """
+        Called with the screen area of a widget that was placed, picked up, moved or
+        changed (see `Widget.damage`). Platforms that refresh partially track these.
+        """
+        pass
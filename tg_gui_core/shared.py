@@ -49,7 +49,7 @@ class UID(IsinstanceBase):
         )
 
     @classmethod
-    def check_if_isinstance(cls, __instance) -> bool:
+    def _inst_isinstance_check_(cls, __instance) -> bool:
         return isinstance(__instance, int) and __instance >= 0
 
 
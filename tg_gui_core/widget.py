@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     # from typing_extensions import _Self
     from tg_gui.platform.shared import Platform, NativeElement, NativeContainer
     from .container import ContainerWidget
+    from .attrs import _WidgetInitPlan
 
 
 # ---
@@ -17,10 +18,79 @@ if TYPE_CHECKING:
 from abc import ABC, abstractmethod
 
 from .shared import UID, Pixels, add_pixel_pair as _add_pixel_pair
-from .attrs import WidgetAttr, widget, _widget_init_attrs as _widget_init_attrs
+from .attrs import (
+    WidgetAttr,
+    ReadOnlyAttr,
+    ReadWriteAttr,
+    widget,
+    _widget_init_attrs as _widget_init_attrs,
+)
 from .implementation_support import Missing, isoncircuitpython
 
 
+class _AbsPosAttr(ReadWriteAttr):
+    """
+    `Widget.abs_pos`, resolved lazily from the superior chain when read.
+    Each widget stores a `[abs_pos, version, superior_version]` record:
+    - a pinned record (assigned directly, ex a root widget) has no superior version
+    - a following record is recomputed when its superior's version is not the one it
+      was computed from, which gives it a new version in turn
+    Moving a container only marks its own record stale (O(1)), descendants recompute
+    when read. Reading walks up the superiors (O(depth)) but never down the subtree.
+    """
+
+    # a following record that was never resolved, or whose widget moved
+    _STALE = -1
+
+    _next_version: ClassVar[int] = 0
+
+    # typed by WidgetAttr.__get__'s overloads
+    if not TYPE_CHECKING:
+
+        def __get__(self, widget, ownertype):
+            if widget is None:
+                return self
+            return self._resolve(widget)[0]
+
+    def set_attr(self, widget: Widget, value: Any = Missing) -> None:
+        self.__set__(widget, value)
+
+    def __set__(self, widget: Widget, value: Any = Missing) -> None:
+        # pins the absolute position, assigning Missing clears it
+        if value is Missing:
+            setattr(widget, self.private_name, Missing)
+        else:
+            setattr(widget, self.private_name, [value, self._new_version(), None])
+
+    def follow(self, widget: Widget) -> None:
+        """
+        Derives the widget's abs_pos from its superior's and `.pos`, on the next read.
+        """
+        record = getattr(widget, self.private_name, Missing)
+        if record is Missing or record[2] is None:
+            setattr(widget, self.private_name, [None, self._STALE, self._STALE])
+        else:
+            record[2] = self._STALE
+
+    def _resolve(self, widget: Widget) -> list[Any]:
+        record = getattr(widget, self.private_name, Missing)
+        if record is Missing:
+            raise self._missing_error(widget)
+        if record[2] is None:
+            return record
+        superior = self._resolve(widget.superior)
+        if record[2] != superior[1]:
+            record[0] = _add_pixel_pair(superior[0], widget.pos)
+            record[1] = self._new_version()
+            record[2] = superior[1]
+        return record
+
+    @classmethod
+    def _new_version(cls) -> int:
+        cls._next_version = version = cls._next_version + 1
+        return version
+
+
 ## subclasses require the @widget decorator
 @widget
 class Widget(ABC):
@@ -30,17 +100,24 @@ class Widget(ABC):
     __is_widget_class__: ClassVar[Literal[True]] = True
     __widget_class_id__: ClassVar[UID]
     __widget_attrs__: ClassVar[dict[str, WidgetAttr[Any]]]
+    __widget_init_plan__: ClassVar[_WidgetInitPlan]
+
+    # no instance __dict__ here so `@widget(slots=True)` subclasses can drop it
+    __slots__ = ()
 
-    id: UID = WidgetAttr(init=False, default_factory=UID)
+    id: UID = ReadOnlyAttr(init=False, default_factory=UID)
+    # tells siblings of the same class apart when a View body is reconciled
+    key: object = ReadOnlyAttr(None, init=True)
 
-    superior: ContainerWidget = WidgetAttr(init=False)
-    platform: Platform = WidgetAttr(init=False)
-    native: NativeElement = WidgetAttr(init=False)
+    superior: ContainerWidget = ReadWriteAttr(init=False)
+    platform: Platform = ReadWriteAttr(init=False)
+    native: NativeElement = ReadWriteAttr(init=False)
 
-    dims: tuple[Pixels, Pixels] = WidgetAttr(init=False)
+    dims: tuple[Pixels, Pixels] = ReadWriteAttr(init=False)
 
-    pos: tuple[Pixels, Pixels] = WidgetAttr(init=False)
-    abs_pos: tuple[Pixels, Pixels] = WidgetAttr(init=False)
+    pos: tuple[Pixels, Pixels] = ReadWriteAttr(init=False)
+    # derived from the superior chain when read, see _AbsPosAttr
+    abs_pos: tuple[Pixels, Pixels] = _AbsPosAttr(init=False)
 
     # alias __init__ to make the type-checker happy
     locals()["__init__"] = _widget_init_attrs
@@ -64,8 +141,9 @@ class Widget(ABC):
         """
         internal method to nest a widget in a container widget.
         """
-        self._superior_ = superior
-        self._platform_ = platform
+        self.superior = superior
+        self.platform = platform
+        self._restore_attrs()
         self.on_nest()
 
     def unnest_from(self, superior: ContainerWidget, platform: Platform) -> None:
@@ -73,18 +151,20 @@ class Widget(ABC):
         internal method to unnest a widget from a container widget.
         """
         assert (
-            self._superior_ is superior
-        ), f"{self} nested in {self._superior_}, cannot unnest from {superior}"
-        assert self._platform_ is platform
+            self.superior is superior
+        ), f"{self} nested in {self.superior}, cannot unnest from {superior}"
+        assert self.platform is platform
         self.on_unnest()
-        # clear the .superior and .platform attributes using a hidden WidgetAttr method
-        # self.superior = Missing  # type: ignore[assignment]
+        self._release_attrs()
+        # clear the .superior and .platform attributes, assigning Missing clears a ReadWriteAttr
+        self.superior = Missing  # type: ignore[assignment]
         self.platform = Missing  # type: ignore[assignment]
 
     def build(self, suggestion: tuple[Pixels, Pixels]) -> None:
         """
         Called when the widget is created.
         """
+        self._restore_attrs()
         self.native, self.dims = self._build_(suggestion)
 
     def demolish(self) -> None:
@@ -94,6 +174,7 @@ class Widget(ABC):
         native = self.native
         self.native = Missing  # clear the superior and platform attributes using a hidden WidgetAttr method
         self._demolish_(native)
+        self._release_attrs()
 
     def place(self, pos: tuple[Pixels, Pixels]) -> None:
         """
@@ -103,31 +184,78 @@ class Widget(ABC):
         the widget's superior
         """
         self.pos = pos
-        self.abs_pos = abs_pos = _add_pixel_pair(self.superior.abs_pos, pos)
-        self._place_(self.superior.native, (self.native), self.pos, abs_pos)
+        Widget.abs_pos.follow(self)
+        self._place_(self.superior.native, self.native, pos, self.abs_pos)
+        self.damage()
 
     def pickup(self) -> None:
         """
         Called when removing the widget from a container.
         """
+        self.damage()
         self._pickup_(self.superior.native, self.native)
+        self.pos = Missing  # type: ignore[assignment]
+        self.abs_pos = Missing  # type: ignore[assignment]
 
     def rebuild(self, suggestion: tuple[Pixels, Pixels]) -> None:
         """
-        Rebuilds the widget.
+        Rebuilds the widget, a placed widget stays placed.
         """
-        self.native, self.dims = self._rebuild_(self.native, suggestion)
+        native = self.native
+        placed = Widget.pos.has_attr(self)
+        if placed:
+            self.damage()
+        if type(self)._rebuild_ is not Widget._rebuild_:
+            # overrides of _rebuild_ are responsible for keeping their element placed
+            self.native, self.dims = self._rebuild_(native, suggestion)
+        else:
+            # the default replaces the native element, pick up the old one first
+            if placed:
+                self._pickup_(self.superior.native, native)
+            self._demolish_(native)
+            self.build(suggestion)
+            if placed:
+                self._place_(self.superior.native, self.native, self.pos, self.abs_pos)
+        if placed:
+            self.damage()
+
+    def damage(self) -> None:
+        """
+        Reports the placed widget's current screen area to the platform for redraw,
+        call after changing how a widget looks without rebuilding it.
+        """
+        # widgets in a picked up superior are off screen, its pickup damaged their area
+        if Widget.pos.has_attr(self) and Widget.abs_pos.has_attr(self.superior):
+            self.platform.damage(self.abs_pos, self.dims)
+
+    def request_resize(self) -> None:
+        """
+        Call when the widget's content changed in a way that can change its size (ex new text).
+        The widget is rebuilt with its last suggestion and the size change only walks up
+        the superiors as far as one whose dims do not change, see `ContainerWidget`.
+        """
+        if Widget.superior.has_attr(self):
+            self.superior._mark_dirty(self)
 
     def move(self, pos: tuple[Pixels, Pixels]) -> None:
         """
-        Moves the widget by the given amount.
+        Moves the widget to a new position in its container.
         """
-        self._move_(
-            self.superior.native,
-            self.native,
-            pos,
-            _add_pixel_pair(self.superior.abs_pos, pos),
-        )
+        self.damage()
+        self.pos = pos
+        # descendants re-resolve their abs_pos when read, they are not walked here
+        Widget.abs_pos.follow(self)
+        self._move_(self.superior.native, self.native, pos, self.abs_pos)
+        self.damage()
+
+    def _release_attrs(self) -> None:
+        # let attrs drop what they hold for this widget, ex: state subscriptions
+        for attr in self.__widget_init_plan__.releasing:
+            attr.del_attr(self)
+
+    def _restore_attrs(self) -> None:
+        for attr in self.__widget_init_plan__.releasing:
+            attr.restore_attr(self)
 
     # ---- internal methods required by the a platform to suppy support ----
 
@@ -246,7 +374,4 @@ class Widget(ABC):
                     "other class initialization error occurred (maybe __init_subclass__? etc)"
                 )
 
-            if cls.__init__ is Widget.__init__ and len(args):
-                raise TypeError(f"{cls} does not accept positional arguments")
-
             return object.__new__(cls)